@@ -0,0 +1,151 @@
+"""Cost of one CNPJ-vs-CEP address comparison: precompiled tables vs. a straightforward version.
+
+The straightforward version is what the comparison looked like before the tables existed:
+``unicodedata`` decomposition of every value, regular expressions for punctuation and
+abbreviations, and ``difflib.SequenceMatcher`` for the token-set ratio. Both versions run over the
+same synthetic pairs, built from real street, district and city names written the way the CNPJ and
+CEP providers write them (abbreviated, upper-case, without accents, or in a different token order).
+
+    python -m benchmarks.address_matching --pairs 20000 --distinct 500
+"""
+
+import argparse
+import random
+import re
+import time
+import unicodedata
+from difflib import SequenceMatcher
+
+from src.application.address_normalization import (
+    ABBREVIATIONS,
+    COMPARED_FIELDS,
+    EXACT_FIELDS,
+    PARTICLES,
+    compare_address_batch,
+    compare_addresses,
+)
+from src.domain.entities import AddressEntity
+
+STREETS = [
+    ("Avenida", "Paulista"),
+    ("Rua", "Doutor Arnaldo"),
+    ("Alameda", "Santos"),
+    ("Praça", "da Sé"),
+    ("Rua", "General Osório"),
+    ("Avenida", "Presidente Juscelino Kubitschek"),
+    ("Travessa", "Nossa Senhora da Conceição"),
+    ("Estrada", "do M'Boi Mirim"),
+    ("Rua", "Professor João de Araújo"),
+    ("Avenida", "Marechal Deodoro da Fonseca"),
+]
+DISTRICTS = ["Bela Vista", "Jardim Paulista", "Vila Mariana", "Sé", "Santa Cecília", "Parque São Lucas"]
+CITIES = [("São Paulo", "SP"), ("Rio de Janeiro", "RJ"), ("Belo Horizonte", "MG"), ("Florianópolis", "SC")]
+_SHORT_FORMS = {expansion: abbreviation for abbreviation, expansion in ABBREVIATIONS.items()}
+
+
+def _fold(value: str) -> str:
+    return "".join(char for char in unicodedata.normalize("NFKD", value) if not unicodedata.combining(char))
+
+
+def _as_registered(words: str, rng: random.Random) -> str:
+    """The same value as a CNPJ registry writes it: upper-case, no accents, some words abbreviated."""
+    out = []
+    for word in words.split():
+        short = _SHORT_FORMS.get(_fold(word).lower())
+        out.append(f"{short}." if short and rng.random() < 0.7 else word)
+    return _fold(" ".join(out)).upper()
+
+
+def synthetic_pairs(count: int, distinct: int, seed: int = 7) -> list[tuple[AddressEntity, AddressEntity]]:
+    rng = random.Random(seed)
+    templates = []
+    for index in range(distinct):
+        street_type, street_name = rng.choice(STREETS)
+        city, state = rng.choice(CITIES)
+        cep_address = AddressEntity(
+            cep=f"{rng.randrange(10**8):08d}",
+            street=f"{street_type} {street_name}",
+            district=rng.choice(DISTRICTS),
+            city=city,
+            state=state,
+        )
+        company_address = AddressEntity(
+            cep=cep_address.cep,
+            street=_as_registered(cep_address.street, rng),
+            district=_as_registered(cep_address.district, rng),
+            city=_as_registered(cep_address.city, rng),
+            state=state,
+        )
+        if index % 5 == 0:
+            # Every fifth pair really is a different address.
+            company_address.street = _as_registered(" ".join(rng.choice(STREETS)), rng)
+        templates.append((company_address, cep_address))
+    return [templates[index % distinct] for index in range(count)]
+
+
+_PUNCTUATION = r"[^\w\s]"
+_SPACES = r"\s+"
+
+
+def naive_tokens(value: str) -> list[str]:
+    text = _fold(value).lower()
+    text = re.sub(_PUNCTUATION, " ", text)
+    text = re.sub(_SPACES, " ", text).strip()
+    for abbreviation, expansion in ABBREVIATIONS.items():
+        text = re.sub(rf"\b{abbreviation}\b", expansion, text)
+    return [token for token in text.split() if token not in PARTICLES]
+
+
+def naive_token_set_ratio(left: list[str], right: list[str]) -> float:
+    left_set, right_set = set(left), set(right)
+    common = " ".join(sorted(left_set & right_set))
+    left_text = f"{common} {' '.join(sorted(left_set - right_set))}".strip()
+    right_text = f"{common} {' '.join(sorted(right_set - left_set))}".strip()
+    candidates = [(left_text, right_text)] + ([(common, left_text), (common, right_text)] if common else [])
+    return max(SequenceMatcher(None, a, b).ratio() for a, b in candidates)
+
+
+def naive_compare(left: AddressEntity, right: AddressEntity, min_similarity: float = 0.85) -> list[str]:
+    mismatched = []
+    for name in COMPARED_FIELDS:
+        left_tokens, right_tokens = naive_tokens(getattr(left, name)), naive_tokens(getattr(right, name))
+        if not left_tokens or not right_tokens:
+            continue
+        if name in EXACT_FIELDS:
+            score = 1.0 if left_tokens == right_tokens else 0.0
+        else:
+            score = naive_token_set_ratio(left_tokens, right_tokens)
+        if score < min_similarity:
+            mismatched.append(name)
+    return mismatched
+
+
+def _microseconds_per_pair(run, pairs: int) -> float:
+    started = time.perf_counter()
+    run()
+    return (time.perf_counter() - started) / pairs * 1_000_000
+
+
+def main(args: argparse.Namespace) -> None:
+    pairs = synthetic_pairs(args.pairs, args.distinct)
+    naive_sample = pairs[: min(len(pairs), args.naive_pairs)]
+    mismatches = [naive_compare(left, right) for left, right in naive_sample]
+    assert mismatches == [compare_addresses(left, right).mismatched_fields for left, right in naive_sample]
+
+    naive = _microseconds_per_pair(
+        lambda: [naive_compare(left, right) for left, right in naive_sample], len(naive_sample)
+    )
+    single = _microseconds_per_pair(lambda: [compare_addresses(left, right) for left, right in pairs], len(pairs))
+    batch = _microseconds_per_pair(lambda: compare_address_batch(pairs), len(pairs))
+    print(f"pairs={args.pairs} distinct={args.distinct} (naive run on {len(naive_sample)})")
+    print(f"regex + difflib           : {naive:8.1f} us/comparison")
+    print(f"precompiled, one at a time: {single:8.1f} us/comparison ({naive / single:.1f}x)")
+    print(f"precompiled, batch        : {batch:8.1f} us/comparison ({naive / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=20_000)
+    parser.add_argument("--distinct", type=int, default=500)
+    parser.add_argument("--naive-pairs", type=int, default=2_000)
+    main(parser.parse_args())
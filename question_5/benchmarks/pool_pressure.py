@@ -0,0 +1,103 @@
+"""Create-flow throughput with the pooled connection held across hashing vs. released first.
+
+Each simulated request runs a read round trip, hashes a password on the hashing pool and then
+runs a write round trip inside ``SqlAlchemyUnitOfWork.transaction()``. ``--db-latency-ms`` adds a
+``pg_sleep`` to every round trip to emulate network/database latency. On hosts with few cores the
+argon2 pool itself is the bottleneck; ``--simulated-hash-ms`` swaps the real hash for a sleep so
+the effect of connection hold time can be observed in isolation.
+
+    python -m benchmarks.pool_pressure --pool-size 4 --concurrency 64 --requests 300 --db-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.application.security import hash_password_async, shutdown_hashing_executor, start_hashing_executor
+from src.infrastructure.config import get_settings
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+ROUND_TRIP = text("SELECT pg_sleep(:seconds)")
+
+
+async def _hash(simulated_hash_ms: float | None) -> None:
+    if simulated_hash_ms is None:
+        await hash_password_async("Benchmark123!")
+    else:
+        await asyncio.sleep(simulated_hash_ms / 1000)
+
+
+async def _create_flow(
+    session_factory: async_sessionmaker[AsyncSession],
+    latency: float,
+    *,
+    release_before_hash: bool,
+    simulated_hash_ms: float | None = None,
+) -> None:
+    async with session_factory() as session:
+        unit_of_work = SqlAlchemyUnitOfWork(session)
+        await session.execute(ROUND_TRIP, {"seconds": latency})
+        if release_before_hash:
+            await unit_of_work.release()
+        await _hash(simulated_hash_ms)
+        async with unit_of_work.transaction():
+            await session.execute(ROUND_TRIP, {"seconds": latency})
+
+
+async def _run(args: argparse.Namespace, *, release_before_hash: bool) -> float:
+    engine = create_async_engine(
+        get_settings().async_database_url,
+        pool_size=args.pool_size,
+        max_overflow=0,
+        pool_timeout=300,
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latency = args.db_latency_ms / 1000
+
+    async def _one() -> None:
+        async with semaphore:
+            await _create_flow(
+                session_factory,
+                latency,
+                release_before_hash=release_before_hash,
+                simulated_hash_ms=args.simulated_hash_ms,
+            )
+
+    try:
+        await _create_flow(session_factory, 0, release_before_hash=True)
+        started = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+    return args.requests / elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    start_hashing_executor(args.hashing_workers)
+    try:
+        held = await _run(args, release_before_hash=False)
+        released = await _run(args, release_before_hash=True)
+    finally:
+        shutdown_hashing_executor()
+    print(
+        f"pool_size={args.pool_size} concurrency={args.concurrency} "
+        f"db_latency_ms={args.db_latency_ms} simulated_hash_ms={args.simulated_hash_ms}"
+    )
+    print(f"connection held across hash : {held:8.1f} req/s")
+    print(f"connection released for hash: {released:8.1f} req/s ({released / held:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--hashing-workers", type=int, default=None)
+    parser.add_argument("--simulated-hash-ms", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,209 @@
+"""Brazilian address normalization and fuzzy matching.
+
+Everything that can be precomputed is built once at import: the ``str.translate`` table that
+lower-cases, folds accents and turns punctuation into spaces, and the abbreviation table. A value
+is then normalized with one ``translate``, one ``split`` and one dict lookup per token, with no
+regular expressions and no per-character Unicode decomposition. Similarity is the token-set ratio
+over those tokens, with an indel-distance ratio computed by a bit-parallel LCS.
+"""
+
+import unicodedata
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from src.domain.entities import AddressEntity
+
+EXACT_FIELDS = ("cep", "state")
+FUZZY_FIELDS = ("city", "district", "street")
+COMPARED_FIELDS = (*EXACT_FIELDS, *FUZZY_FIELDS)
+
+ABBREVIATIONS = {
+    "al": "alameda",
+    "ap": "apartamento",
+    "apto": "apartamento",
+    "av": "avenida",
+    "avda": "avenida",
+    "bc": "beco",
+    "bl": "bloco",
+    "cel": "coronel",
+    "cj": "conjunto",
+    "com": "comendador",
+    "cond": "condominio",
+    "conj": "conjunto",
+    "dep": "deputado",
+    "des": "desembargador",
+    "dr": "doutor",
+    "dra": "doutora",
+    "eng": "engenheiro",
+    "est": "estrada",
+    "estr": "estrada",
+    "gal": "general",
+    "gen": "general",
+    "gov": "governador",
+    "jd": "jardim",
+    "jard": "jardim",
+    "lg": "largo",
+    "lgo": "largo",
+    "lt": "lote",
+    "mal": "marechal",
+    "min": "ministro",
+    "ns": "nossa senhora",
+    "nsa": "nossa senhora",
+    "pca": "praca",
+    "pc": "praca",
+    "pq": "parque",
+    "pres": "presidente",
+    "prof": "professor",
+    "profa": "professora",
+    "qd": "quadra",
+    "r": "rua",
+    "res": "residencial",
+    "rod": "rodovia",
+    "sen": "senador",
+    "sn": "sem numero",
+    "sta": "santa",
+    "sto": "santo",
+    "ten": "tenente",
+    "trav": "travessa",
+    "tv": "travessa",
+    "vl": "vila",
+}
+# Connectives that addresses drop or keep at will: "Rua Dr. João de Barros" is "R DR JOAO BARROS".
+PARTICLES = frozenset({"da", "das", "de", "do", "dos"})
+
+
+def _build_fold_table() -> dict[int, str]:
+    table = {}
+    # Latin-1, Latin Extended-A/B and general punctuation cover what Brazilian addresses contain.
+    for code in (*range(0x250), *range(0x2000, 0x2070)):
+        char = chr(code)
+        decomposed = unicodedata.normalize("NFKD", char.casefold())
+        folded = "".join(part for part in decomposed if not unicodedata.combining(part))
+        if not (folded.isascii() and folded.isalnum()):
+            folded = " "
+        if folded != char:
+            table[code] = folded
+    return table
+
+
+FOLD_TABLE = _build_fold_table()
+# Each token maps straight to the tokens it stands for: expansions are pre-split, particles vanish.
+_TOKEN_EXPANSIONS: dict[str, tuple[str, ...]] = {
+    **{particle: () for particle in PARTICLES},
+    **{abbreviation: tuple(expansion.split()) for abbreviation, expansion in ABBREVIATIONS.items()},
+}
+
+
+def address_tokens(value: str) -> tuple[str, ...]:
+    """``"Av. Dr. Arnaldo, nº 455"`` -> ``("avenida", "doutor", "arnaldo", "no", "455")``."""
+    expansions = _TOKEN_EXPANSIONS
+    tokens: list[str] = []
+    for token in value.translate(FOLD_TABLE).split():
+        expansion = expansions.get(token)
+        if expansion is None:
+            tokens.append(token)
+        else:
+            tokens.extend(expansion)
+    return tuple(tokens)
+
+
+def normalize_address_text(value: str) -> str:
+    return " ".join(address_tokens(value))
+
+
+def token_set_ratio(left: Sequence[str], right: Sequence[str]) -> float:
+    """Similarity in [0, 1] of two token sequences, insensitive to token order and repetition.
+
+    The shared tokens are compared with each side's full token set, so a value whose tokens are
+    all contained in the other scores 1.0 ("paulista" against "avenida paulista").
+    """
+    left_set, right_set = set(left), set(right)
+    if not left_set or not right_set:
+        return 1.0 if left_set == right_set else 0.0
+    common = " ".join(sorted(left_set & right_set))
+    left_only = " ".join(sorted(left_set - right_set))
+    right_only = " ".join(sorted(right_set - left_set))
+    if not common:
+        return indel_ratio(left_only, right_only)
+    left_text = f"{common} {left_only}" if left_only else common
+    right_text = f"{common} {right_only}" if right_only else common
+    return max(indel_ratio(common, left_text), indel_ratio(common, right_text), indel_ratio(left_text, right_text))
+
+
+def indel_ratio(left: str, right: str) -> float:
+    """``1 - indel_distance / (len(left) + len(right))``: 1.0 for equal strings, 0.0 for disjoint ones."""
+    total = len(left) + len(right)
+    if not total:
+        return 1.0
+    return 2 * _lcs_length(left, right) / total
+
+
+def _lcs_length(left: str, right: str) -> int:
+    # Bit-parallel LCS (Allison-Dix/Hyyrö): one bit per character of ``left``, a few integer
+    # operations per character of ``right``, instead of a len(left) x len(right) table.
+    masks: dict[str, int] = {}
+    bit = 1
+    for char in left:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    full = bit - 1
+    row = full
+    for char in right:
+        matches = masks.get(char)
+        if matches is not None:
+            kept = row & matches
+            row = ((row + kept) | (row - kept)) & full
+    return len(left) - row.bit_count()
+
+
+@dataclass(frozen=True, slots=True)
+class AddressComparison:
+    scores: dict[str, float]
+    mismatched_fields: list[str]
+
+    @property
+    def matches(self) -> bool:
+        return not self.mismatched_fields
+
+
+def compare_addresses(
+    left: AddressEntity,
+    right: AddressEntity,
+    *,
+    min_similarity: float = 0.85,
+    tokenize: Callable[[str], tuple[str, ...]] = address_tokens,
+) -> AddressComparison:
+    """Scores each field present on both sides; CEP and state must be equal, the rest similar enough.
+
+    A field empty on either side is skipped: CEPs that cover a whole town carry no street or district.
+    """
+    scores: dict[str, float] = {}
+    mismatched: list[str] = []
+    for name in COMPARED_FIELDS:
+        left_tokens = tokenize(getattr(left, name))
+        right_tokens = tokenize(getattr(right, name))
+        if not left_tokens or not right_tokens:
+            continue
+        if name in EXACT_FIELDS:
+            score = 1.0 if left_tokens == right_tokens else 0.0
+        else:
+            score = token_set_ratio(left_tokens, right_tokens)
+        scores[name] = score
+        if score < min_similarity:
+            mismatched.append(name)
+    return AddressComparison(scores=scores, mismatched_fields=mismatched)
+
+
+def compare_address_batch(
+    pairs: Iterable[tuple[AddressEntity, AddressEntity]], *, min_similarity: float = 0.85
+) -> list[AddressComparison]:
+    """``compare_addresses`` over many pairs, tokenizing each distinct value only once per batch."""
+    cache: dict[str, tuple[str, ...]] = {}
+
+    def tokenize(value: str) -> tuple[str, ...]:
+        tokens = cache.get(value)
+        if tokens is None:
+            tokens = cache[value] = address_tokens(value)
+        return tokens
+
+    return [compare_addresses(left, right, min_similarity=min_similarity, tokenize=tokenize) for left, right in pairs]
@@ -48,6 +48,28 @@ class ConflictError(RFC7807Exception):
         super().__init__(status_code=409, title="Resource conflict", detail=detail, kind=kind, extra=extra)
 
 
+class ServiceOverloadedError(RFC7807Exception):
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(
+            status_code=503,
+            title="Service overloaded",
+            detail="The service is at capacity; retry the request later",
+            kind="service-overloaded",
+            extra={"retry_after": retry_after_seconds},
+        )
+
+
+class StaleCursorError(RFC7807Exception):
+    def __init__(self, cursor: int) -> None:
+        super().__init__(
+            status_code=400,
+            title="Stale cursor",
+            detail=f"Cursor '{cursor}' points at a user that no longer exists; restart from the first page",
+            kind="stale-cursor",
+            extra={"cursor": cursor},
+        )
+
+
 class RoleNotFoundError(NotFoundError):
     def __init__(self, role_id: Any) -> None:
         super().__init__(
@@ -64,3 +86,43 @@ class EmailAlreadyExistsError(ConflictError):
             kind="email-already-exists",
             extra={"email": email},
         )
+
+
+class IdempotencyKeyReusedError(RFC7807Exception):
+    def __init__(self, key: str) -> None:
+        super().__init__(
+            status_code=422,
+            title="Idempotency key reused",
+            detail=f"Idempotency key '{key}' was already used for a different request",
+            kind="idempotency-key-reused",
+            extra={"idempotency_key": key},
+        )
+
+
+class CompanyNotFoundError(NotFoundError):
+    def __init__(self, cnpj: str) -> None:
+        super().__init__(
+            detail=f"CNPJ '{cnpj}' was not found",
+            kind="cnpj-not-found",
+            extra={"cnpj": cnpj},
+        )
+
+
+class CepNotFoundError(NotFoundError):
+    def __init__(self, cep: str) -> None:
+        super().__init__(
+            detail=f"CEP '{cep}' was not found",
+            kind="cep-not-found",
+            extra={"cep": cep},
+        )
+
+
+class ProviderUnavailableError(RFC7807Exception):
+    def __init__(self, provider: str, reason: str) -> None:
+        super().__init__(
+            status_code=503,
+            title="Provider unavailable",
+            detail=f"The {provider} lookup could not be completed: {reason}",
+            kind="provider-unavailable",
+            extra={"provider": provider, "reason": reason},
+        )
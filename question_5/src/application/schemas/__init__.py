@@ -1,3 +1,27 @@
-from .user import UserCreateInput, UserOutput
+from .address import AddressOutput, AddressValidationInput, AddressValidationOutput
+from .report import UserReport, UserReportQuery, UserReportRow
+from .user import (
+    UserBatchCreateInput,
+    UserBatchItemResult,
+    UserBatchOutput,
+    UserCreateInput,
+    UserListQuery,
+    UserOutput,
+    UserPage,
+)
 
-__all__ = ["UserCreateInput", "UserOutput"]
+__all__ = [
+    "AddressOutput",
+    "AddressValidationInput",
+    "AddressValidationOutput",
+    "UserBatchCreateInput",
+    "UserBatchItemResult",
+    "UserBatchOutput",
+    "UserCreateInput",
+    "UserListQuery",
+    "UserOutput",
+    "UserPage",
+    "UserReport",
+    "UserReportQuery",
+    "UserReportRow",
+]
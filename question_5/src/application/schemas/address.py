@@ -0,0 +1,69 @@
+import re
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+_NON_DIGITS = re.compile(r"\D")
+
+AddressField = Literal["cep", "state", "city", "district", "street"]
+
+
+def _digits(value: str) -> str:
+    return _NON_DIGITS.sub("", value)
+
+
+def _cnpj_check_digit(digits: str) -> str:
+    # Weights 5..2 then 9..2 for the first check digit, 6..2 then 9..2 for the second.
+    weights = (*range(len(digits) - 7, 1, -1), *range(9, 1, -1))
+    remainder = sum(int(digit) * weight for digit, weight in zip(digits, weights)) % 11
+    return "0" if remainder < 2 else str(11 - remainder)
+
+
+def is_valid_cnpj(cnpj: str) -> bool:
+    if len(cnpj) != 14 or not cnpj.isdigit() or len(set(cnpj)) == 1:
+        return False
+    first = _cnpj_check_digit(cnpj[:12])
+    return cnpj[12:] == first + _cnpj_check_digit(cnpj[:12] + first)
+
+
+class AddressValidationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    cnpj: str
+    cep: str
+
+    @field_validator("cnpj")
+    @classmethod
+    def _validate_cnpj(cls, value: str) -> str:
+        cnpj = _digits(value)
+        if not is_valid_cnpj(cnpj):
+            raise ValueError("cnpj must have 14 digits with valid check digits")
+        return cnpj
+
+    @field_validator("cep")
+    @classmethod
+    def _validate_cep(cls, value: str) -> str:
+        cep = _digits(value)
+        if len(cep) != 8:
+            raise ValueError("cep must have 8 digits")
+        return cep
+
+
+class AddressOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    cep: str
+    street: str
+    district: str
+    city: str
+    state: str
+
+
+class AddressValidationOutput(BaseModel):
+    cnpj: str
+    cep: str
+    matches: bool
+    mismatched_fields: list[AddressField]
+    similarity: dict[AddressField, float]
+    company_address: AddressOutput
+    cep_address: AddressOutput
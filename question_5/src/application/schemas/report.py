@@ -0,0 +1,32 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, PositiveInt, model_validator
+
+
+class UserReportQuery(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    created_from: Optional[date] = None
+    created_to: Optional[date] = None
+    role_id: Optional[PositiveInt] = None
+
+    @model_validator(mode="after")
+    def _validate_created_range(self) -> "UserReportQuery":
+        if self.created_from and self.created_to and self.created_from > self.created_to:
+            raise ValueError("created_from must not be after created_to")
+        return self
+
+
+class UserReportRow(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    day: date
+    role_id: int
+    users: int
+    cumulative_users: int
+
+
+class UserReport(BaseModel):
+    items: list[UserReportRow]
+    total_users: int
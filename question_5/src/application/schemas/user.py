@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, PositiveInt, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, PositiveInt, field_validator, model_validator
 
 
 class UserCreateInput(BaseModel):
@@ -29,3 +29,43 @@ class UserOutput(BaseModel):
     role_id: PositiveInt
     created_at: date
     updated_at: Optional[date]
+
+
+class UserBatchCreateInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    users: list[UserCreateInput] = Field(min_length=1, max_length=1000)
+
+
+class UserBatchItemResult(BaseModel):
+    index: int
+    status: Literal["created", "role-not-found", "email-already-exists"]
+    user: Optional[UserOutput] = None
+    problem: Optional[dict[str, Any]] = None
+
+
+class UserBatchOutput(BaseModel):
+    created: int
+    failed: int
+    results: list[UserBatchItemResult]
+
+
+class UserListQuery(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    cursor: Optional[PositiveInt] = Field(default=None, description="`next_cursor` of the previous page")
+    limit: int = Field(default=50, ge=1, le=500)
+    role_id: Optional[PositiveInt] = None
+    created_from: Optional[date] = None
+    created_to: Optional[date] = None
+
+    @model_validator(mode="after")
+    def _validate_created_range(self) -> "UserListQuery":
+        if self.created_from and self.created_to and self.created_from > self.created_to:
+            raise ValueError("created_from must not be after created_to")
+        return self
+
+
+class UserPage(BaseModel):
+    items: list[UserOutput]
+    next_cursor: Optional[int] = None
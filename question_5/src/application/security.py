@@ -1,18 +1,51 @@
+import asyncio
+import os
 import secrets
 import string
+from concurrent.futures import ProcessPoolExecutor
 from typing import Final
 
 from pwdlib import PasswordHash
 
+MAX_PASSWORD_LENGTH: Final[int] = 512
+
+_pwd_hasher = PasswordHash.recommended()
+_hashing_executor: ProcessPoolExecutor | None = None
+_hashing_workers = 1
+
 
 def hash_password(password: str) -> str:
-    pwd_hasher = PasswordHash.recommended()
-    MAX_PASSWORD_LENGTH: Final[int] = 512
     if not password:
         raise ValueError("Password cannot be empty.")
     if len(password) > MAX_PASSWORD_LENGTH:
         password = password[:MAX_PASSWORD_LENGTH]
-    return pwd_hasher.hash(password)
+    return _pwd_hasher.hash(password)
+
+
+def start_hashing_executor(max_workers: int | None = None) -> ProcessPoolExecutor:
+    global _hashing_executor, _hashing_workers
+    if _hashing_executor is None:
+        _hashing_workers = max_workers or os.cpu_count() or 1
+        _hashing_executor = ProcessPoolExecutor(max_workers=_hashing_workers)
+    return _hashing_executor
+
+
+def hashing_capacity() -> int:
+    """Hashes that can run at once: the process pool's size, or 1 without it."""
+    return _hashing_workers if _hashing_executor is not None else 1
+
+
+def shutdown_hashing_executor() -> None:
+    global _hashing_executor
+    if _hashing_executor is not None:
+        _hashing_executor.shutdown(wait=True, cancel_futures=True)
+        _hashing_executor = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash off the event loop; falls back to the loop's default thread pool when no process pool is running."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hashing_executor, hash_password, password)
 
 
 def generate_password(length: int = 16) -> str:
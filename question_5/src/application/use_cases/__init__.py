@@ -1,3 +1,18 @@
 from .create_user import CreateUserUseCase
+from .create_users_batch import CreateUsersBatchUseCase
+from .get_user_report import GetUserReportUseCase
+from .idempotent_create_user import IdempotentCreateUserUseCase, InFlightRequests
+from .ingest_user_events import IngestUserEventsUseCase
+from .list_users import ListUsersUseCase
+from .validate_company_address import ValidateCompanyAddressUseCase
 
-__all__ = ["CreateUserUseCase"]
+__all__ = [
+    "CreateUserUseCase",
+    "CreateUsersBatchUseCase",
+    "GetUserReportUseCase",
+    "IdempotentCreateUserUseCase",
+    "InFlightRequests",
+    "IngestUserEventsUseCase",
+    "ListUsersUseCase",
+    "ValidateCompanyAddressUseCase",
+]
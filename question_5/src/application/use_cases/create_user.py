@@ -1,9 +1,19 @@
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+
 from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError
 from src.application.schemas import UserCreateInput, UserOutput
-from src.application.security import generate_password, hash_password
+from src.application.security import generate_password, hash_password_async
 from src.domain import UnitOfWorkPort
 from src.domain.repositories import RoleRepositoryPort, UserRepositoryPort
 
+StageObserver = Callable[[str, float], None]
+CreatedCallback = Callable[[UserOutput], Awaitable[None]]
+
+
+def _ignore_stage(stage: str, seconds: float) -> None:
+    return None
+
 
 class CreateUserUseCase:
     def __init__(
@@ -11,26 +21,49 @@ class CreateUserUseCase:
         user_repository: UserRepositoryPort,
         role_repository: RoleRepositoryPort,
         unit_of_work: UnitOfWorkPort,
+        observe_stage: StageObserver = _ignore_stage,
     ) -> None:
         self.user_repository = user_repository
         self.role_repository = role_repository
         self.unit_of_work = unit_of_work
+        self.observe_stage = observe_stage
 
-    async def create_user(self, payload: UserCreateInput) -> UserOutput:
+    async def create_user(self, payload: UserCreateInput, *, on_created: CreatedCallback | None = None) -> UserOutput:
+        """Create the user; ``on_created`` runs inside the same transaction, right after the insert."""
+        started = perf_counter()
+        # Served from the role cache: rejects unknown roles before paying for the hash.
+        # create_unique still validates the role, so a stale cache can never let a bad row in.
         role = await self.role_repository.get_by_id(payload.role_id)
+        started = self._lap("role_lookup", started)
         if role is None:
             raise RoleNotFoundError(payload.role_id)
 
-        if await self.user_repository.exists_by_email(payload.email):
+        # Answered by the email Bloom filter for new emails; only possible duplicates reach the database.
+        email_taken = await self.user_repository.exists_by_email(payload.email)
+        await self.unit_of_work.release()
+        started = self._lap("email_check", started)
+        if email_taken:
             raise EmailAlreadyExistsError(payload.email)
 
+        password = await hash_password_async(payload.password or generate_password())
+        started = self._lap("hash", started)
+
         async with self.unit_of_work.transaction():
-            user = await self.user_repository.create(
+            user = await self.user_repository.create_unique(
                 name=payload.name,
                 email=payload.email,
-                password=hash_password(payload.password or generate_password()),
-                role_id=role.id,
+                password=password,
+                role_id=payload.role_id,
             )
-            await self.user_repository.refresh(user)
+            output = UserOutput.model_validate(user)
+            if on_created is not None:
+                await on_created(output)
+            started = self._lap("insert", started)
+        self._lap("commit", started)
+
+        return output
 
-        return UserOutput.model_validate(user)
+    def _lap(self, stage: str, started: float) -> float:
+        now = perf_counter()
+        self.observe_stage(stage, now - started)
+        return now
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import date
+
+from src.application.exceptions import EmailAlreadyExistsError, RFC7807Exception, RoleNotFoundError
+from src.application.schemas import UserBatchCreateInput, UserBatchItemResult, UserBatchOutput, UserOutput
+from src.application.security import generate_password, hash_password_async
+from src.domain import UnitOfWorkPort
+from src.domain.entities import UserEntity
+from src.domain.repositories import RoleRepositoryPort, UserRepositoryPort
+
+
+class CreateUsersBatchUseCase:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        role_repository: RoleRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+    ) -> None:
+        self.user_repository = user_repository
+        self.role_repository = role_repository
+        self.unit_of_work = unit_of_work
+
+    async def create_users(self, payload: UserBatchCreateInput) -> UserBatchOutput:
+        items = payload.users
+        known_role_ids = await self.role_repository.get_existing_ids({item.role_id for item in items})
+        taken_emails = await self.user_repository.get_existing_emails({item.email for item in items})
+        await self.unit_of_work.release()
+
+        errors: dict[int, RFC7807Exception] = {}
+        pending: list[int] = []
+        for index, item in enumerate(items):
+            if item.role_id not in known_role_ids:
+                errors[index] = RoleNotFoundError(item.role_id)
+            elif item.email in taken_emails:
+                errors[index] = EmailAlreadyExistsError(item.email)
+            else:
+                taken_emails.add(item.email)
+                pending.append(index)
+
+        passwords = await asyncio.gather(
+            *(hash_password_async(items[index].password or generate_password()) for index in pending)
+        )
+        today = date.today()
+        async with self.unit_of_work.transaction():
+            created = await self.user_repository.create_many(
+                [
+                    UserEntity(
+                        id=None,
+                        name=items[index].name,
+                        email=items[index].email,
+                        password=password,
+                        role_id=items[index].role_id,
+                        created_at=today,
+                        updated_at=None,
+                    )
+                    for index, password in zip(pending, passwords)
+                ]
+            )
+
+        created_by_email = {user.email: user for user in created}
+        results: list[UserBatchItemResult] = []
+        for index, item in enumerate(items):
+            user = created_by_email.get(item.email) if index not in errors else None
+            if user is not None:
+                results.append(
+                    UserBatchItemResult(index=index, status="created", user=UserOutput.model_validate(user))
+                )
+                continue
+            error = errors.get(index) or EmailAlreadyExistsError(item.email)
+            results.append(UserBatchItemResult(index=index, status=error.kind, problem=error.to_dict()))
+
+        return UserBatchOutput(created=len(created), failed=len(items) - len(created), results=results)
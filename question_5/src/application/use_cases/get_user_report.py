@@ -0,0 +1,15 @@
+from src.application.schemas import UserReport, UserReportQuery, UserReportRow
+from src.domain.repositories import UserReportRepositoryPort
+
+
+class GetUserReportUseCase:
+    def __init__(self, report_repository: UserReportRepositoryPort) -> None:
+        self.report_repository = report_repository
+
+    async def get_report(self, query: UserReportQuery) -> UserReport:
+        # Reads the daily rollup only: the cost grows with days x roles, never with the users table.
+        rows = await self.report_repository.daily_counts(
+            created_from=query.created_from, created_to=query.created_to, role_id=query.role_id
+        )
+        items = [UserReportRow.model_validate(row) for row in rows]
+        return UserReport(items=items, total_users=sum(item.users for item in items))
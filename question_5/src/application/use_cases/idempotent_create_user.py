@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+import json
+
+from src.application.exceptions import EmailAlreadyExistsError, IdempotencyKeyReusedError
+from src.application.schemas import UserCreateInput, UserOutput
+from src.application.use_cases.create_user import CreateUserUseCase
+from src.domain.entities import IdempotencyRecord
+from src.domain.repositories import IdempotencyRepositoryPort
+
+
+class InFlightRequests:
+    """Per-process map from idempotency key to a future that completes when its current owner finishes."""
+
+    def __init__(self) -> None:
+        self._running: dict[str, asyncio.Future[None]] = {}
+
+    async def wait_and_claim(self, key: str) -> asyncio.Future[None]:
+        while (running := self._running.get(key)) is not None:
+            # Shielded: a waiter that gets cancelled must not cancel the owner's future for everyone else.
+            await asyncio.shield(running)
+        claimed = self._running[key] = asyncio.get_running_loop().create_future()
+        return claimed
+
+    def release(self, key: str, claimed: asyncio.Future[None]) -> None:
+        del self._running[key]
+        claimed.set_result(None)
+
+
+def request_fingerprint(payload: UserCreateInput) -> str:
+    # The password is left out, so the table never holds anything derived from it.
+    canonical = json.dumps(payload.model_dump(mode="json", exclude={"password"}), sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class IdempotentCreateUserUseCase:
+    """Runs ``CreateUserUseCase`` at most once per ``Idempotency-Key``.
+
+    The 201 body is stored in the transaction that inserts the user, so a retry gets it back
+    without hashing or inserting again. Duplicates in the same process wait on an in-process future.
+    Duplicates racing from other processes block on the key's row (or the email's) until the first
+    transaction ends, then replay its stored response.
+
+    That needs the insert to commit in the caller's transaction. When ``create_user_use_case`` does
+    not (a write coalescer commits on its own connection), keyed creates go through
+    ``keyed_create_user_use_case`` instead, so a rejected key never leaves a committed user behind.
+    """
+
+    def __init__(
+        self,
+        create_user_use_case: CreateUserUseCase,
+        idempotency_repository: IdempotencyRepositoryPort,
+        in_flight: InFlightRequests,
+        *,
+        ttl_seconds: float = 86_400.0,
+        keyed_create_user_use_case: CreateUserUseCase | None = None,
+    ) -> None:
+        self.create_user_use_case = create_user_use_case
+        self.keyed_create_user_use_case = keyed_create_user_use_case or create_user_use_case
+        self.idempotency_repository = idempotency_repository
+        self.in_flight = in_flight
+        self.ttl_seconds = ttl_seconds
+
+    async def create_user(self, payload: UserCreateInput, idempotency_key: str | None = None) -> UserOutput:
+        if idempotency_key is None:
+            return await self.create_user_use_case.create_user(payload)
+        fingerprint = request_fingerprint(payload)
+        claimed = await self.in_flight.wait_and_claim(idempotency_key)
+        try:
+            return await self._create_once(payload, idempotency_key, fingerprint)
+        finally:
+            self.in_flight.release(idempotency_key, claimed)
+
+    async def _create_once(self, payload: UserCreateInput, key: str, fingerprint: str) -> UserOutput:
+        stored = await self.idempotency_repository.get(key)
+        if stored is not None:
+            return _replay(stored, key, fingerprint)
+
+        async def save_response(output: UserOutput) -> None:
+            saved = await self.idempotency_repository.save(
+                key,
+                fingerprint=fingerprint,
+                status_code=201,
+                response=output.model_dump(mode="json"),
+                ttl_seconds=self.ttl_seconds,
+            )
+            if not saved:
+                raise _KeyTaken
+
+        try:
+            return await self.keyed_create_user_use_case.create_user(payload, on_created=save_response)
+        except (_KeyTaken, EmailAlreadyExistsError):
+            # Another process committed this key first: its user holds the email, or its record holds the key.
+            stored = await self.idempotency_repository.get(key)
+            if stored is None:
+                raise
+            return _replay(stored, key, fingerprint)
+
+
+class _KeyTaken(Exception):
+    pass
+
+
+def _replay(stored: IdempotencyRecord, key: str, fingerprint: str) -> UserOutput:
+    if stored.fingerprint != fingerprint:
+        raise IdempotencyKeyReusedError(key)
+    return UserOutput.model_validate(stored.response)
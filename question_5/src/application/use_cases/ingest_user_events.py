@@ -0,0 +1,28 @@
+from collections.abc import Sequence
+from datetime import date
+
+from src.domain.entities import USER_CREATED_TOPIC, OutboxMessage
+from src.domain.repositories import UserReportRepositoryPort
+
+
+class IngestUserEventsUseCase:
+    """Folds ``user.created`` events into the reporting rollup.
+
+    Runs in the caller's transaction: the outbox relay calls it inside the transaction that claims
+    and deletes the batch, so the increment commits or rolls back with the delivery. Events may still
+    arrive more than once (a concurrent relay, a redelivery after a lost commit); the repository skips
+    event ids it has already counted, in the same statement as the increment.
+    """
+
+    def __init__(self, report_repository: UserReportRepositoryPort) -> None:
+        self.report_repository = report_repository
+
+    async def ingest(self, messages: Sequence[OutboxMessage]) -> int:
+        events = [
+            (message.id, date.fromisoformat(message.payload["created_at"]), int(message.payload["role_id"]))
+            for message in messages
+            if message.topic == USER_CREATED_TOPIC
+        ]
+        if not events:
+            return 0
+        return await self.report_repository.count_created_users(events)
@@ -0,0 +1,20 @@
+from src.application.schemas import UserListQuery, UserOutput, UserPage
+from src.domain.repositories import UserRepositoryPort
+
+
+class ListUsersUseCase:
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        self.user_repository = user_repository
+
+    async def list_users(self, query: UserListQuery) -> UserPage:
+        # One extra row tells whether another page exists without a COUNT(*).
+        rows = await self.user_repository.list_page(
+            after_id=query.cursor,
+            limit=query.limit + 1,
+            role_id=query.role_id,
+            created_from=query.created_from,
+            created_to=query.created_to,
+        )
+        items = [UserOutput.model_validate(row) for row in rows[: query.limit]]
+        next_cursor = items[-1].id if len(rows) > query.limit else None
+        return UserPage(items=items, next_cursor=next_cursor)
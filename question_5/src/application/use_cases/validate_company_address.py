@@ -0,0 +1,44 @@
+import asyncio
+
+from src.application.address_normalization import compare_addresses
+from src.application.exceptions import CepNotFoundError, CompanyNotFoundError
+from src.application.schemas import AddressOutput, AddressValidationInput, AddressValidationOutput
+from src.domain import CepProviderPort, CnpjProviderPort
+
+
+class ValidateCompanyAddressUseCase:
+    """Checks whether the address registered for a CNPJ is the address of a CEP."""
+
+    def __init__(
+        self, cnpj_provider: CnpjProviderPort, cep_provider: CepProviderPort, *, min_similarity: float = 0.85
+    ) -> None:
+        self.cnpj_provider = cnpj_provider
+        self.cep_provider = cep_provider
+        self.min_similarity = min_similarity
+
+    async def validate(self, payload: AddressValidationInput) -> AddressValidationOutput:
+        # Both lookups run at once, so the response takes as long as the slower one, not their sum.
+        # Neither is abandoned when the other fails: the response waits for both either way.
+        company_address, cep_address = await asyncio.gather(
+            self.cnpj_provider.get_company_address(payload.cnpj),
+            self.cep_provider.get_address(payload.cep),
+            return_exceptions=True,
+        )
+        for result in (company_address, cep_address):
+            if isinstance(result, BaseException):
+                raise result
+        if company_address is None:
+            raise CompanyNotFoundError(payload.cnpj)
+        if cep_address is None:
+            raise CepNotFoundError(payload.cep)
+
+        comparison = compare_addresses(company_address, cep_address, min_similarity=self.min_similarity)
+        return AddressValidationOutput(
+            cnpj=payload.cnpj,
+            cep=payload.cep,
+            matches=comparison.matches,
+            mismatched_fields=comparison.mismatched_fields,
+            similarity=comparison.scores,
+            company_address=AddressOutput.model_validate(company_address),
+            cep_address=AddressOutput.model_validate(cep_address),
+        )
@@ -1,3 +1,5 @@
+from .address_providers import CepProviderPort, CnpjProviderPort
+from .message_broker import MessageBrokerPort
 from .unit_of_work import UnitOfWorkPort
 
-__all__ = ["UnitOfWorkPort"]
+__all__ = ["CepProviderPort", "CnpjProviderPort", "MessageBrokerPort", "UnitOfWorkPort"]
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import AddressEntity
+
+
+class CnpjProviderPort(ABC):
+    @abstractmethod
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        """Return the address registered for ``cnpj`` (14 digits), or ``None`` if the CNPJ is unknown."""
+
+
+class CepProviderPort(ABC):
+    @abstractmethod
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        """Return the address of ``cep`` (8 digits), or ``None`` if the CEP does not exist."""
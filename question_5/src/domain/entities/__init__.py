@@ -1,4 +1,17 @@
+from .address import AddressEntity, CachedCepEntity
+from .idempotency_record import IdempotencyRecord
+from .outbox_message import USER_CREATED_TOPIC, OutboxMessage
 from .role import RoleEntity
 from .user import UserEntity
+from .user_daily_count import UserDailyCountEntity
 
-__all__ = ["UserEntity", "RoleEntity"]
+__all__ = [
+    "AddressEntity",
+    "CachedCepEntity",
+    "IdempotencyRecord",
+    "OutboxMessage",
+    "USER_CREATED_TOPIC",
+    "UserDailyCountEntity",
+    "UserEntity",
+    "RoleEntity",
+]
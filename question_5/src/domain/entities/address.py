@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class AddressEntity:
+    cep: str
+    street: str
+    district: str
+    city: str
+    state: str
+
+
+@dataclass(slots=True)
+class CachedCepEntity:
+    cep: str
+    address: AddressEntity | None
+    fetched_at: datetime
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True)
+class IdempotencyRecord:
+    key: str
+    fingerprint: str
+    status_code: int
+    response: dict[str, Any]
+    created_at: datetime
+    expires_at: datetime
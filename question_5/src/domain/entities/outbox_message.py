@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+USER_CREATED_TOPIC = "user.created"
+
+
+@dataclass(slots=True)
+class OutboxMessage:
+    id: int
+    topic: str
+    key: str
+    payload: dict[str, Any]
+    created_at: datetime
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(slots=True)
+class UserDailyCountEntity:
+    day: date
+    role_id: int
+    users: int
+    cumulative_users: int
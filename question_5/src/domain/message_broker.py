@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.entities import OutboxMessage
+
+
+class MessageBrokerPort(ABC):
+    @abstractmethod
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        """Publish ``messages`` in order; return only once the broker has accepted all of them."""
@@ -1,5 +1,17 @@
+from .cep_cache_repository_port import CepCacheRepositoryPort
+from .idempotency_repository_port import IdempotencyRepositoryPort
+from .outbox_repository_port import OutboxRepositoryPort
 from .repository_port import RepositoryPort
 from .role_repository_port import RoleRepositoryPort
+from .user_report_repository_port import UserReportRepositoryPort
 from .user_repository_port import UserRepositoryPort
 
-__all__ = ["RepositoryPort", "RoleRepositoryPort", "UserRepositoryPort"]
+__all__ = [
+    "CepCacheRepositoryPort",
+    "IdempotencyRepositoryPort",
+    "OutboxRepositoryPort",
+    "RepositoryPort",
+    "RoleRepositoryPort",
+    "UserReportRepositoryPort",
+    "UserRepositoryPort",
+]
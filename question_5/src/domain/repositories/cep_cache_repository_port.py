@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import CachedCepEntity
+
+
+class CepCacheRepositoryPort(ABC):
+    @abstractmethod
+    async def get(self, cep: str) -> CachedCepEntity | None:
+        """Return the last stored lookup of ``cep``, however old; ``address`` is ``None`` for an unknown CEP."""
+
+    @abstractmethod
+    async def put(self, entry: CachedCepEntity) -> None:
+        """Store ``entry`` unless a lookup fetched later is already stored."""
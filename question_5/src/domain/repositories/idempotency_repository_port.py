@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.domain.entities import IdempotencyRecord
+
+
+class IdempotencyRepositoryPort(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        """Return the unexpired record stored under ``key``."""
+
+    @abstractmethod
+    async def save(
+        self, key: str, *, fingerprint: str, status_code: int, response: dict[str, Any], ttl_seconds: float
+    ) -> bool:
+        """Store a response in the current transaction; ``False`` if an unexpired record already holds ``key``."""
+
+    @abstractmethod
+    async def purge_expired(self, limit: int) -> int:
+        """Delete up to ``limit`` expired records; return how many were deleted."""
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import OutboxMessage
+
+
+class OutboxRepositoryPort(ABC):
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        """Remove and return up to ``limit`` of the oldest messages not locked by another transaction.
+
+        The removal only sticks if the current transaction commits; a rollback puts them back.
+        """
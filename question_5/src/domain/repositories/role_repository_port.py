@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.domain.entities import RoleEntity
 
@@ -7,3 +8,7 @@ class RoleRepositoryPort(ABC):
     @abstractmethod
     async def get_by_id(self, role_id: int) -> RoleEntity | None:
         """Retrieve a role by id."""
+
+    @abstractmethod
+    async def get_existing_ids(self, role_ids: Collection[int]) -> set[int]:
+        """Return the subset of ``role_ids`` that exist."""
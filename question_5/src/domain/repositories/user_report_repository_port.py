@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import date
+
+from src.domain.entities import UserDailyCountEntity
+
+
+class UserReportRepositoryPort(ABC):
+    @abstractmethod
+    async def count_created_users(self, events: Sequence[tuple[int, date, int]]) -> int:
+        """Add ``(event_id, day, role_id)`` events to the daily rollup, skipping event ids already counted.
+
+        Returns how many events were new.
+        """
+
+    @abstractmethod
+    async def purge_processed_events(self, older_than_seconds: float, limit: int) -> int:
+        """Delete up to ``limit`` counted event ids older than ``older_than_seconds``; return how many.
+
+        Ids whose event is still in the outbox are kept, since the relay may deliver it again.
+        """
+
+    @abstractmethod
+    async def daily_counts(
+        self,
+        *,
+        created_from: date | None = None,
+        created_to: date | None = None,
+        role_id: int | None = None,
+    ) -> list[UserDailyCountEntity]:
+        """Return the rollup rows in ``(day, role_id)`` order, each with its role's running total."""
@@ -1,4 +1,7 @@
 from abc import abstractmethod
+from collections.abc import Collection, Mapping, Sequence
+from datetime import date
+from typing import Any
 
 from src.domain.entities import UserEntity
 from src.domain.repositories.repository_port import RepositoryPort
@@ -9,6 +12,10 @@ class UserRepositoryPort(RepositoryPort[UserEntity]):
     async def exists_by_email(self, email: str) -> bool:
         """Check if email is already in use."""
 
+    @abstractmethod
+    async def get_existing_emails(self, emails: Collection[str]) -> set[str]:
+        """Return the subset of ``emails`` that are already in use."""
+
     @abstractmethod
     async def create(
         self,
@@ -19,3 +26,38 @@ class UserRepositoryPort(RepositoryPort[UserEntity]):
         role_id: int,
     ) -> UserEntity:
         """Create a new user record."""
+
+    @abstractmethod
+    async def create_unique(
+        self,
+        *,
+        name: str,
+        email: str,
+        password: str,
+        role_id: int,
+    ) -> UserEntity:
+        """Validate the role and insert a user in a single statement.
+
+        Raises ``RoleNotFoundError`` when the role does not exist and
+        ``EmailAlreadyExistsError`` when the email is already registered.
+        """
+
+    @abstractmethod
+    async def create_many(self, users: Sequence[UserEntity]) -> list[UserEntity]:
+        """Insert many users in one statement, returning only the rows that did not hit an email conflict."""
+
+    @abstractmethod
+    async def list_page(
+        self,
+        *,
+        after_id: int | None,
+        limit: int,
+        role_id: int | None = None,
+        created_from: date | None = None,
+        created_to: date | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Return up to ``limit`` users after the one with id ``after_id``, without password hashes.
+
+        Users are in id order, or in (``created_at``, id) order when a date filter is given; that order
+        needs the ``after_id`` user itself, so a cursor whose user was deleted raises ``StaleCursorError``.
+        """
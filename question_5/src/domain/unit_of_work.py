@@ -6,3 +6,7 @@ class UnitOfWorkPort(ABC):
     @abstractmethod
     def transaction(self) -> AbstractAsyncContextManager[None]:
         """Provide a transaction boundary for application use cases."""
+
+    @abstractmethod
+    async def release(self) -> None:
+        """End any implicit read-only transaction so its connection goes back to the pool."""
@@ -0,0 +1,26 @@
+"""Offline CEP dataset import: ``python -m src.import_ceps ceps.csv /data/ceps.bin``.
+
+Compiles a CSV dump of CEPs into the binary file ``CEP_DATASET_PATH`` points at. Workers map the
+file when they start; rerunning the import replaces the file atomically, and workers pick up the new
+one when they restart.
+"""
+
+import argparse
+import os
+
+from src.infrastructure.providers.cep_dataset import compile_cep_dataset, read_cep_csv
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile a CSV dump of CEPs into the offline CEP dataset.")
+    parser.add_argument("csv_path", help="columns cep, street, district, city, state (or ViaCEP's names)")
+    parser.add_argument("output_path")
+    parser.add_argument("--delimiter", default=",")
+    args = parser.parse_args(argv)
+    ceps, strings = compile_cep_dataset(read_cep_csv(args.csv_path, args.delimiter), args.output_path)
+    size = os.path.getsize(args.output_path)
+    print(f"{ceps} CEPs, {strings} distinct strings, {size / 2**20:.1f} MiB written to {args.output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from functools import lru_cache
+from typing import Literal
 
-from pydantic import computed_field
+from pydantic import computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +16,89 @@ class Settings(BaseSettings):
     DATABASE_PASS: str
     DATABASE_SCHEMA: str
 
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_MAX_CONNECTIONS: int = 80
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    DATABASE_WARM_UP_CONNECTIONS: int = 5
+    WEB_WORKERS: int | None = None
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 2.0
+
+    LOG_LEVEL: str = "INFO"
+    LOG_INFO_SAMPLE_RATE: float = 1.0
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+    LOG_QUEUE_MAX_RECORDS: int = 10_000
+
+    SLOW_QUERY_THRESHOLD_MS: float | None = 200.0
+    SLOW_QUERY_EXPLAIN: bool = False
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.001
+    PROFILING_SECRET: str | None = None
+    PROFILING_DIRECTORY: str = "/tmp/shipay-profiles"
+    PROFILING_MAX_PROFILES: int = 200
+    PROFILING_INTERVAL_MS: float = 2.0
+
+    HASHING_WORKERS: int | None = None
+    ROLE_CACHE_TTL_SECONDS: float = 300.0
+    EMAIL_BLOOM_FILTER_ENABLED: bool = True
+    EMAIL_BLOOM_FILTER_CAPACITY: int = 50_000_000
+    EMAIL_BLOOM_FILTER_FALSE_POSITIVE_RATE: float = 0.01
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_LATENCY_TARGET_MS: float = 500.0
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 100.0
+    ADMISSION_MAX_QUEUED: int = 100
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    IDEMPOTENCY_TTL_SECONDS: float = 86_400.0
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: float = 60.0
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 1_000
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_BROKER: Literal["memory", "file"] = "file"
+    OUTBOX_FILE_PATH: str | None = None
+    OUTBOX_FILE_MAX_BYTES: int = 100 * 1024 * 1024
+    OUTBOX_FILE_BACKUPS: int = 5
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 5.0
+    REPORTING_CONSUMER_ENABLED: bool = True
+    REPORT_PROCESSED_EVENTS_RETENTION_SECONDS: float = 604_800.0
+    REPORT_PROCESSED_EVENTS_PURGE_INTERVAL_SECONDS: float = 3_600.0
+    REPORT_PROCESSED_EVENTS_PURGE_BATCH_SIZE: int = 1_000
+    USER_WRITE_COALESCING_ENABLED: bool = False
+    USER_WRITE_COALESCING_MAX_BATCH: int = 100
+    USER_WRITE_COALESCING_MAX_DELAY_MS: float = 2.0
+
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    CNPJ_PROVIDER_URL: str = "https://brasilapi.com.br/api/cnpj/v1"
+    CNPJ_PROVIDER_TIMEOUT_SECONDS: float = 3.0
+    CNPJ_BACKUP_PROVIDER_URL: str = "https://receitaws.com.br/v1/cnpj"
+    CNPJ_BACKUP_PROVIDER_TIMEOUT_SECONDS: float = 3.0
+    CNPJ_HEDGING_ENABLED: bool = True
+    CNPJ_HEDGE_BUDGET_RATIO: float = 0.1
+    CNPJ_HEDGE_MIN_DELAY_MS: float = 50.0
+    CNPJ_HEDGE_MAX_DELAY_MS: float = 1000.0
+    CEP_PROVIDER_URL: str = "https://viacep.com.br/ws"
+    CEP_PROVIDER_TIMEOUT_SECONDS: float = 1.5
+    PROVIDER_DEADLINE_SECONDS: float = 5.0
+    PROVIDER_RETRY_ATTEMPTS: int = 3
+    PROVIDER_RETRY_BASE_DELAY_MS: float = 100.0
+    PROVIDER_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    PROVIDER_CIRCUIT_RESET_SECONDS: float = 30.0
+    ADDRESS_MATCH_MIN_SIMILARITY: float = 0.85
+    CEP_CACHE_ENABLED: bool = True
+    CEP_CACHE_MAX_ENTRIES: int = 100_000
+    CEP_CACHE_TTL_SECONDS: float = 2_592_000.0
+    CEP_CACHE_NEGATIVE_TTL_SECONDS: float = 86_400.0
+    CEP_DATASET_PATH: str | None = None
+
+    @model_validator(mode="after")
+    def require_outbox_file_path(self) -> "Settings":
+        # No default: a path under /tmp would not survive a container restart.
+        if self.OUTBOX_RELAY_ENABLED and self.OUTBOX_BROKER == "file" and not self.OUTBOX_FILE_PATH:
+            raise ValueError("OUTBOX_FILE_PATH must point at a persistent volume when OUTBOX_BROKER is 'file'")
+        return self
+
     @computed_field(return_type=str)
     def async_database_url(self) -> str:
         return (
@@ -22,6 +106,13 @@ class Settings(BaseSettings):
             f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_SCHEMA}"
         )
 
+    @computed_field(return_type=str)
+    def asyncpg_dsn(self) -> str:
+        return (
+            f"postgresql://{self.DATABASE_USER}:{self.DATABASE_PASS}"
+            f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_SCHEMA}"
+        )
+
     @computed_field(return_type=str)
     def sync_database_url(self) -> str:
         return (
@@ -0,0 +1,141 @@
+"""Off-loop log output.
+
+Log calls render their line with orjson and append the bytes to a bounded in-memory queue. That
+costs a few microseconds and never waits on I/O. A daemon thread drains the queue and writes
+whole batches straight to the file descriptor with ``os.write``. When the queue is full (the
+reader of stdout has stalled, say), new lines are dropped and counted instead of blocking the
+request that emitted them.
+"""
+
+import logging
+import os
+import random
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import structlog
+
+Processor = Callable[[Any, str, dict[str, Any]], Any]
+
+_SAMPLED_LEVELS = frozenset({"debug", "info"})
+
+
+class LogWriter:
+    def __init__(self, fd: int = 1, *, max_queued: int = 10_000, max_batch_bytes: int = 256 * 1024) -> None:
+        self.fd = fd
+        self.max_queued = max_queued
+        self.max_batch_bytes = max_batch_bytes
+        self.dropped = 0
+        self.written = 0
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        # In a forked child the parent's writer thread does not exist and its queue is not ours to write.
+        self._queue: deque[bytes] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def write(self, line: bytes) -> None:
+        if len(self._queue) >= self.max_queued:
+            self.dropped += 1
+            return
+        self._queue.append(line)
+        if self._thread is None:
+            self._start()
+        self._wakeup.set()
+
+    # structlog hands the rendered line to the method named after the level.
+    msg = debug = info = warning = error = critical = exception = write
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._drain()
+
+    def _start(self) -> None:
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        while self._queue:
+            batch: list[bytes] = []
+            size = 0
+            while self._queue and size < self.max_batch_bytes:
+                line = self._queue.popleft()
+                batch.append(line)
+                size += len(line)
+            self._write_all(b"".join(batch), len(batch))
+
+    def _write_all(self, data: bytes, lines: int) -> None:
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(self.fd, view) :]
+        except OSError:
+            self.dropped += lines
+        else:
+            self.written += lines
+
+
+class EventSampler:
+    """structlog processor that keeps only a fraction of debug/info events.
+
+    ``rates`` overrides ``default_rate`` per event name. Warnings and errors are always kept.
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        rates: Mapping[str, float] | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.default_rate = default_rate
+        self.rates = dict(rates or {})
+        self.rng = rng
+        self.sampled_out = 0
+
+    def __call__(self, _: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+        if method_name in _SAMPLED_LEVELS:
+            rate = self.rates.get(event_dict.get("event"), self.default_rate)
+            if rate < 1.0 and self.rng() >= rate:
+                self.sampled_out += 1
+                raise structlog.DropEvent
+        return event_dict
+
+
+class LogWriterHandler(logging.Handler):
+    """Sends stdlib records (uvicorn, SQLAlchemy, httpx) through the same processors and writer."""
+
+    def __init__(self, writer: LogWriter, processors: list[Processor]) -> None:
+        super().__init__()
+        self.writer = writer
+        self.processors = processors
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            method_name = record.levelname.lower()
+            event_dict: Any = {"event": record.getMessage(), "logger": record.name}
+            if record.exc_info:
+                event_dict["exc_info"] = record.exc_info
+            for processor in self.processors:
+                event_dict = processor(None, method_name, event_dict)
+        except structlog.DropEvent:
+            return
+        except Exception:
+            self.handleError(record)
+            return
+        self.writer.write(event_dict)
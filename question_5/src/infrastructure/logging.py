@@ -1,56 +1,58 @@
+import atexit
 import logging
 from typing import Any
 
 import orjson
 import structlog
 
+from src.infrastructure.config import get_settings
+from src.infrastructure.log_writer import EventSampler, LogWriter, LogWriterHandler
+from src.infrastructure.metrics import registry
 
-def _orjson_renderer(_: Any, __: str, event_dict: dict[str, Any]) -> str:
-    return orjson.dumps(event_dict).decode()
+log_writer = LogWriter(max_queued=get_settings().LOG_QUEUE_MAX_RECORDS)
+event_sampler = EventSampler()
+atexit.register(log_writer.close)
+
+
+def _orjson_renderer(_: Any, __: str, event_dict: dict[str, Any]) -> bytes:
+    return orjson.dumps(event_dict, default=str, option=orjson.OPT_APPEND_NEWLINE)
 
 
 def configure_logging() -> None:
-    timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
+    settings = get_settings()
+    level = logging.getLevelNamesMapping()[settings.LOG_LEVEL.upper()]
+    event_sampler.default_rate = settings.LOG_INFO_SAMPLE_RATE
+    event_sampler.rates = dict(settings.LOG_SAMPLE_RATES)
     processors = [
         structlog.contextvars.merge_contextvars,
+        event_sampler,
         structlog.processors.add_log_level,
-        timestamper,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         _orjson_renderer,
     ]
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
-            timestamper,
-            structlog.processors.format_exc_info,
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=lambda *_: log_writer,
         cache_logger_on_first_use=True,
     )
-    formatter = structlog.stdlib.ProcessorFormatter(
-        processor=_orjson_renderer,
-        foreign_pre_chain=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            timestamper,
-        ],
-    )
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
-    root_logger.setLevel(logging.INFO)
-    structlog.configure(
-        processors=processors,
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
+    root_logger.addHandler(LogWriterHandler(log_writer, processors))
+    root_logger.setLevel(level)
+
+    registry.callback(
+        "log_records_dropped_total",
+        "Log lines discarded because the write queue was full or the write failed.",
+        lambda: log_writer.dropped,
+        metric_type="counter",
+    )
+    registry.callback(
+        "log_records_sampled_out_total",
+        "Info and debug events skipped by LOG_INFO_SAMPLE_RATE / LOG_SAMPLE_RATES.",
+        lambda: event_sampler.sampled_out,
+        metric_type="counter",
     )
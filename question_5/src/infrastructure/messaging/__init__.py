@@ -0,0 +1,5 @@
+from .brokers import FileBroker, InMemoryBroker
+from .outbox_relay import OutboxRelay
+from .reporting_consumer import ReportingConsumer
+
+__all__ = ["FileBroker", "InMemoryBroker", "OutboxRelay", "ReportingConsumer"]
@@ -0,0 +1,76 @@
+import asyncio
+import fcntl
+import os
+from collections import deque
+from collections.abc import Sequence
+from pathlib import Path
+
+import orjson
+
+from src.domain import MessageBrokerPort
+from src.domain.entities import OutboxMessage
+
+
+class InMemoryBroker(MessageBrokerPort):
+    """In-process stand-in for a broker; for tests only.
+
+    The relay deletes what it publishes, so anything held here is lost with the process. The last
+    ``max_messages`` messages are kept in ``messages``.
+    """
+
+    def __init__(self, max_messages: int = 10_000) -> None:
+        self.messages: deque[OutboxMessage] = deque(maxlen=max_messages)
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        self.messages.extend(messages)
+
+
+class FileBroker(MessageBrokerPort):
+    """Appends each message as a JSON line to ``path``; one write per batch, off the event loop.
+
+    ``path`` must live on a persistent volume: the relay has already deleted what it wrote there. A
+    batch that would take the file past ``max_bytes`` first rotates it to ``path.1`` (``path.1`` to
+    ``path.2``, and so on), keeping ``backups`` old files, so the broker holds at most about
+    ``(backups + 1) * max_bytes``. Workers share the files; an ``flock`` on ``path.lock`` serialises
+    their appends and rotations.
+    """
+
+    def __init__(self, path: str | Path, *, max_bytes: int = 100 * 1024 * 1024, backups: int = 5) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        lines = b"".join(
+            orjson.dumps(
+                {
+                    "id": message.id,
+                    "topic": message.topic,
+                    "key": message.key,
+                    "payload": message.payload,
+                    "created_at": message.created_at,
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+            for message in messages
+        )
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "ab") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            size = self.path.stat().st_size if self.path.exists() else 0
+            if size and size + len(lines) > self.max_bytes:
+                self._rotate()
+            with self.path.open("ab") as file:
+                file.write(lines)
+
+    def _rotate(self) -> None:
+        if self.backups == 0:
+            self.path.unlink()
+            return
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
@@ -0,0 +1,108 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain import MessageBrokerPort
+from src.domain.entities import OutboxMessage
+from src.infrastructure.persistence.repositories import SqlOutboxRepository
+
+logger = structlog.get_logger(__name__)
+
+OUTBOX_PENDING_CHANNEL = "outbox_pending"
+
+RelayConsumer = Callable[[AsyncSession, Sequence[OutboxMessage]], Awaitable[None]]
+
+
+class OutboxRelay:
+    """Moves outbox rows to the broker in the background, at least once and in id order per relay.
+
+    Each batch is claimed, published and deleted in one transaction: if publishing fails the
+    transaction rolls back and the rows are retried. In-process ``consumers`` get each batch after
+    the broker, whatever the broker is, together with the relay's session: what they write commits
+    with the delete, and a consumer error rolls the whole batch back. The relay drains full batches back to back
+    and otherwise sleeps until an ``outbox_pending`` notification (see Alembic revision 008), or
+    ``poll_interval_seconds`` as a fallback if a notification is missed or the listener is lost.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        broker: MessageBrokerPort,
+        *,
+        consumers: Sequence[RelayConsumer] = (),
+        batch_size: int = 500,
+        poll_interval_seconds: float = 5.0,
+        retry_delay_seconds: float = 1.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.broker = broker
+        self.consumers = list(consumers)
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.relayed = 0
+        self.failures = 0
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._listener: Any = None
+
+    async def start(self, connect: Callable[[], Awaitable[Any]] | None = None) -> None:
+        if connect is not None:
+            self._listener = await connect()
+            await self._listener.add_listener(OUTBOX_PENDING_CHANNEL, self._on_notification)
+            self._listener.add_termination_listener(self._on_listener_terminated)
+        self._stopping.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        # Lets a batch in flight finish; whatever is left stays in the table for the next start.
+        self._stopping.set()
+        self._wakeup.set()
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            await listener.close()
+
+    async def relay_batch(self) -> int:
+        async with self.session_factory() as session, session.begin():
+            messages = await SqlOutboxRepository(session).claim_batch(self.batch_size)
+            if messages:
+                await self.broker.publish(messages)
+                for consume in self.consumers:
+                    await consume(session, messages)
+        self.relayed += len(messages)
+        return len(messages)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            # Cleared before the drain, so a notification that arrives during it triggers another pass.
+            self._wakeup.clear()
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                self.failures += 1
+                logger.warning("outbox_relay.batch_failed", exc_info=True)
+                # Notifications keep coming while the broker is down; only a stop cuts this wait short.
+                await _wait(self._stopping, self.retry_delay_seconds)
+                continue
+            if relayed < self.batch_size:
+                await _wait(self._wakeup, self.poll_interval_seconds)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._wakeup.set()
+
+    def _on_listener_terminated(self, connection: Any) -> None:
+        logger.warning("outbox_relay.listener_lost", fallback="poll", poll_interval_seconds=self.poll_interval_seconds)
+        self._listener = None
+
+
+async def _wait(event: asyncio.Event, timeout: float) -> None:
+    with suppress(TimeoutError):
+        await asyncio.wait_for(event.wait(), timeout)
@@ -0,0 +1,17 @@
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases import IngestUserEventsUseCase
+from src.domain.entities import OutboxMessage
+from src.infrastructure.persistence.repositories import SqlUserReportRepository
+
+
+class ReportingConsumer:
+    """Outbox relay consumer that folds each batch into the reporting rollup in the relay's transaction."""
+
+    def __init__(self) -> None:
+        self.counted = 0
+
+    async def handle(self, session: AsyncSession, messages: Sequence[OutboxMessage]) -> None:
+        self.counted += await IngestUserEventsUseCase(SqlUserReportRepository(session)).ingest(messages)
@@ -0,0 +1,211 @@
+"""In-process Prometheus metrics.
+
+Recording is a dict lookup plus a couple of integer/float additions, with no locks: every writer
+(request middleware, use cases, the asyncio connection pool) runs on the event loop thread, so
+updates can never interleave. Values are turned into the Prometheus text format only on scrape.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+from src.infrastructure.profiling import record_stage
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+Samples = Iterable[tuple[Labels, float]]
+
+
+class Metric:
+    """Base for exported metrics; subclasses yield ``(suffix, label_names, label_values, value)`` from ``samples``."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, names, values, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "", self.label_names, labels, value
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count] and [sum].
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, list[float]] = {}
+        if not self.label_names:
+            self._counts[()] = [0] * (len(self.buckets) + 1)
+            self._sums[()] = [0.0]
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels][0] += value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def samples(self):
+        bucket_names = (*self.label_names, "le")
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, counts in self._counts.items():
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield "_bucket", bucket_names, (*labels, bound), cumulative
+            yield "_sum", self.label_names, labels, self._sums[labels][0]
+            yield "_count", self.label_names, labels, cumulative
+
+
+class CallbackMetric(Metric):
+    """Reads its samples from live state at scrape time, e.g. pool or cache statistics."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        read: Callable[[], Samples],
+        label_names: Sequence[str] = (),
+        metric_type: str = "gauge",
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.metric_type = metric_type
+        self.read = read
+
+    def samples(self):
+        for labels, value in self.read():
+            yield "", self.label_names, labels, value
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        # Re-registering replaces the previous reader, so objects rebuilt at startup stay scrapeable.
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        read: Callable[[], float | Samples],
+        label_names: Sequence[str] = (),
+        metric_type: str = "gauge",
+    ) -> CallbackMetric:
+        if not label_names:
+            read = _single_sample(read)
+        return self.register(CallbackMetric(name, documentation, read, label_names, metric_type))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _single_sample(read: Callable[[], float]) -> Callable[[], Samples]:
+    return lambda: [((), read())]
+
+
+def _format_labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status code.", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route")
+)
+create_user_stage_seconds = registry.histogram(
+    "create_user_stage_seconds", "Time spent in each stage of CreateUserUseCase.", ("stage",)
+)
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled database connection."
+)
+admission_requests_total = registry.counter(
+    "admission_requests_total",
+    "Create requests by admission outcome: admitted at once, admitted after queueing, or shed with a 503.",
+    ("outcome",),
+)
+provider_requests_total = registry.counter(
+    "provider_requests_total",
+    "Third-party lookups by provider and outcome: ok, not_found, failed, rejected or short_circuited.",
+    ("provider", "outcome"),
+)
+provider_retries_total = registry.counter(
+    "provider_retries_total", "Lookup attempts retried after a timeout, connection error, 429 or 5xx.", ("provider",)
+)
+provider_request_duration_seconds = registry.histogram(
+    "provider_request_duration_seconds", "Third-party lookup latency, retries included.", ("provider",)
+)
+
+
+def observe_create_user_stage(stage: str, seconds: float) -> None:
+    create_user_stage_seconds.observe(seconds, stage)
+    record_stage(stage, seconds)
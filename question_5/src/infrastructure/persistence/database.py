@@ -1,30 +1,69 @@
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from src.infrastructure.config import get_settings
+from src.infrastructure.metrics import registry
+from src.infrastructure.persistence.pool import InstrumentedAsyncAdaptedQueuePool, register_pool_metrics
+from src.infrastructure.persistence.routing import EngineRouter, RoutingSession
+from src.infrastructure.persistence.slow_query_log import SlowQueryLog
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.async_database_url,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_recycle=1800,
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    expire_on_commit=False,
-)
+# Bound to the engines by ``init_database()``, which the application lifespan calls on startup.
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False)
+engine: AsyncEngine | None = None
+replica_engines: list[AsyncEngine] = []
 
 Base = SQLModel
 
 
+def _create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=1800,
+        **kwargs,
+    )
+
+
+def init_database() -> AsyncEngine:
+    global engine, replica_engines
+    engine = _create_engine(settings.async_database_url, poolclass=InstrumentedAsyncAdaptedQueuePool)
+    register_pool_metrics(registry, engine.sync_engine.pool)
+    replica_engines = [_create_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+
+    if settings.SLOW_QUERY_THRESHOLD_MS is not None:
+        for logged_engine in (engine, *replica_engines):
+            SlowQueryLog(
+                logged_engine,
+                threshold_seconds=settings.SLOW_QUERY_THRESHOLD_MS / 1000,
+                explain=settings.SLOW_QUERY_EXPLAIN,
+            ).attach()
+
+    if replica_engines:
+        AsyncSessionLocal.configure(
+            bind=None, sync_session_class=RoutingSession, router=EngineRouter(engine, replica_engines)
+        )
+    else:
+        AsyncSessionLocal.configure(bind=engine)
+    return engine
+
+
+async def dispose_database() -> None:
+    global engine, replica_engines
+    for disposed in (engine, *replica_engines):
+        if disposed is not None:
+            await disposed.dispose()
+    engine, replica_engines = None, []
+    AsyncSessionLocal.configure(bind=None)
+
+
 @asynccontextmanager
 async def get_session() -> AsyncIterator[AsyncSession]:
     async with AsyncSessionLocal() as session:
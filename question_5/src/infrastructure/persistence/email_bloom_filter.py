@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import math
+from collections.abc import AsyncIterable, Iterable, Iterator
+
+
+class EmailBloomFilter:
+    """Per-process Bloom filter over registered emails.
+
+    A negative answer from ``might_contain`` is definitive, so ``SqlUserRepository`` can skip the
+    database for it; positives still go to the database. Until ``rebuild`` has streamed every
+    existing email the filter is not ready and answers "maybe" for everything. Sizing follows the
+    usual ``m = -n ln(p) / ln(2)^2`` and ``k = m / n ln(2)``: 50M emails at a 1% false-positive rate
+    fit in ~60 MB.
+
+    ``rebuild`` hashes the stream in chunks on a worker thread, into a fresh bit array, so the event
+    loop keeps serving requests; emails added meanwhile are replayed onto it before it goes live.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.size_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self.ready = False
+        self.items = 0
+        self._added_during_rebuild: list[str] | None = None
+        self.negatives = 0
+        self.positives = 0
+        self.false_positives = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def observed_false_positive_rate(self) -> float:
+        """Share of absent emails the filter failed to rule out (positives the database denied)."""
+        absent = self.negatives + self.false_positives
+        return self.false_positives / absent if absent else 0.0
+
+    @property
+    def expected_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hash_count * self.items / self.size_bits)) ** self.hash_count
+
+    def add(self, email: str) -> None:
+        self._set_bits(self._bits, (email,))
+        self.items += 1
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.append(email)
+
+    def might_contain(self, email: str) -> bool:
+        if not self.ready:
+            return True
+        bits = self._bits
+        for position in self._positions(email):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                self.negatives += 1
+                return False
+        self.positives += 1
+        return True
+
+    def record_false_positives(self, count: int = 1) -> None:
+        if self.ready:
+            self.false_positives += count
+
+    async def rebuild(self, emails: AsyncIterable[str], *, chunk_size: int = 10_000) -> None:
+        self.ready = False
+        # Only the worker thread writes to this array until it replaces ``_bits``.
+        bits = bytearray(len(self._bits))
+        items = 0
+        chunk: list[str] = []
+        self._added_during_rebuild = []
+        try:
+            async for email in emails:
+                chunk.append(email)
+                if len(chunk) == chunk_size:
+                    await asyncio.to_thread(self._set_bits, bits, chunk)
+                    items += len(chunk)
+                    chunk = []
+            await asyncio.to_thread(self._set_bits, bits, chunk)
+            added = self._added_during_rebuild
+        finally:
+            self._added_during_rebuild = None
+        self._set_bits(bits, added)
+        self._bits = bits
+        self.items = items + len(chunk) + len(added)
+        self.ready = True
+
+    def _set_bits(self, bits: bytearray, emails: Iterable[str]) -> None:
+        for email in emails:
+            for position in self._positions(email):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, email: str) -> Iterator[int]:
+        digest = hashlib.blake2b(email.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        size = self.size_bits
+        return ((first + index * second) % size for index in range(self.hash_count))
@@ -1,6 +1,20 @@
+from .cep_address import CepAddress
 from .claim import Claim
+from .idempotency_key import IdempotencyKey
+from .outbox_event import OutboxEvent
 from .role import Role
 from .user import User
 from .user_claim import UserClaim
+from .user_report import ReportProcessedEvent, UserDailyCount
 
-__all__ = ["Role", "Claim", "User", "UserClaim"]
+__all__ = [
+    "Role",
+    "CepAddress",
+    "Claim",
+    "IdempotencyKey",
+    "OutboxEvent",
+    "ReportProcessedEvent",
+    "User",
+    "UserClaim",
+    "UserDailyCount",
+]
@@ -13,7 +13,16 @@ if str(BASE_DIR) not in sys.path:
 
 from src.infrastructure.config import get_settings  # noqa: E402
 from src.infrastructure.persistence.database import Base  # noqa: E402
-from src.infrastructure.persistence.models import claim, role, user, user_claim  # noqa: F401
+from src.infrastructure.persistence.models import (  # noqa: F401
+    cep_address,
+    claim,
+    idempotency_key,
+    outbox_event,
+    role,
+    user,
+    user_claim,
+    user_report,
+)
 
 config = context.config
 
@@ -0,0 +1,36 @@
+"""
+Revision ID: 005
+Revises: 004
+"""
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_roles_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('roles_changed', TG_OP);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER roles_changed_notify
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON roles
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_roles_changed()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS roles_changed_notify ON roles")
+    op.execute("DROP FUNCTION IF EXISTS notify_roles_changed()")
@@ -0,0 +1,23 @@
+"""
+Revision ID: 006
+Revises: 005
+"""
+
+from alembic import op
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_users_role_id_id", "users", ["role_id", "id"], postgresql_concurrently=True)
+        op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_created_at_id", table_name="users", postgresql_concurrently=True)
+        op.drop_index("ix_users_role_id_id", table_name="users", postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""
+Revision ID: 008
+Revises: 007
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
+        sa.Column("topic", sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column("key", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Notifications are delivered on commit, and identical ones in a transaction are merged, so a
+    # batch of inserts wakes the relay once, after its rows are visible.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_outbox_pending() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_pending', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER outbox_pending_notify
+        AFTER INSERT ON outbox
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_outbox_pending()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS outbox_pending_notify ON outbox")
+    op.execute("DROP FUNCTION IF EXISTS notify_outbox_pending()")
+    op.drop_table("outbox")
@@ -0,0 +1,46 @@
+"""
+Revision ID: 009
+Revises: 008
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_daily_counts",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("role_id", sa.Integer(), nullable=False),
+        sa.Column("users", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "role_id"),
+    )
+    op.create_table(
+        "report_processed_events",
+        sa.Column("event_id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("processed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    # Seed the rollup with the users that exist already. Users whose event is still waiting in the
+    # outbox are left out: the consumer counts them when the event arrives.
+    op.execute(
+        """
+        INSERT INTO user_daily_counts (day, role_id, users)
+        SELECT created_at, role_id, count(*)
+        FROM users
+        WHERE NOT EXISTS (
+            SELECT 1 FROM outbox WHERE outbox.topic = 'user.created' AND outbox.key = users.id::text
+        )
+        GROUP BY created_at, role_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("report_processed_events")
+    op.drop_table("user_daily_counts")
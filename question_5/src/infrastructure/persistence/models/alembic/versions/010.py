@@ -0,0 +1,30 @@
+"""
+Revision ID: 010
+Revises: 009
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cep_addresses",
+        sa.Column("cep", sa.String(length=8), nullable=False),
+        sa.Column("found", sa.Boolean(), nullable=False),
+        sa.Column("street", sa.String(length=255), nullable=False),
+        sa.Column("district", sa.String(length=255), nullable=False),
+        sa.Column("city", sa.String(length=255), nullable=False),
+        sa.Column("state", sa.String(length=2), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("cep"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cep_addresses")
@@ -0,0 +1,19 @@
+"""
+Revision ID: 011
+Revises: 010
+"""
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_report_processed_events_processed_at", "report_processed_events", ["processed_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_processed_events_processed_at", table_name="report_processed_events")
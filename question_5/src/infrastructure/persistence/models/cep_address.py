@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+
+class CepAddress(SQLModel, table=True):
+    """Persistent tier of the CEP lookup cache; ``found`` is false for CEPs the provider does not know."""
+
+    __tablename__ = "cep_addresses"
+
+    cep: str = Field(primary_key=True, max_length=8)
+    found: bool
+    street: str = Field(default="", max_length=255)
+    district: str = Field(default="", max_length=255)
+    city: str = Field(default="", max_length=255)
+    state: str = Field(default="", max_length=2)
+    fetched_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
@@ -1,6 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -10,10 +11,14 @@ if TYPE_CHECKING:
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_role_id_id", "role_id", "id"),
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(min_length=1, max_length=255)
-    email: str = Field(min_length=1, max_length=255)
+    email: str = Field(min_length=1, max_length=255, unique=True, index=True)
     password: str = Field(min_length=1, max_length=255)
     role_id: int = Field(foreign_key="roles.id")
     created_at: date = Field(default_factory=date.today)
@@ -0,0 +1,22 @@
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, func
+from sqlmodel import Field, SQLModel
+
+
+class UserDailyCount(SQLModel, table=True):
+    __tablename__ = "user_daily_counts"
+
+    day: date = Field(primary_key=True)
+    role_id: int = Field(primary_key=True)
+    users: int = Field(sa_column=Column(BigInteger, nullable=False))
+
+
+class ReportProcessedEvent(SQLModel, table=True):
+    __tablename__ = "report_processed_events"
+    __table_args__ = (Index("ix_report_processed_events_processed_at", "processed_at"),)
+
+    event_id: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    processed_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
@@ -0,0 +1,23 @@
+from time import perf_counter
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.infrastructure.metrics import MetricsRegistry, db_pool_checkout_wait_seconds
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection (including connects)."""
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait_seconds.observe(perf_counter() - started)
+
+
+def register_pool_metrics(registry: MetricsRegistry, pool: QueuePool) -> None:
+    registry.callback("db_pool_size", "Configured number of persistent pooled connections.", pool.size)
+    registry.callback("db_pool_checked_out", "Connections currently checked out of the pool.", pool.checkedout)
+    # QueuePool counts overflow from -pool_size; only connections beyond pool_size are overflow.
+    registry.callback("db_pool_overflow", "Connections opened beyond pool_size.", lambda: max(pool.overflow(), 0))
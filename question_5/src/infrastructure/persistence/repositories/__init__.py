@@ -1,5 +1,22 @@
 from .base import BaseRepository
+from .cached_role_repository import CachedRoleRepository
+from .coalescing_user_repository import CoalescingUserRepository, UserWriteCoalescer
+from .sql_cep_cache_repository import SqlCepCacheRepository
+from .sql_idempotency_repository import SqlIdempotencyRepository
+from .sql_outbox_repository import SqlOutboxRepository
 from .sql_role_repository import SqlRoleRepository
+from .sql_user_report_repository import SqlUserReportRepository
 from .sql_user_repository import SqlUserRepository
 
-__all__ = ["BaseRepository", "SqlRoleRepository", "SqlUserRepository"]
+__all__ = [
+    "BaseRepository",
+    "CachedRoleRepository",
+    "CoalescingUserRepository",
+    "SqlCepCacheRepository",
+    "SqlIdempotencyRepository",
+    "SqlOutboxRepository",
+    "SqlRoleRepository",
+    "SqlUserReportRepository",
+    "SqlUserRepository",
+    "UserWriteCoalescer",
+]
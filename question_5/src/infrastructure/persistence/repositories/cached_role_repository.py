@@ -0,0 +1,96 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Collection
+from typing import Any
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities import RoleEntity
+from src.domain.repositories import RoleRepositoryPort
+from src.infrastructure.persistence.models import Role
+from src.infrastructure.persistence.routing import use_primary
+
+logger = structlog.get_logger(__name__)
+
+ROLES_CHANGED_CHANNEL = "roles_changed"
+
+
+class CachedRoleRepository(RoleRepositoryPort):
+    """Per-process copy of the ``roles`` table.
+
+    The map is loaded on ``start()``, reloaded once ``ttl_seconds`` have passed and invalidated
+    immediately when Postgres emits a ``roles_changed`` notification (see Alembic revision 005).
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], *, ttl_seconds: float = 300.0) -> None:
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._roles: dict[int, RoleEntity] = {}
+        self._expires_at = 0.0
+        # Bumped by every invalidation, so a load can tell whether one arrived while it ran.
+        self._generation = 0
+        self._refresh_lock = asyncio.Lock()
+        self._listener: Any = None
+
+    async def start(self, connect: Callable[[], Awaitable[Any]] | None = None) -> None:
+        # Listening first: a change committed while the initial load runs still invalidates it.
+        if connect is not None:
+            self._listener = await connect()
+            await self._listener.add_listener(ROLES_CHANGED_CHANNEL, self._on_notification)
+            self._listener.add_termination_listener(self._on_listener_terminated)
+        await self.refresh()
+
+    async def stop(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            await listener.close()
+
+    async def refresh(self) -> None:
+        generation = self._generation
+        async with self.session_factory() as session:
+            # A lagging replica could answer with the roles from before the NOTIFY that triggered this reload.
+            use_primary(session)
+            roles = (await session.scalars(select(Role))).all()
+        self._roles = {role.id: RoleEntity(id=role.id, description=role.description) for role in roles}
+        # A notification during the SELECT may describe a change it did not see: stay expired.
+        if generation == self._generation:
+            self._expires_at = time.monotonic() + self.ttl_seconds
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._expires_at = 0.0
+
+    async def get_by_id(self, role_id: int) -> RoleEntity | None:
+        await self._ensure_fresh()
+        role = self._roles.get(role_id)
+        if role is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return role
+
+    async def get_existing_ids(self, role_ids: Collection[int]) -> set[int]:
+        await self._ensure_fresh()
+        found = {role_id for role_id in role_ids if role_id in self._roles}
+        self.hits += len(found)
+        self.misses += len(role_ids) - len(found)
+        return found
+
+    async def _ensure_fresh(self) -> None:
+        if time.monotonic() < self._expires_at:
+            return
+        async with self._refresh_lock:
+            if time.monotonic() >= self._expires_at:
+                await self.refresh()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.invalidate()
+
+    def _on_listener_terminated(self, connection: Any) -> None:
+        logger.warning("role_cache.listener_lost", fallback="ttl", ttl_seconds=self.ttl_seconds)
+        self._listener = None
+        self.invalidate()
@@ -0,0 +1,163 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError
+from src.domain.entities import UserEntity
+from src.infrastructure.metrics import registry
+from src.infrastructure.persistence.email_bloom_filter import EmailBloomFilter
+from src.infrastructure.persistence.repositories.sql_role_repository import SqlRoleRepository
+from src.infrastructure.persistence.repositories.sql_user_repository import SqlUserRepository
+from src.infrastructure.persistence.routing import record_write, use_primary
+
+logger = structlog.get_logger(__name__)
+
+batch_size_histogram = registry.histogram(
+    "user_write_coalescer_batch_size",
+    "Rows per coalesced user INSERT.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+
+@dataclass
+class _PendingUser:
+    user: UserEntity
+    future: asyncio.Future[UserEntity] = field(repr=False)
+
+
+class UserWriteCoalescer:
+    """Collects concurrent user creates and writes them as one multi-row INSERT per transaction.
+
+    A batch is flushed when ``max_batch_size`` creates are queued or ``max_delay_seconds`` after the
+    first one arrived, whichever comes first. Each caller gets back its own row, or its own
+    ``RoleNotFoundError``/``EmailAlreadyExistsError``. If the batch statement fails as a whole (for
+    example a role deleted mid-flush), rows are retried one by one so one bad row cannot fail the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_batch_size: int = 100,
+        max_delay_seconds: float = 0.002,
+        email_filter: EmailBloomFilter | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_delay_seconds = max_delay_seconds
+        self.email_filter = email_filter
+        self._pending: list[_PendingUser] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def submit(self, user: UserEntity) -> UserEntity:
+        loop = asyncio.get_running_loop()
+        pending = _PendingUser(user, loop.create_future())
+        self._pending.append(pending)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay_seconds, self._flush_pending)
+        return await pending.future
+
+    async def stop(self) -> None:
+        self._flush_pending()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[_PendingUser]) -> None:
+        batch_size_histogram.observe(len(batch))
+        try:
+            await self._write_batch(batch)
+        except Exception:
+            logger.warning("user_write_coalescer.batch_failed", batch_size=len(batch), exc_info=True)
+            for pending in batch:
+                if not pending.future.done():
+                    await self._write_one(pending)
+
+    async def _write_batch(self, batch: list[_PendingUser]) -> None:
+        async with self.session_factory() as session, session.begin():
+            use_primary(session)
+            existing_roles = await SqlRoleRepository(session).get_existing_ids({p.user.role_id for p in batch})
+            accepted: dict[str, _PendingUser] = {}
+            rejected: list[tuple[_PendingUser, Exception]] = []
+            for pending in batch:
+                if pending.user.role_id not in existing_roles:
+                    rejected.append((pending, RoleNotFoundError(pending.user.role_id)))
+                elif pending.user.email in accepted:
+                    rejected.append((pending, EmailAlreadyExistsError(pending.user.email)))
+                else:
+                    accepted[pending.user.email] = pending
+            created = await SqlUserRepository(session, self.email_filter).create_many(
+                [pending.user for pending in accepted.values()]
+            )
+        # Only resolve after the commit, so no caller sees a row that could still roll back.
+        for user in created:
+            _resolve(accepted.pop(user.email), user)
+        for pending in accepted.values():
+            _reject(pending, EmailAlreadyExistsError(pending.user.email))
+        for pending, error in rejected:
+            _reject(pending, error)
+
+    async def _write_one(self, pending: _PendingUser) -> None:
+        user = pending.user
+        try:
+            async with self.session_factory() as session, session.begin():
+                use_primary(session)
+                created = await SqlUserRepository(session, self.email_filter).create_unique(
+                    name=user.name, email=user.email, password=user.password, role_id=user.role_id
+                )
+        except Exception as error:
+            _reject(pending, error)
+        else:
+            _resolve(pending, created)
+
+
+class CoalescingUserRepository(SqlUserRepository):
+    """``SqlUserRepository`` whose single-row creates go through a shared ``UserWriteCoalescer``.
+
+    The coalescer commits on its own connection, so the caller's unit of work has nothing left to commit.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        coalescer: UserWriteCoalescer,
+        email_filter: EmailBloomFilter | None = None,
+    ) -> None:
+        super().__init__(session, email_filter)
+        self.coalescer = coalescer
+
+    async def create(self, *, name: str, email: str, password: str, role_id: int) -> UserEntity:
+        return await self.create_unique(name=name, email=email, password=password, role_id=role_id)
+
+    async def create_unique(self, *, name: str, email: str, password: str, role_id: int) -> UserEntity:
+        user = UserEntity(None, name, email, password, role_id, date.today(), None)
+        created = await self.coalescer.submit(user)
+        record_write()
+        return created
+
+
+def _resolve(pending: _PendingUser, user: UserEntity) -> None:
+    # A caller that gave up (client disconnect) leaves a cancelled future behind.
+    if not pending.future.done():
+        pending.future.set_result(user)
+
+
+def _reject(pending: _PendingUser, error: Exception) -> None:
+    if not pending.future.done():
+        pending.future.set_exception(error)
@@ -0,0 +1,46 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import AddressEntity, CachedCepEntity
+from src.domain.repositories import CepCacheRepositoryPort
+from src.infrastructure.persistence.models import CepAddress
+from src.infrastructure.persistence.repositories.base import BaseRepository
+
+cep_table = CepAddress.__table__
+
+
+class SqlCepCacheRepository(BaseRepository, CepCacheRepositoryPort):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def get(self, cep: str) -> CachedCepEntity | None:
+        row = (await self.session.execute(select(cep_table).where(cep_table.c.cep == cep))).one_or_none()
+        if row is None:
+            return None
+        address = (
+            AddressEntity(cep=row.cep, street=row.street, district=row.district, city=row.city, state=row.state)
+            if row.found
+            else None
+        )
+        return CachedCepEntity(cep=row.cep, address=address, fetched_at=row.fetched_at)
+
+    async def put(self, entry: CachedCepEntity) -> None:
+        address = entry.address
+        values = {
+            "cep": entry.cep,
+            "found": address is not None,
+            "street": address.street if address else "",
+            "district": address.district if address else "",
+            "city": address.city if address else "",
+            "state": address.state if address else "",
+            "fetched_at": entry.fetched_at,
+        }
+        statement = insert(cep_table).values(values)
+        # Workers refreshing the same CEP race here; the most recent fetch wins, whichever commits last.
+        statement = statement.on_conflict_do_update(
+            index_elements=[cep_table.c.cep],
+            set_={name: statement.excluded[name] for name in values if name != "cep"},
+            where=cep_table.c.fetched_at < statement.excluded.fetched_at,
+        )
+        await self.session.execute(statement)
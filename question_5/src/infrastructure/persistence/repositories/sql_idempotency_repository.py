@@ -0,0 +1,67 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import IdempotencyRecord
+from src.domain.repositories import IdempotencyRepositoryPort
+from src.infrastructure.persistence.models import IdempotencyKey
+from src.infrastructure.persistence.repositories.base import BaseRepository
+from src.infrastructure.persistence.routing import use_primary
+
+idempotency_table = IdempotencyKey.__table__
+
+
+class SqlIdempotencyRepository(BaseRepository, IdempotencyRepositoryPort):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        # A replica that has not caught up would hide a response the client already got once.
+        use_primary(self.session)
+        query = select(idempotency_table).where(
+            idempotency_table.c.key == key, idempotency_table.c.expires_at > func.now()
+        )
+        row = (await self.session.execute(query)).one_or_none()
+        return None if row is None else IdempotencyRecord(**row._mapping)
+
+    async def save(
+        self, key: str, *, fingerprint: str, status_code: int, response: dict[str, Any], ttl_seconds: float
+    ) -> bool:
+        # A concurrent transaction holding the same key makes this INSERT wait for its outcome.
+        # An expired record is taken over; a live one is left alone and RETURNING comes back empty.
+        statement = insert(idempotency_table).values(
+            key=key,
+            fingerprint=fingerprint,
+            status_code=status_code,
+            response=response,
+            expires_at=func.now() + timedelta(seconds=ttl_seconds),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[idempotency_table.c.key],
+            set_={
+                "fingerprint": statement.excluded.fingerprint,
+                "status_code": statement.excluded.status_code,
+                "response": statement.excluded.response,
+                "created_at": func.now(),
+                "expires_at": statement.excluded.expires_at,
+            },
+            where=idempotency_table.c.expires_at <= func.now(),
+        ).returning(idempotency_table.c.key)
+        return await self.session.scalar(statement) is not None
+
+    async def purge_expired(self, limit: int) -> int:
+        # Oldest first along ix_idempotency_keys_expires_at. SKIP LOCKED leaves rows that a save() is
+        # taking over, or that another worker's purge already holds.
+        expired = (
+            select(idempotency_table.c.key)
+            .where(idempotency_table.c.expires_at <= func.now())
+            .order_by(idempotency_table.c.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(delete(idempotency_table).where(idempotency_table.c.key.in_(expired)))
+        return result.rowcount
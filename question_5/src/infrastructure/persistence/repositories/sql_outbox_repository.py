@@ -0,0 +1,30 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import OutboxMessage
+from src.domain.repositories import OutboxRepositoryPort
+from src.infrastructure.persistence.models import OutboxEvent
+from src.infrastructure.persistence.repositories.base import BaseRepository
+from src.infrastructure.persistence.routing import use_primary
+
+outbox_table = OutboxEvent.__table__
+
+
+class SqlOutboxRepository(BaseRepository, OutboxRepositoryPort):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        use_primary(self.session)
+        # One statement claims and deletes the batch. SKIP LOCKED lets relays in other workers take
+        # the next rows instead of queueing behind this one.
+        claimed = (
+            select(outbox_table.c.id)
+            .order_by(outbox_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = delete(outbox_table).where(outbox_table.c.id.in_(claimed)).returning(*outbox_table.c)
+        rows = (await self.session.execute(statement)).all()
+        return sorted((OutboxMessage(**row._mapping) for row in rows), key=lambda message: message.id)
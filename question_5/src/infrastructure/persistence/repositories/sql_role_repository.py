@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,3 +16,9 @@ class SqlRoleRepository(BaseRepository, RoleRepositoryPort):
     async def get_by_id(self, role_id: int) -> RoleEntity | None:
         query = select(Role).where(Role.id == role_id)
         return await self.session.scalar(query)
+
+    async def get_existing_ids(self, role_ids: Collection[int]) -> set[int]:
+        if not role_ids:
+            return set()
+        query = select(Role.id).where(Role.id.in_(role_ids))
+        return set(await self.session.scalars(query))
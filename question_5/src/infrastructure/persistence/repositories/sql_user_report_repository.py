@@ -0,0 +1,94 @@
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+from sqlalchemy import BigInteger, Date, Integer, bindparam, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import UserDailyCountEntity
+from src.domain.repositories import UserReportRepositoryPort
+from src.infrastructure.persistence.models import OutboxEvent, ReportProcessedEvent, UserDailyCount
+from src.infrastructure.persistence.repositories.base import BaseRepository
+
+daily_counts_table = UserDailyCount.__table__
+processed_table = ReportProcessedEvent.__table__
+outbox_table = OutboxEvent.__table__
+
+
+class SqlUserReportRepository(BaseRepository, UserReportRepositoryPort):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def count_created_users(self, events: Sequence[tuple[int, date, int]]) -> int:
+        event_ids, days, role_ids = (list(column) for column in zip(*events))
+        incoming = (
+            select(
+                func.unnest(bindparam("event_ids", event_ids, type_=ARRAY(BigInteger))).label("event_id"),
+                func.unnest(bindparam("days", days, type_=ARRAY(Date))).label("day"),
+                func.unnest(bindparam("role_ids", role_ids, type_=ARRAY(Integer))).label("role_id"),
+            )
+        ).cte("incoming")
+        # The dedup insert and the increment are one statement: an event id is counted exactly when
+        # it is recorded. A concurrent consumer holding the same id makes this wait, then skip it.
+        fresh = (
+            insert(processed_table)
+            .from_select(["event_id"], select(incoming.c.event_id))
+            .on_conflict_do_nothing(index_elements=[processed_table.c.event_id])
+            .returning(processed_table.c.event_id)
+            .cte("fresh")
+        )
+        # Rows are upserted in key order so concurrent batches lock them in the same order.
+        increments = (
+            select(incoming.c.day, incoming.c.role_id, func.count().label("users"))
+            .join(fresh, fresh.c.event_id == incoming.c.event_id)
+            .group_by(incoming.c.day, incoming.c.role_id)
+            .order_by(incoming.c.day, incoming.c.role_id)
+        )
+        upsert = insert(daily_counts_table).from_select(["day", "role_id", "users"], increments)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[daily_counts_table.c.day, daily_counts_table.c.role_id],
+            set_={"users": daily_counts_table.c.users + upsert.excluded.users},
+        )
+        query = select(func.count()).select_from(fresh).add_cte(upsert.cte("upserted"))
+        return await self.session.scalar(query)
+
+    async def purge_processed_events(self, older_than_seconds: float, limit: int) -> int:
+        # An event can only come back while its outbox row exists (the relay deletes it when the batch
+        # commits), so the ids of events that left the outbox are never needed again. The age bound
+        # keeps the walk on ix_report_processed_events_processed_at and away from fresh ids.
+        stale = (
+            select(processed_table.c.event_id)
+            .where(
+                processed_table.c.processed_at <= func.now() - timedelta(seconds=older_than_seconds),
+                ~exists().where(outbox_table.c.id == processed_table.c.event_id),
+            )
+            .order_by(processed_table.c.processed_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(delete(processed_table).where(processed_table.c.event_id.in_(stale)))
+        return result.rowcount
+
+    async def daily_counts(
+        self,
+        *,
+        created_from: date | None = None,
+        created_to: date | None = None,
+        role_id: int | None = None,
+    ) -> list[UserDailyCountEntity]:
+        running = func.sum(daily_counts_table.c.users).over(
+            partition_by=daily_counts_table.c.role_id, order_by=daily_counts_table.c.day
+        )
+        rows = select(*daily_counts_table.c, running.label("cumulative_users"))
+        if created_to is not None:
+            rows = rows.where(daily_counts_table.c.day <= created_to)
+        if role_id is not None:
+            rows = rows.where(daily_counts_table.c.role_id == role_id)
+        # The running total needs the days before created_from, so that bound is applied afterwards.
+        window = rows.subquery()
+        query = select(window).order_by(window.c.day, window.c.role_id)
+        if created_from is not None:
+            query = query.where(window.c.day >= created_from)
+        result = await self.session.execute(query)
+        return [UserDailyCountEntity(**row._mapping) for row in result]
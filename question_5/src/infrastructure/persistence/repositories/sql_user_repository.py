@@ -1,23 +1,102 @@
+from collections.abc import AsyncIterator, Collection, Mapping, Sequence
 from datetime import date
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import String, cast, func, literal, null, select, true, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import exists
+from sqlalchemy.sql.expression import CTE, Insert
 
-from src.domain.entities import UserEntity
+from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError, StaleCursorError
+from src.domain.entities import USER_CREATED_TOPIC, UserEntity
 from src.domain.repositories import UserRepositoryPort
-from src.infrastructure.persistence.models import User
+from src.infrastructure.persistence.email_bloom_filter import EmailBloomFilter
+from src.infrastructure.persistence.models import OutboxEvent, Role, User
 from src.infrastructure.persistence.repositories.base import BaseRepository
 
+users_table = User.__table__
+outbox_table = OutboxEvent.__table__
+listing_columns = [column for column in users_table.c if column.name != "password"]
+event_columns = ("id", "name", "email", "role_id", "created_at")
+
 
 class SqlUserRepository(BaseRepository, UserRepositoryPort):
-    def __init__(self, session: AsyncSession) -> None:
+    """Every user insert also writes a ``user.created`` row to the outbox, in the same transaction.
+
+    ``create_unique`` and ``create_many`` do it in the INSERT statement itself, so the event costs
+    no extra round trip.
+    """
+
+    def __init__(self, session: AsyncSession, email_filter: EmailBloomFilter | None = None) -> None:
         super().__init__(session)
+        self.email_filter = email_filter
 
     async def exists_by_email(self, email: str) -> bool:
+        if self.email_filter is not None and not self.email_filter.might_contain(email):
+            return False
         query = select(exists().where(User.email == email))
-        result = await self.session.scalar(query)
-        return bool(result)
+        result = bool(await self.session.scalar(query))
+        if not result and self.email_filter is not None:
+            self.email_filter.record_false_positives()
+        return result
+
+    async def get_existing_emails(self, emails: Collection[str]) -> set[str]:
+        if self.email_filter is not None:
+            emails = {email for email in emails if self.email_filter.might_contain(email)}
+        if not emails:
+            return set()
+        query = select(User.email).where(User.email.in_(emails))
+        found = set(await self.session.scalars(query))
+        if self.email_filter is not None:
+            self.email_filter.record_false_positives(len(emails) - len(found))
+        return found
+
+    async def stream_emails(self, *, batch_size: int = 10_000) -> AsyncIterator[str]:
+        result = await self.session.stream_scalars(select(User.email).execution_options(yield_per=batch_size))
+        async for email in result:
+            yield email
+
+    async def list_page(
+        self,
+        *,
+        after_id: int | None,
+        limit: int,
+        role_id: int | None = None,
+        created_from: date | None = None,
+        created_to: date | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        # Keyset paging: each page is an index seek past the cursor, so it costs the same at any depth.
+        # The keyset must be the order of the index that serves the filter: (role_id, id) or the
+        # primary key reads users in id order, but a date range is read from (created_at, id).
+        query = select(*listing_columns).limit(limit)
+        by_created_at = created_from is not None or created_to is not None
+        if not by_created_at:
+            query = query.order_by(users_table.c.id)
+            if after_id is not None:
+                query = query.where(users_table.c.id > after_id)
+        else:
+            query = query.order_by(users_table.c.created_at, users_table.c.id)
+            if after_id is not None:
+                # The cursor stays the last id; its created_at is one primary-key lookup away.
+                cursor_created_at = select(users_table.c.created_at).where(users_table.c.id == after_id)
+                query = query.where(
+                    tuple_(users_table.c.created_at, users_table.c.id)
+                    > tuple_(cursor_created_at.scalar_subquery(), literal(after_id))
+                )
+        if role_id is not None:
+            query = query.where(users_table.c.role_id == role_id)
+        if created_from is not None:
+            query = query.where(users_table.c.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(users_table.c.created_at <= created_to)
+        rows = (await self.session.execute(query)).mappings().all()
+        # A deleted cursor user has no created_at to compare with, so its page always comes back empty.
+        # Only then is it worth a second lookup to tell a stale cursor from the real end of the list.
+        if not rows and by_created_at and after_id is not None:
+            if not await self.session.scalar(select(exists().where(users_table.c.id == after_id))):
+                raise StaleCursorError(after_id)
+        return rows
 
     async def create(
         self,
@@ -35,4 +114,94 @@ class SqlUserRepository(BaseRepository, UserRepositoryPort):
             created_at=date.today(),
             updated_at=None,
         )
-        return await self.save(user)
+        await self.save(user)
+        self.session.add(
+            OutboxEvent(
+                topic=USER_CREATED_TOPIC,
+                key=str(user.id),
+                payload={
+                    "id": user.id,
+                    "name": user.name,
+                    "email": user.email,
+                    "role_id": user.role_id,
+                    "created_at": user.created_at.isoformat(),
+                },
+            )
+        )
+        self._remember_emails(email)
+        return user
+
+    async def create_unique(
+        self,
+        *,
+        name: str,
+        email: str,
+        password: str,
+        role_id: int,
+    ) -> UserEntity:
+        role = select(Role.id).where(Role.id == role_id).cte("role")
+        inserted = (
+            insert(users_table)
+            .from_select(
+                ["name", "email", "password", "role_id", "created_at", "updated_at"],
+                select(literal(name), literal(email), literal(password), role.c.id, literal(date.today()), null()),
+            )
+            .on_conflict_do_nothing(index_elements=[users_table.c.email])
+            .returning(*users_table.c)
+            .cte("inserted")
+        )
+        query = (
+            select(exists(select(role.c.id)).label("role_exists"), *inserted.c)
+            .select_from(select(literal(1)).subquery().outerjoin(inserted, true()))
+            .add_cte(_user_created_events(inserted))
+        )
+        row = (await self.session.execute(query)).one()
+        if not row.role_exists:
+            raise RoleNotFoundError(role_id)
+        if row.id is None:
+            raise EmailAlreadyExistsError(email)
+        self._remember_emails(email)
+        return User(**{column.name: getattr(row, column.name) for column in users_table.c})
+
+    async def create_many(self, users: Sequence[UserEntity]) -> list[UserEntity]:
+        if not users:
+            return []
+        inserted = (
+            insert(users_table)
+            .values(
+                [
+                    {
+                        "name": user.name,
+                        "email": user.email,
+                        "password": user.password,
+                        "role_id": user.role_id,
+                        "created_at": user.created_at,
+                        "updated_at": user.updated_at,
+                    }
+                    for user in users
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[users_table.c.email])
+            .returning(*users_table.c)
+            .cte("inserted")
+        )
+        result = await self.session.execute(select(inserted).add_cte(_user_created_events(inserted)))
+        created = [User(**row._mapping) for row in result]
+        self._remember_emails(*(user.email for user in created))
+        return created
+
+    def _remember_emails(self, *emails: str) -> None:
+        # Added before commit: a rollback only leaves a harmless false positive behind.
+        if self.email_filter is not None:
+            for email in emails:
+                self.email_filter.add(email)
+
+
+def _user_created_events(inserted: CTE) -> CTE:
+    # Data-modifying CTEs run whether or not the outer query reads them.
+    payload = func.jsonb_build_object(*(part for name in event_columns for part in (name, inserted.c[name])))
+    events: Insert = insert(outbox_table).from_select(
+        ["topic", "key", "payload"],
+        select(literal(USER_CREATED_TOPIC), cast(inserted.c.id, String), payload).select_from(inserted),
+    )
+    return events.cte("events")
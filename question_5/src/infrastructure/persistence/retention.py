@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = structlog.get_logger(__name__)
+
+PurgeBatch = Callable[[AsyncSession, int], Awaitable[int]]
+
+
+class RetentionPurger:
+    """Deletes rows past their retention in the background, at most ``batch_size`` per transaction.
+
+    ``purge(session, limit)`` deletes up to ``limit`` rows and returns how many it deleted. Full
+    batches run back to back; once a batch comes back short the purger sleeps ``interval_seconds``.
+    Every worker runs one; the purge statements lock with SKIP LOCKED, so they split the work.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        purge: PurgeBatch,
+        *,
+        batch_size: int = 1_000,
+        interval_seconds: float = 60.0,
+    ) -> None:
+        self.table = table
+        self.session_factory = session_factory
+        self.purge = purge
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.purged = 0
+        self.failures = 0
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        # Lets a batch in flight commit; the rest waits for the next start.
+        self._stopping.set()
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+
+    async def purge_batch(self) -> int:
+        async with self.session_factory() as session, session.begin():
+            deleted = await self.purge(session, self.batch_size)
+        self.purged += deleted
+        return deleted
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                deleted = await self.purge_batch()
+            except Exception:
+                self.failures += 1
+                logger.warning("retention.purge_failed", table=self.table, exc_info=True)
+                deleted = 0
+            if deleted < self.batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), self.interval_seconds)
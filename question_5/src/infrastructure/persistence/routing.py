@@ -0,0 +1,86 @@
+"""Primary/replica routing for ORM sessions.
+
+Each session reads from one replica, chosen round-robin. Statements go to the primary instead
+when one of these holds:
+
+* the statement is an INSERT/UPDATE/DELETE, or the session is flushing;
+* the session was pinned with ``use_primary()``, which ``SqlAlchemyUnitOfWork.transaction()`` does;
+* the current request is inside its read-your-writes window, meaning it wrote or its client
+  wrote moments ago (see ``ReadYourWritesMiddleware``).
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import cycle
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+USE_PRIMARY = "use_primary"
+REPLICA = "replica"
+
+
+@dataclass(slots=True)
+class ReadConsistency:
+    primary_until: float = 0.0
+    wrote: bool = False
+
+
+_read_consistency: ContextVar[ReadConsistency | None] = ContextVar("read_consistency", default=None)
+
+
+def begin_read_consistency(primary_until: float = 0.0) -> ReadConsistency:
+    consistency = ReadConsistency(primary_until=primary_until)
+    _read_consistency.set(consistency)
+    return consistency
+
+
+def record_write() -> None:
+    # Mutates the request's holder instead of setting the var, so the write is visible to the
+    # middleware even when it happened in a task that copied the request context.
+    consistency = _read_consistency.get()
+    if consistency is not None:
+        consistency.wrote = True
+
+
+def reads_pinned_to_primary() -> bool:
+    consistency = _read_consistency.get()
+    return consistency is not None and (consistency.wrote or consistency.primary_until > time.time())
+
+
+def use_primary(session: AsyncSession | Session) -> None:
+    session.info[USE_PRIMARY] = True
+
+
+class EngineRouter:
+    def __init__(self, primary: AsyncEngine, replicas: list[AsyncEngine]) -> None:
+        self.primary = primary.sync_engine
+        self.replicas = [replica.sync_engine for replica in replicas]
+        self._next_replica = cycle(self.replicas)
+
+    def engine_for(self, session: Session, clause: Any = None) -> Engine:
+        if (
+            not self.replicas
+            or session.info.get(USE_PRIMARY)
+            or session._flushing
+            or getattr(clause, "is_dml", False)
+            or reads_pinned_to_primary()
+        ):
+            return self.primary
+        # One replica per session, so a session never holds connections to several of them.
+        replica = session.info.get(REPLICA)
+        if replica is None:
+            replica = session.info[REPLICA] = next(self._next_replica)
+        return replica
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, router: EngineRouter, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Engine:
+        return self.router.engine_for(self, clause)
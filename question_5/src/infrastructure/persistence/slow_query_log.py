@@ -0,0 +1,130 @@
+import asyncio
+import re
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from time import perf_counter
+from types import FrameType
+from typing import Any
+
+import structlog
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger(__name__)
+
+REPOSITORY_PACKAGE = "src.infrastructure.persistence.repositories"
+SKIP_OPTION = "skip_slow_query_log"
+
+_PLACEHOLDER = re.compile(r"\$\d+(?:::[A-Z ]+(?:\[\])?)?|%\(\w+\)s|%s")
+_VALUES_ROWS = re.compile(r"\((?:\?, )*\?\)(?:, \((?:\?, )*\?\))+")
+_IN_LIST = re.compile(r"IN \((?:\?, )+\?\)")
+_WHITESPACE = re.compile(r"\s+")
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+class SlowQueryLog:
+    """Logs statements slower than ``threshold_seconds`` through structlog.
+
+    Each entry carries the normalized SQL, the types (never the values) of the bind
+    parameters and the repository method that issued it. With ``explain`` set, read-only
+    statements also get an ``EXPLAIN (ANALYZE, BUFFERS)`` on a separate pooled connection,
+    at most once per normalized statement every ``explain_interval_seconds``.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        threshold_seconds: float,
+        explain: bool = False,
+        explain_interval_seconds: float = 60.0,
+        explain_timeout_ms: int = 5_000,
+    ) -> None:
+        self.engine = engine
+        self.threshold_seconds = threshold_seconds
+        self.explain = explain
+        self.explain_interval_seconds = explain_interval_seconds
+        self.explain_timeout_ms = explain_timeout_ms
+        self._explained_at: dict[str, float] = {}
+        self._explains: set[asyncio.Task[None]] = set()
+
+    def attach(self) -> "SlowQueryLog":
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(self.engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def detach(self) -> None:
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self.engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._slow_query_started = perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = perf_counter() - context._slow_query_started
+        if elapsed < self.threshold_seconds or context.execution_options.get(SKIP_OPTION):
+            return
+        sql = normalize_sql(statement)
+        logger.warning(
+            "db.slow_query",
+            duration_ms=round(elapsed * 1000, 3),
+            sql=sql,
+            params=parameter_shape(parameters, executemany),
+            caller=calling_repository_method(),
+        )
+        if self.explain and not executemany and not _WRITES.search(statement) and self._explain_due(sql):
+            task = asyncio.get_running_loop().create_task(self._run_explain(sql, statement, parameters))
+            self._explains.add(task)
+            task.add_done_callback(self._explains.discard)
+
+    def _explain_due(self, sql: str) -> bool:
+        now = time.monotonic()
+        if now - self._explained_at.get(sql, float("-inf")) < self.explain_interval_seconds:
+            return False
+        self._explained_at[sql] = now
+        return True
+
+    async def _run_explain(self, sql: str, statement: str, parameters: Any) -> None:
+        try:
+            async with self.engine.connect() as connection:
+                connection = await connection.execution_options(**{SKIP_OPTION: True})
+                await connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                # Leaving the block without a commit rolls the ANALYZE run back.
+                plan = [row[0] for row in result]
+        except Exception:
+            logger.warning("db.slow_query.explain_failed", sql=sql, exc_info=True)
+        else:
+            logger.warning("db.slow_query.explain", sql=sql, plan=plan)
+
+
+def normalize_sql(statement: str) -> str:
+    sql = _PLACEHOLDER.sub("?", statement)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _VALUES_ROWS.sub("(?, ...), ...", sql)
+    return _IN_LIST.sub("IN (...)", sql)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, Mapping):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def calling_repository_method() -> str | None:
+    # Under AsyncSession the cursor runs in a greenlet; the repository coroutine is suspended in the parent.
+    current = getcurrent()
+    frames: list[FrameType | None] = [sys._getframe(1), getattr(current.parent, "gr_frame", None)]
+    for frame in frames:
+        while frame is not None:
+            if frame.f_globals.get("__name__", "").startswith(REPOSITORY_PACKAGE):
+                return frame.f_code.co_qualname
+            frame = frame.f_back
+    return None
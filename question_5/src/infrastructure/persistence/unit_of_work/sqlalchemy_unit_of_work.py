@@ -4,19 +4,35 @@ from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain import UnitOfWorkPort
+from src.infrastructure.persistence.routing import record_write, use_primary
 
 
 class SqlAlchemyUnitOfWork(UnitOfWorkPort):
+    """Transaction boundary over an ``AsyncSession``.
+
+    The session only checks out a pooled connection when the first statement runs and gives it
+    back on commit/rollback, so callers should keep slow non-database work (password hashing)
+    outside ``transaction()`` and call ``release()`` after read-only queries that precede it.
+
+    With read replicas configured, everything from ``transaction()`` on runs on the primary.
+    """
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator[None]:
+        use_primary(self.session)
         try:
             yield
             if self.session.in_transaction():
                 await self.session.commit()
+                record_write()
         except Exception:
             if self.session.in_transaction():
                 await self.session.rollback()
             raise
+
+    async def release(self) -> None:
+        if self.session.in_transaction():
+            await self.session.rollback()
@@ -0,0 +1,53 @@
+"""Startup work that moves first-request costs out of the request path.
+
+Each pooled connection pays for its TCP connect, authentication and asyncpg type introspection
+on first use. Each statement also pays for its server-side PREPARE the first time a given
+connection runs it. ``warm_up_pool`` pays those costs before the application reports ready.
+"""
+
+import asyncio
+from contextlib import suppress
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.application.exceptions import RoleNotFoundError
+from src.application.schemas import UserCreateInput, UserListQuery, UserOutput, UserPage
+from src.infrastructure.persistence.repositories import SqlRoleRepository, SqlUserRepository
+
+logger = structlog.get_logger(__name__)
+
+# Role ids are positive, so priming the insert with role 0 never writes a row.
+_MISSING_ROLE_ID = 0
+_WARM_UP_EMAIL = "warm-up@example.com"
+
+
+async def prime_statements(session: AsyncSession) -> None:
+    await SqlRoleRepository(session).get_by_id(_MISSING_ROLE_ID)
+    users = SqlUserRepository(session)
+    await users.exists_by_email(_WARM_UP_EMAIL)
+    with suppress(RoleNotFoundError):
+        await users.create_unique(name="warm-up", email=_WARM_UP_EMAIL, password="", role_id=_MISSING_ROLE_ID)
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> None:
+    """Opens ``connections`` pooled connections at once and primes the hot statements on each."""
+
+    async def _prime_connection() -> None:
+        # Nothing is committed: leaving the connection block rolls back and returns it to the pool.
+        async with engine.connect() as connection, AsyncSession(bind=connection) as session:
+            await prime_statements(session)
+
+    await asyncio.gather(*(_prime_connection() for _ in range(connections)))
+    logger.info("database.warmed_up", connections=connections)
+
+
+def warm_up_validators() -> None:
+    payload = UserCreateInput.model_validate(
+        {"name": "warm-up", "email": _WARM_UP_EMAIL, "role_id": 1, "password": "warm-up-password"}
+    )
+    user = UserOutput(
+        id=1, name=payload.name, email=payload.email, role_id=1, created_at="2026-01-01", updated_at=None
+    )
+    UserPage(items=[user], next_cursor=None).model_dump_json()
+    UserListQuery.model_validate({"limit": "50"})
@@ -0,0 +1,185 @@
+"""Wall-clock stack sampling for individual requests.
+
+A ``StackSampler`` thread wakes every ``interval_seconds`` while at least one ``ProfileSession`` is
+active. When the profiled task is the one running on the event loop, it records the thread's
+stack. Otherwise it records the task's suspended ``await`` chain. So time spent waiting on the
+database or the hashing pool shows up next to CPU time. Stacks are stored in the collapsed
+format (``frame;frame;frame count``) that flamegraph.pl and speedscope read directly.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any
+
+_current_profile: ContextVar["ProfileSession | None"] = ContextVar("current_profile", default=None)
+
+
+def sign_profile_token(secret: str, expires_at: int) -> str:
+    digest = hmac.new(secret.encode(), str(expires_at).encode(), hashlib.sha256).hexdigest()
+    return f"{expires_at}:{digest}"
+
+
+def verify_profile_token(token: str, secret: str, *, now: float | None = None) -> bool:
+    expires_at, _, _ = token.partition(":")
+    if not expires_at.isdigit() or int(expires_at) < (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(token, sign_profile_token(secret, int(expires_at)))
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    session = _current_profile.get()
+    if session is not None:
+        session.stages.append((stage, seconds))
+
+
+class ProfileSession:
+    def __init__(self, task: asyncio.Task[Any], reason: str) -> None:
+        self.task = task
+        self.loop = task.get_loop()
+        self.thread_id = threading.get_ident()
+        self.reason = reason
+        self.stacks: Counter[str] = Counter()
+        self.stages: list[tuple[str, float]] = []
+        self.running_samples = 0
+        self.awaiting_samples = 0
+        self.started = perf_counter()
+        self.duration = 0.0
+        # The sampler thread may still hold this session in its snapshot after ``stop``; the lock
+        # makes ``stop`` wait out a sample in flight, and every later sample leaves the stacks alone.
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def activate(self) -> Token["ProfileSession | None"]:
+        return _current_profile.set(self)
+
+    def deactivate(self, token: Token["ProfileSession | None"]) -> None:
+        _current_profile.reset(token)
+        self.duration = perf_counter() - self.started
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+
+    def sample(self) -> None:
+        running = asyncio.current_task(self.loop) is self.task
+        if running:
+            stack = _running_stack(sys._current_frames().get(self.thread_id))
+        else:
+            stack = _awaiting_stack(self.task.get_coro())
+        with self._lock:
+            if self._stopped:
+                return
+            if running:
+                self.running_samples += 1
+            else:
+                self.awaiting_samples += 1
+            if stack:
+                self.stacks[";".join(stack)] += 1
+
+
+class StackSampler:
+    def __init__(self, interval_seconds: float = 0.002) -> None:
+        self.interval_seconds = interval_seconds
+        self._sessions: set[ProfileSession] = set()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, session: ProfileSession) -> None:
+        self._sessions.add(session)
+        self._wakeup.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+
+    def remove(self, session: ProfileSession) -> None:
+        """Stops sampling ``session``; once this returns its stacks and counters no longer change."""
+        self._sessions.discard(session)
+        session.stop()
+
+    def _run(self) -> None:
+        while True:
+            if not self._sessions:
+                self._wakeup.clear()
+                if not self._sessions:
+                    self._wakeup.wait()
+                continue
+            time.sleep(self.interval_seconds)
+            for session in tuple(self._sessions):
+                try:
+                    session.sample()
+                except Exception:
+                    # Frames are read while the loop thread mutates them; a torn read must not kill the sampler.
+                    continue
+
+
+class ProfileWriter:
+    """Writes ``<name>.collapsed`` and ``<name>.json`` per profile, keeping only the newest ``max_profiles``."""
+
+    def __init__(self, directory: str | Path, *, max_profiles: int = 200) -> None:
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+
+    def write(self, session: ProfileSession, details: dict[str, Any]) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns()}-{details['method']}-{_slug(details['route'])}"
+        collapsed = self.directory / f"{name}.collapsed"
+        collapsed.write_text("".join(f"{stack} {count}\n" for stack, count in session.stacks.items()))
+        timings = {
+            **details,
+            "reason": session.reason,
+            "duration_ms": round(session.duration * 1000, 3),
+            "running_samples": session.running_samples,
+            "awaiting_samples": session.awaiting_samples,
+            "stages_ms": [[stage, round(seconds * 1000, 3)] for stage, seconds in session.stages],
+        }
+        (self.directory / f"{name}.json").write_text(json.dumps(timings))
+        self._rotate()
+        return collapsed
+
+    def _rotate(self) -> None:
+        profiles = sorted(self.directory.glob("*.collapsed"))
+        for stale in profiles[: max(len(profiles) - self.max_profiles, 0)]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".json").unlink(missing_ok=True)
+
+
+def _frame_label(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _running_stack(frame: FrameType | None) -> list[str]:
+    stack: list[str] = []
+    while frame is not None:
+        # Everything above the event loop's callback runner is the same loop machinery every time.
+        if frame.f_code.co_name == "_run" and frame.f_globals.get("__name__") == "asyncio.events":
+            break
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _awaiting_stack(awaitable: Any) -> list[str]:
+    stack: list[str] = []
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            stack.append(f"[await {type(awaitable).__name__}]")
+            break
+        stack.append(_frame_label(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return stack
+
+
+def _slug(route: str) -> str:
+    return "".join(character if character.isalnum() else "_" for character in route).strip("_") or "root"
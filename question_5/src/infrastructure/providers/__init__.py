@@ -0,0 +1,28 @@
+from .brasil_api import BrasilApiCnpjProvider
+from .cached_cep_provider import CachedCepProvider
+from .cep_dataset import CepDataset, OfflineCepProvider, compile_cep_dataset
+from .hedging import HedgeBudget, HedgedCnpjProvider, LatencyDigest
+from .http_client import close_http_client, get_http_client, init_http_client
+from .provider_client import ProviderClient
+from .receita_ws import ReceitaWsCnpjProvider
+from .resilience import CircuitBreaker, RetryPolicy
+from .via_cep import ViaCepProvider
+
+__all__ = [
+    "BrasilApiCnpjProvider",
+    "CachedCepProvider",
+    "CepDataset",
+    "CircuitBreaker",
+    "HedgeBudget",
+    "HedgedCnpjProvider",
+    "LatencyDigest",
+    "OfflineCepProvider",
+    "ProviderClient",
+    "ReceitaWsCnpjProvider",
+    "RetryPolicy",
+    "ViaCepProvider",
+    "close_http_client",
+    "compile_cep_dataset",
+    "get_http_client",
+    "init_http_client",
+]
@@ -0,0 +1,23 @@
+from src.domain import CnpjProviderPort
+from src.domain.entities import AddressEntity
+from src.infrastructure.providers.provider_client import ProviderClient
+
+
+class BrasilApiCnpjProvider(CnpjProviderPort):
+    """Registered company addresses from BrasilAPI's ``GET /api/cnpj/v1/{cnpj}`` (Receita Federal data)."""
+
+    def __init__(self, client: ProviderClient) -> None:
+        self.client = client
+
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        company = await self.client.get_json(f"/{cnpj}")
+        if company is None:
+            return None
+        street_type = company.get("descricao_tipo_de_logradouro") or ""
+        return AddressEntity(
+            cep="".join(filter(str.isdigit, company.get("cep") or "")),
+            street=f"{street_type} {company.get('logradouro') or ''}".strip(),
+            district=company.get("bairro") or "",
+            city=company.get("municipio") or "",
+            state=company.get("uf") or "",
+        )
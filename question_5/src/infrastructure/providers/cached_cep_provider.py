@@ -0,0 +1,156 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime, timezone
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain import CepProviderPort
+from src.domain.entities import AddressEntity, CachedCepEntity
+from src.infrastructure.persistence.repositories import SqlCepCacheRepository
+
+logger = structlog.get_logger(__name__)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CachedCepProvider(CepProviderPort):
+    """Two-tier cache in front of a CEP provider: an in-process LRU, then the ``cep_addresses`` table.
+
+    CEPs the provider does not know are cached too (negative caching), for ``negative_ttl_seconds``
+    instead of ``ttl_seconds``. An entry past its TTL is stale but still served at once, while one
+    background task per CEP fetches a fresh copy (stale-while-revalidate). Only a CEP missing from
+    both tiers waits for the provider, and concurrent misses for the same CEP share one lookup.
+    A failing cache table is logged and bypassed, never surfaced to the caller.
+    """
+
+    def __init__(
+        self,
+        provider: CepProviderPort,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 2_592_000.0,
+        negative_ttl_seconds: float = 86_400.0,
+        now: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.provider = provider
+        self.session_factory = session_factory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.now = now
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+        self.stale_served = 0
+        self.evictions = 0
+        self.refresh_failures = 0
+        self._entries: OrderedDict[str, CachedCepEntity] = OrderedDict()
+        self._loads: dict[str, asyncio.Task[CachedCepEntity]] = {}
+        self._refreshes: dict[str, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        hits = self.memory_hits + self.database_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    async def stop(self) -> None:
+        refreshes = list(self._refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        for task in refreshes:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        entry = self._entries.get(cep)
+        if entry is not None:
+            self._entries.move_to_end(cep)
+            self.memory_hits += 1
+        else:
+            entry = await self._load(cep)
+        if self._is_stale(entry):
+            self.stale_served += 1
+            self._refresh_in_background(cep)
+        return entry.address
+
+    async def _load(self, cep: str) -> CachedCepEntity:
+        task = self._loads.get(cep)
+        if task is None:
+            task = self._loads[cep] = asyncio.create_task(self._load_from_tiers(cep))
+            task.add_done_callback(lambda done: self._forget(self._loads, cep, done))
+        # Shielded: a caller that gives up must not cancel the lookup the other callers are waiting on.
+        return await asyncio.shield(task)
+
+    async def _load_from_tiers(self, cep: str) -> CachedCepEntity:
+        entry = await self._read_database(cep)
+        if entry is None:
+            self.misses += 1
+            entry = await self._fetch(cep)
+        else:
+            self.database_hits += 1
+            self._remember(entry)
+        return entry
+
+    def _refresh_in_background(self, cep: str) -> None:
+        if cep in self._refreshes or cep in self._loads:
+            return
+        task = self._refreshes[cep] = asyncio.create_task(self._refresh(cep))
+        task.add_done_callback(lambda done: self._forget(self._refreshes, cep, done))
+
+    async def _refresh(self, cep: str) -> None:
+        try:
+            await self._fetch(cep)
+        except Exception:
+            # The stale entry keeps being served; the next request for this CEP tries again.
+            self.refresh_failures += 1
+            logger.warning("cep_cache.refresh_failed", cep=cep, exc_info=True)
+
+    async def _fetch(self, cep: str) -> CachedCepEntity:
+        address = await self.provider.get_address(cep)
+        entry = CachedCepEntity(cep=cep, address=address, fetched_at=self.now())
+        self._remember(entry)
+        await self._write_database(entry)
+        return entry
+
+    async def _read_database(self, cep: str) -> CachedCepEntity | None:
+        try:
+            async with self.session_factory() as session:
+                return await SqlCepCacheRepository(session).get(cep)
+        except Exception:
+            logger.warning("cep_cache.read_failed", cep=cep, exc_info=True)
+            return None
+
+    async def _write_database(self, entry: CachedCepEntity) -> None:
+        try:
+            async with self.session_factory() as session, session.begin():
+                await SqlCepCacheRepository(session).put(entry)
+        except Exception:
+            logger.warning("cep_cache.write_failed", cep=entry.cep, exc_info=True)
+
+    def _remember(self, entry: CachedCepEntity) -> None:
+        self._entries[entry.cep] = entry
+        self._entries.move_to_end(entry.cep)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _is_stale(self, entry: CachedCepEntity) -> bool:
+        ttl = self.ttl_seconds if entry.address is not None else self.negative_ttl_seconds
+        return (self.now() - entry.fetched_at).total_seconds() >= ttl
+
+    @staticmethod
+    def _forget(tasks: dict[str, asyncio.Task], cep: str, done: asyncio.Task) -> None:
+        del tasks[cep]
+        # Marks a failure as retrieved even when every waiter was cancelled before it arrived.
+        if not done.cancelled():
+            done.exception()
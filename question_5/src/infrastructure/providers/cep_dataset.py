@@ -0,0 +1,169 @@
+"""Offline CEP dataset.
+
+``src.import_ceps`` compiles a CSV dump of CEPs into one binary file, laid out so that a lookup
+never parses anything it does not return:
+
+* a 32-byte header: magic, record count, string table size;
+* the CEPs as sorted little-endian ``uint32`` keys, one every 4 bytes;
+* one fixed-width record per key, in the same order: offsets of the street, district and city in the
+  string table, then the two-letter state;
+* the string table: every distinct street, district and city once, as a ``uint16`` length plus UTF-8.
+
+``CepDataset`` maps the file read-only. The pages live in the OS page cache, shared by every worker
+(and by every process that maps the file), and only the pages a lookup touches are ever read. A
+lookup is a ``bisect`` over a ``memoryview`` of the keys, O(log n) with no parsing and no copies,
+then one record and three strings decoded into the returned entity.
+"""
+
+import csv
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+
+from src.domain import CepProviderPort
+from src.domain.entities import AddressEntity
+
+MAGIC = b"CEPDATA1"
+_HEADER = struct.Struct("<8sII16x")
+_KEY = struct.Struct("<I")
+_RECORD = struct.Struct("<III2s")
+_STRING_LENGTH = struct.Struct("<H")
+COLUMNS = ("cep", "street", "district", "city", "state")
+# ViaCEP's field names, which most public CEP dumps also use.
+COLUMN_ALIASES = {"logradouro": "street", "bairro": "district", "localidade": "city", "cidade": "city", "uf": "state"}
+
+
+def compile_cep_dataset(rows: Iterable[Mapping[str, str]], output_path: str) -> tuple[int, int]:
+    """Writes ``rows`` (``COLUMNS`` keys) to ``output_path``; returns the CEP and distinct string counts.
+
+    A CEP that appears twice keeps its last row. The file is written beside ``output_path`` and moved
+    over it, so workers that still map the previous file keep reading it until they reopen.
+    """
+    records: dict[int, tuple[str, str, str, str]] = {}
+    for line, row in enumerate(rows, start=2):
+        cep = "".join(filter(str.isdigit, row["cep"]))
+        state = row["state"].strip().upper()
+        if len(cep) != 8:
+            raise ValueError(f"line {line}: {row['cep']!r} is not an 8-digit CEP")
+        if len(state.encode()) > 2:
+            raise ValueError(f"line {line}: {row['state']!r} is not a two-letter state")
+        records[int(cep)] = (row["street"].strip(), row["district"].strip(), row["city"].strip(), state)
+
+    keys = sorted(records)
+    strings = bytearray()
+    string_offsets: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        offset = string_offsets.get(value)
+        if offset is None:
+            encoded = value.encode()
+            if len(encoded) > 0xFFFF:
+                raise ValueError(f"{value[:40]!r}... is longer than {0xFFFF} bytes")
+            offset = string_offsets[value] = len(strings)
+            strings.extend(_STRING_LENGTH.pack(len(encoded)) + encoded)
+        return offset
+
+    body = bytearray()
+    for key in keys:
+        street, district, city, state = records[key]
+        body += _RECORD.pack(intern(street), intern(district), intern(city), state.encode())
+
+    partial_path = f"{output_path}.partial"
+    with open(partial_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, len(keys), len(strings)))
+        file.write(struct.pack(f"<{len(keys)}I", *keys))
+        file.write(body)
+        file.write(strings)
+    os.replace(partial_path, output_path)
+    return len(keys), len(string_offsets)
+
+
+def read_cep_csv(path: str, delimiter: str = ",") -> Iterable[dict[str, str]]:
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        reader = csv.DictReader(file, delimiter=delimiter)
+        names = {
+            field: COLUMN_ALIASES.get(field.strip().lower(), field.strip().lower())
+            for field in reader.fieldnames or ()
+        }
+        missing = set(COLUMNS) - set(names.values())
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(sorted(missing))} column")
+        for row in reader:
+            yield {names[field]: value or "" for field, value in row.items() if field in names}
+
+
+class CepDataset:
+    """Read-only, memory-mapped view of a file written by ``compile_cep_dataset``."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Binary search jumps across the file: read-ahead would only pull in pages it never visits.
+        self._mmap.madvise(mmap.MADV_RANDOM)
+        header = self._mmap[: _HEADER.size]
+        magic, count, strings_size = _HEADER.unpack(header) if len(header) == _HEADER.size else (b"", 0, 0)
+        # The keys are read in place as native integers, so the machine must be little-endian too.
+        if magic != MAGIC or sys.byteorder != "little":
+            self._mmap.close()
+            raise ValueError(f"{path} is not a CEP dataset this machine can read")
+        self._records_offset = _HEADER.size + count * _KEY.size
+        self._strings_offset = self._records_offset + count * _RECORD.size
+        if len(self._mmap) != self._strings_offset + strings_size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or has trailing data")
+        self._view = memoryview(self._mmap)
+        self._keys = self._view[_HEADER.size : self._records_offset].cast("I")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, cep: str) -> AddressEntity | None:
+        if len(cep) != 8 or not cep.isdigit():
+            return None
+        key = int(cep)
+        index = bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            return None
+        street, district, city, state = _RECORD.unpack_from(self._mmap, self._records_offset + index * _RECORD.size)
+        return AddressEntity(
+            cep=cep,
+            street=self._string(street),
+            district=self._string(district),
+            city=self._string(city),
+            state=state.rstrip(b"\0").decode(),
+        )
+
+    def close(self) -> None:
+        self._keys.release()
+        self._view.release()
+        self._mmap.close()
+
+    def _string(self, offset: int) -> str:
+        start = self._strings_offset + offset
+        (length,) = _STRING_LENGTH.unpack_from(self._mmap, start)
+        start += _STRING_LENGTH.size
+        return str(self._view[start : start + length], "utf-8")
+
+
+class OfflineCepProvider(CepProviderPort):
+    """Answers from a ``CepDataset`` and asks ``fallback`` only about CEPs the dataset does not hold.
+
+    A CEP missing from the dataset is not necessarily unknown: it may be newer than the dump.
+    """
+
+    def __init__(self, dataset: CepDataset, fallback: CepProviderPort) -> None:
+        self.dataset = dataset
+        self.fallback = fallback
+        self.hits = 0
+        self.misses = 0
+
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        address = self.dataset.get(cep)
+        if address is not None:
+            self.hits += 1
+            return address
+        self.misses += 1
+        return await self.fallback.get_address(cep)
@@ -0,0 +1,152 @@
+"""Hedged CNPJ lookups across two redundant providers.
+
+The primary provider is called first. If it has not answered after its own recent p95 latency,
+the same lookup goes to the backup provider as well, and whichever answers first wins; the other
+call is cancelled. A slow primary then costs about its p95 plus the backup's latency instead of
+its full tail. A token budget keeps the extra calls to a fixed share of the lookups, so a
+degraded primary cannot double the load on the backup.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+
+from src.domain import CnpjProviderPort
+from src.domain.entities import AddressEntity
+
+
+class LatencyDigest:
+    """Latencies of the last ``window`` calls to one provider, with quantiles over them."""
+
+    def __init__(self, window: int = 256) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._sorted: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def quantile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        return self._sorted[min(int(q * len(self._sorted)), len(self._sorted) - 1)]
+
+
+class HedgeBudget:
+    """Every lookup earns ``ratio`` of a hedge and a hedge costs one, with at most ``burst`` saved up."""
+
+    def __init__(self, ratio: float = 0.1, burst: float = 10.0) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+
+    def earn(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class HedgedCnpjProvider(CnpjProviderPort):
+    """Sends a CNPJ lookup to ``backup`` too when ``primary`` is slower than usual, or has failed.
+
+    The hedge delay is the primary's p95 over its recent calls, clamped between
+    ``min_delay_seconds`` and ``max_delay_seconds``; until ``min_samples`` calls have been seen it
+    is ``max_delay_seconds``. When the primary fails outright, the backup is asked at once without
+    spending budget: that is a failover, not an extra call.
+    """
+
+    def __init__(
+        self,
+        primary: CnpjProviderPort,
+        backup: CnpjProviderPort,
+        *,
+        budget: HedgeBudget,
+        min_delay_seconds: float = 0.05,
+        max_delay_seconds: float = 1.0,
+        min_samples: int = 20,
+        window: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.primary = primary
+        self.backup = backup
+        self.budget = budget
+        self.min_delay_seconds = min_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.min_samples = min_samples
+        self.clock = clock
+        self.primary_latency = LatencyDigest(window)
+        self.backup_latency = LatencyDigest(window)
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.hedges_denied = 0
+        self.failovers = 0
+
+    @property
+    def hedge_delay(self) -> float:
+        if len(self.primary_latency) < self.min_samples:
+            return self.max_delay_seconds
+        p95 = self.primary_latency.quantile(0.95)
+        return min(max(p95, self.min_delay_seconds), self.max_delay_seconds)
+
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        self.budget.earn()
+        primary = self._start(self.primary, self.primary_latency, cnpj)
+        try:
+            done, _ = await asyncio.wait((primary,), timeout=self.hedge_delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done and primary.exception() is None:
+            return primary.result()
+        if done:
+            self.failovers += 1
+        elif self.budget.try_spend():
+            self.hedges += 1
+        else:
+            self.hedges_denied += 1
+            return await primary
+        backup = self._start(self.backup, self.backup_latency, cnpj)
+        return await self._first_answer(primary, backup)
+
+    async def _first_answer(
+        self, primary: asyncio.Task[AddressEntity | None], backup: asyncio.Task[AddressEntity | None]
+    ) -> AddressEntity | None:
+        pending = {primary, backup}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup and not primary.done():
+                            self.hedge_wins += 1
+                        return task.result()
+            # Both failed; the primary's error is the one the breaker and metrics already attribute.
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _start(
+        self, provider: CnpjProviderPort, digest: LatencyDigest, cnpj: str
+    ) -> asyncio.Task[AddressEntity | None]:
+        started = self.clock()
+
+        def record(task: asyncio.Task[AddressEntity | None]) -> None:
+            # A cancelled loser was at least this slow, so its elapsed time is kept as a sample too.
+            # Failures are not: an open breaker fails in microseconds and would drag the p95 down.
+            if task.cancelled() or task.exception() is None:
+                digest.record(self.clock() - started)
+
+        task = asyncio.create_task(provider.get_company_address(cnpj))
+        task.add_done_callback(record)
+        return task
@@ -0,0 +1,36 @@
+"""The pooled HTTP client shared by every third-party provider adapter.
+
+``init_http_client()`` runs in the application lifespan, after the launcher forks, so each worker
+keeps its own pool of keep-alive connections (and TLS sessions) to the providers.
+"""
+
+import httpx
+
+from src.infrastructure.config import Settings
+
+http_client: httpx.AsyncClient | None = None
+
+
+def init_http_client(settings: Settings) -> httpx.AsyncClient:
+    global http_client
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        headers={"Accept": "application/json"},
+    )
+    return http_client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    if http_client is None:
+        raise RuntimeError("init_http_client() has not been called")
+    return http_client
+
+
+async def close_http_client() -> None:
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
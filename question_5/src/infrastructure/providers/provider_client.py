@@ -0,0 +1,105 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from src.application.exceptions import ProviderUnavailableError
+from src.infrastructure.metrics import (
+    provider_request_duration_seconds,
+    provider_requests_total,
+    provider_retries_total,
+)
+from src.infrastructure.providers.resilience import CircuitBreaker, RetryPolicy
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class ProviderClient:
+    """GETs JSON documents from one provider through the shared HTTP client.
+
+    Each attempt is bounded by ``timeout_seconds`` and the whole lookup, retries and backoff
+    included, by ``deadline_seconds``: a synchronous caller gets an answer or a 503 problem in
+    bounded time. Timeouts, connection errors, 429 and 5xx responses are retried; a lookup that
+    still fails counts against the circuit breaker, which then refuses calls without waiting.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        client: Callable[[], httpx.AsyncClient],
+        *,
+        timeout_seconds: float,
+        deadline_seconds: float,
+        retry: RetryPolicy,
+        breaker: CircuitBreaker,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.client = client
+        self.timeout_seconds = timeout_seconds
+        self.deadline_seconds = deadline_seconds
+        self.retry = retry
+        self.breaker = breaker
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng
+
+    async def get_json(self, path: str) -> Any | None:
+        """The decoded body of ``GET base_url + path``, or ``None`` when the provider answers 404."""
+        if not self.breaker.allow():
+            provider_requests_total.inc(self.name, "short_circuited")
+            raise ProviderUnavailableError(self.name, "circuit open")
+        started = self.clock()
+        try:
+            outcome, body = await self._get_with_retries(self.base_url + path, started + self.deadline_seconds)
+        except BaseException:
+            self.breaker.release()
+            raise
+        provider_request_duration_seconds.observe(self.clock() - started, self.name)
+        provider_requests_total.inc(self.name, outcome)
+        if outcome == "failed":
+            self.breaker.record_failure()
+            raise ProviderUnavailableError(self.name, body)
+        self.breaker.record_success()
+        if outcome == "rejected":
+            raise ProviderUnavailableError(self.name, body)
+        return body
+
+    async def _get_with_retries(self, url: str, deadline: float) -> tuple[str, Any]:
+        reason = "deadline exceeded"
+        for attempt in range(self.retry.attempts):
+            if attempt:
+                delay = self.retry.delay(attempt - 1, self.rng)
+                if self.clock() + delay >= deadline:
+                    break
+                provider_retries_total.inc(self.name)
+                await self.sleep(delay)
+            timeout = min(self.timeout_seconds, deadline - self.clock())
+            try:
+                response = await self.client().get(url, timeout=timeout)
+            except httpx.TimeoutException:
+                reason = "timeout"
+                continue
+            except httpx.TransportError as exc:
+                reason = f"connection error ({type(exc).__name__})"
+                continue
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                reason = f"status {response.status_code}"
+                continue
+            if response.status_code == 404:
+                return "not_found", None
+            if response.status_code >= 400:
+                # The provider is up and refused this request; retrying or tripping the breaker would not help.
+                return "rejected", f"status {response.status_code}"
+            try:
+                return "ok", response.json()
+            except ValueError:
+                reason = "invalid JSON body"
+        return "failed", reason
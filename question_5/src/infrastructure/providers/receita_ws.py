@@ -0,0 +1,23 @@
+from src.domain import CnpjProviderPort
+from src.domain.entities import AddressEntity
+from src.infrastructure.providers.provider_client import ProviderClient
+
+
+class ReceitaWsCnpjProvider(CnpjProviderPort):
+    """Registered company addresses from ReceitaWS's ``GET /v1/cnpj/{cnpj}``."""
+
+    def __init__(self, client: ProviderClient) -> None:
+        self.client = client
+
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        company = await self.client.get_json(f"/{cnpj}")
+        # Unknown and malformed CNPJs come back as a 200 with ``{"status": "ERROR", "message": ...}``.
+        if company is None or company.get("status") == "ERROR":
+            return None
+        return AddressEntity(
+            cep="".join(filter(str.isdigit, company.get("cep") or "")),
+            street=company.get("logradouro") or "",
+            district=company.get("bairro") or "",
+            city=company.get("municipio") or "",
+            state=company.get("uf") or "",
+        )
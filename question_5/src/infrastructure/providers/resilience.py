@@ -0,0 +1,74 @@
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    attempts: int = 3
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 1.0
+
+    def delay(self, retry: int, rng: Callable[[], float] = random.random) -> float:
+        """Seconds to wait before retry number ``retry`` (0-based).
+
+        Full jitter: a uniform draw below the exponential backoff, so clients that failed together
+        do not retry together.
+        """
+        return rng() * min(self.max_delay_seconds, self.base_delay_seconds * 2**retry)
+
+
+class CircuitBreaker:
+    """Stops calling a provider after ``failure_threshold`` failed lookups in a row.
+
+    While open, calls are refused at once. After ``reset_timeout_seconds`` one trial call is let
+    through (half-open): its success closes the breaker, its failure opens it for another period.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._trial_running or self.clock() - self._opened_at >= self.reset_timeout_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self._trial_running:
+            return False
+        self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_running or (self._opened_at is None and self.failures >= self.failure_threshold):
+            self.opened += 1
+            self._opened_at = self.clock()
+        self._trial_running = False
+
+    def release(self) -> None:
+        """Ends a call that neither succeeded nor failed (it was cancelled), freeing the trial slot."""
+        self._trial_running = False
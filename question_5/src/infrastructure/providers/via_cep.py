@@ -0,0 +1,23 @@
+from src.domain import CepProviderPort
+from src.domain.entities import AddressEntity
+from src.infrastructure.providers.provider_client import ProviderClient
+
+
+class ViaCepProvider(CepProviderPort):
+    """CEP addresses from ViaCEP's ``GET /ws/{cep}/json/``."""
+
+    def __init__(self, client: ProviderClient) -> None:
+        self.client = client
+
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        address = await self.client.get_json(f"/{cep}/json/")
+        # An unknown CEP is a 200 carrying ``{"erro": true}`` (``"true"`` on newer deployments).
+        if address is None or address.get("erro"):
+            return None
+        return AddressEntity(
+            cep="".join(filter(str.isdigit, address.get("cep") or "")),
+            street=address.get("logradouro") or "",
+            district=address.get("bairro") or "",
+            city=address.get("localidade") or "",
+            state=address.get("uf") or "",
+        )
@@ -0,0 +1,165 @@
+"""Pre-forking launcher: ``python -m src.launcher --host 0.0.0.0 --port 8000``.
+
+The parent imports the application once and binds the listening socket. It then freezes
+everything allocated so far out of the garbage collector and forks ``WEB_WORKERS`` uvicorn
+workers that share the socket. Frozen objects are never touched by a collection, so their pages
+stay shared copy-on-write between the workers instead of being copied into each one. The parent
+opens no database connections. Each worker creates its engine in the lifespan, after the fork,
+with its share of ``DATABASE_MAX_CONNECTIONS``.
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+import uvicorn
+
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.logging import log_writer
+
+logger = structlog.get_logger(__name__)
+
+
+def worker_settings(settings: Settings, workers: int, cpu_count: int | None = None) -> dict[str, Any]:
+    """Per-worker overrides that keep the whole process group within the global budgets."""
+    # Every worker also holds LISTEN connections outside its pool: the role cache's and the outbox relay's.
+    listeners = 2 if settings.OUTBOX_RELAY_ENABLED else 1
+    share = max((settings.DATABASE_MAX_CONNECTIONS - listeners * workers) // workers, 1)
+    return {
+        "DATABASE_POOL_SIZE": share,
+        "DATABASE_MAX_OVERFLOW": 0,
+        "DATABASE_WARM_UP_CONNECTIONS": min(settings.DATABASE_WARM_UP_CONNECTIONS, share),
+        "HASHING_WORKERS": settings.HASHING_WORKERS or max((cpu_count or os.cpu_count() or 1) // workers, 1),
+    }
+
+
+class WorkerSupervisor:
+    """Forks ``workers`` processes running ``run_worker(index)`` and replaces any that exit.
+
+    A worker that dies within ``min_uptime_seconds`` of starting is restarted only after
+    ``restart_delay_seconds``, so a crash loop (for example, the database being down) does not spin.
+    """
+
+    def __init__(
+        self,
+        run_worker: Callable[[int], None],
+        workers: int,
+        *,
+        min_uptime_seconds: float = 5.0,
+        restart_delay_seconds: float = 1.0,
+    ) -> None:
+        self.run_worker = run_worker
+        self.workers = workers
+        self.min_uptime_seconds = min_uptime_seconds
+        self.restart_delay_seconds = restart_delay_seconds
+        self.restarts = 0
+        self._children: dict[int, tuple[int, float]] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        for index in range(self.workers):
+            self._spawn(index)
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index, started = self._children.pop(pid)
+            if self._stopping:
+                continue
+            logger.warning(
+                "launcher.worker_exited", worker=index, pid=pid, exit_code=os.waitstatus_to_exitcode(status)
+            )
+            if time.monotonic() - started < self.min_uptime_seconds:
+                time.sleep(self.restart_delay_seconds)
+            if not self._stopping:
+                self.restarts += 1
+                self._spawn(index)
+
+    def stop(self, *_: Any) -> None:
+        self._stopping = True
+        for pid in tuple(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_child(index)
+        self._children[pid] = (index, time.monotonic())
+        logger.info("launcher.worker_started", worker=index, pid=pid)
+
+    def _run_child(self, index: int) -> None:
+        exit_code = 0
+        try:
+            # The parent's handlers would make a SIGTERM to this worker stop the whole group.
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            gc.enable()
+            self.run_worker(index)
+        except BaseException:
+            logger.exception("launcher.worker_crashed", worker=index)
+            exit_code = 1
+        finally:
+            # Never return into the parent's stack; skip its atexit handlers as well.
+            os._exit(exit_code)
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(sock: socket.socket, overrides: dict[str, Any]) -> None:
+    from src.main import app
+
+    settings = get_settings()
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    try:
+        uvicorn.Server(uvicorn.Config(app, lifespan="on", log_config=None)).run(sockets=[sock])
+    finally:
+        # The worker leaves through os._exit, which skips the atexit flush.
+        log_writer.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the API in several pre-forked uvicorn workers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # Garbage collection stays off while the application is imported, so the objects created then
+    # are not moved between generations (touching their pages) before they are frozen.
+    gc.disable()
+    import src.main  # noqa: F401
+
+    settings = get_settings()
+    workers = args.workers or settings.WEB_WORKERS or os.cpu_count() or 1
+    overrides = worker_settings(settings, workers)
+    sock = bind_socket(args.host, args.port)
+    gc.freeze()
+
+    supervisor = WorkerSupervisor(lambda _: serve(sock, overrides), workers)
+    signal.signal(signal.SIGTERM, supervisor.stop)
+    signal.signal(signal.SIGINT, supervisor.stop)
+    logger.info("launcher.starting", workers=workers, host=args.host, port=args.port, **overrides)
+    supervisor.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,126 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import AsyncIterator
+
+import asyncpg
+import structlog
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 
 from src.application.exceptions import InternalServerError, RFC7807Exception
+from src.application.security import hashing_capacity, shutdown_hashing_executor, start_hashing_executor
+from src.infrastructure.config import Settings, get_settings
 from src.infrastructure.logging import configure_logging
-from src.presentation import api_v1_router
+from src.infrastructure.metrics import registry
+from src.infrastructure.persistence.database import AsyncSessionLocal, dispose_database, init_database
+from src.infrastructure.persistence.repositories import SqlUserRepository
+from src.infrastructure.persistence.warm_up import warm_up_pool, warm_up_validators
+from src.infrastructure.profiling import ProfileWriter, StackSampler
+from src.infrastructure.providers import close_http_client, init_http_client
+from src.presentation import api_v1_router, deps, metrics_router
+from src.presentation.middleware import (
+    AdaptiveConcurrencyLimit,
+    AdmissionControlMiddleware,
+    ProfilingMiddleware,
+    ReadYourWritesMiddleware,
+    RequestMetricsMiddleware,
+)
 
 configure_logging()
+logger = structlog.get_logger(__name__)
+
+
+async def rebuild_email_filter() -> None:
+    if deps.email_filter is None:
+        return
+    try:
+        async with AsyncSessionLocal() as session:
+            await deps.email_filter.rebuild(SqlUserRepository(session).stream_emails())
+    except Exception:
+        logger.exception("email_filter.rebuild_failed")
+
+
+async def cancel_task(task: asyncio.Task) -> None:
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    # Each cleanup is registered before its resource starts (all of them are safe to run on a
+    # resource that never started), so a failure at any later step, such as the database being
+    # unreachable during warm-up, tears down everything started before it, in reverse order.
+    async with AsyncExitStack() as resources:
+        resources.push_async_callback(dispose_database)
+        engine = init_database()
+        # Waits for the hashing processes to exit, so it runs off the event loop.
+        resources.push_async_callback(asyncio.to_thread, shutdown_hashing_executor)
+        start_hashing_executor(settings.HASHING_WORKERS)
+        resources.push_async_callback(close_http_client)
+        init_http_client(settings)
+        resources.push_async_callback(deps.role_cache.stop)
+        await deps.role_cache.start(lambda: asyncpg.connect(settings.asyncpg_dsn))
+        if deps.cep_cache is not None:
+            resources.push_async_callback(deps.cep_cache.stop)
+        if deps.outbox_relay is not None:
+            resources.push_async_callback(deps.outbox_relay.stop)
+            await deps.outbox_relay.start(lambda: asyncpg.connect(settings.asyncpg_dsn))
+        for purger in deps.retention_purgers:
+            resources.push_async_callback(purger.stop)
+            await purger.start()
+        if deps.user_write_coalescer is not None:
+            resources.push_async_callback(deps.user_write_coalescer.stop)
+        resources.push_async_callback(cancel_task, asyncio.create_task(rebuild_email_filter()))
+        await warm_up_pool(engine, settings.DATABASE_WARM_UP_CONNECTIONS)
+        warm_up_validators()
+        application.state.ready = True
+        try:
+            yield
+        finally:
+            application.state.ready = False
+
+
+def add_admission_control(application: FastAPI, settings: Settings) -> None:
+    # The capacity is read on every adjustment: the launcher sizes both pools per worker after import.
+    limit = AdaptiveConcurrencyLimit(
+        lambda: settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW + hashing_capacity(),
+        latency_target_seconds=settings.ADMISSION_LATENCY_TARGET_MS / 1000,
+        max_queued=settings.ADMISSION_MAX_QUEUED,
+    )
+    application.add_middleware(
+        AdmissionControlMiddleware,
+        limit=limit,
+        routes={("POST", "/v1/users"), ("POST", "/v1/users:batch")},
+        queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000,
+        retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+    registry.callback(
+        "admission_concurrency_limit", "Current adaptive limit on in-flight creates.", lambda: limit.limit
+    )
+    registry.callback("admission_in_flight", "Create requests currently admitted.", lambda: limit.in_flight)
+    registry.callback("admission_queued", "Create requests waiting for an admission slot.", lambda: limit.queued)
 
 
 def create_application() -> FastAPI:
-    application = FastAPI(title="Shipay challenge Service", version="1.0.0")
+    application = FastAPI(title="Shipay challenge Service", version="1.0.0", lifespan=lifespan)
     application.include_router(api_v1_router, prefix="/v1")
+    application.include_router(metrics_router)
+    settings = get_settings()
+    if settings.ADMISSION_CONTROL_ENABLED:
+        add_admission_control(application, settings)
+    application.add_middleware(RequestMetricsMiddleware)
+    if settings.DATABASE_REPLICA_URLS:
+        application.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.DATABASE_READ_YOUR_WRITES_SECONDS)
+    if settings.PROFILING_ENABLED:
+        application.add_middleware(
+            ProfilingMiddleware,
+            sampler=StackSampler(settings.PROFILING_INTERVAL_MS / 1000),
+            writer=ProfileWriter(settings.PROFILING_DIRECTORY, max_profiles=settings.PROFILING_MAX_PROFILES),
+            sample_rate=settings.PROFILING_SAMPLE_RATE,
+            secret=settings.PROFILING_SECRET,
+        )
 
     @application.get("/", include_in_schema=False)
     async def redirect_to_docs():
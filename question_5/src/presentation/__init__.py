@@ -1,3 +1,3 @@
-from src.presentation.endpoints import api_v1_router
+from src.presentation.endpoints import api_v1_router, metrics_router
 
-__all__ = ["api_v1_router"]
+__all__ = ["api_v1_router", "metrics_router"]
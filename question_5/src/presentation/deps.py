@@ -3,10 +3,305 @@ from collections.abc import AsyncIterator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.use_cases import CreateUserUseCase
-from src.infrastructure.persistence.database import get_session
-from src.infrastructure.persistence.repositories import SqlRoleRepository, SqlUserRepository
+from src.application.use_cases import (
+    CreateUsersBatchUseCase,
+    CreateUserUseCase,
+    GetUserReportUseCase,
+    IdempotentCreateUserUseCase,
+    InFlightRequests,
+    ListUsersUseCase,
+    ValidateCompanyAddressUseCase,
+)
+from src.domain import MessageBrokerPort
+from src.domain.repositories import RoleRepositoryPort
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.messaging import FileBroker, InMemoryBroker, OutboxRelay, ReportingConsumer
+from src.infrastructure.metrics import observe_create_user_stage, registry
+from src.infrastructure.persistence.database import AsyncSessionLocal, get_session
+from src.infrastructure.persistence.email_bloom_filter import EmailBloomFilter
+from src.infrastructure.persistence.repositories import (
+    CachedRoleRepository,
+    CoalescingUserRepository,
+    SqlIdempotencyRepository,
+    SqlUserReportRepository,
+    SqlUserRepository,
+    UserWriteCoalescer,
+)
+from src.infrastructure.persistence.retention import RetentionPurger
 from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.providers import (
+    BrasilApiCnpjProvider,
+    CachedCepProvider,
+    CepDataset,
+    CircuitBreaker,
+    HedgeBudget,
+    HedgedCnpjProvider,
+    OfflineCepProvider,
+    ProviderClient,
+    ReceitaWsCnpjProvider,
+    RetryPolicy,
+    ViaCepProvider,
+    get_http_client,
+)
+
+settings = get_settings()
+
+role_cache = CachedRoleRepository(AsyncSessionLocal, ttl_seconds=settings.ROLE_CACHE_TTL_SECONDS)
+email_filter = (
+    EmailBloomFilter(settings.EMAIL_BLOOM_FILTER_CAPACITY, settings.EMAIL_BLOOM_FILTER_FALSE_POSITIVE_RATE)
+    if settings.EMAIL_BLOOM_FILTER_ENABLED
+    else None
+)
+user_write_coalescer = (
+    UserWriteCoalescer(
+        AsyncSessionLocal,
+        max_batch_size=settings.USER_WRITE_COALESCING_MAX_BATCH,
+        max_delay_seconds=settings.USER_WRITE_COALESCING_MAX_DELAY_MS / 1000,
+        email_filter=email_filter,
+    )
+    if settings.USER_WRITE_COALESCING_ENABLED
+    else None
+)
+idempotency_in_flight = InFlightRequests()
+idempotency_purger = RetentionPurger(
+    "idempotency_keys",
+    AsyncSessionLocal,
+    lambda session, limit: SqlIdempotencyRepository(session).purge_expired(limit),
+    batch_size=settings.IDEMPOTENCY_PURGE_BATCH_SIZE,
+    interval_seconds=settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+)
+report_processed_events_purger = RetentionPurger(
+    "report_processed_events",
+    AsyncSessionLocal,
+    lambda session, limit: SqlUserReportRepository(session).purge_processed_events(
+        settings.REPORT_PROCESSED_EVENTS_RETENTION_SECONDS, limit
+    ),
+    batch_size=settings.REPORT_PROCESSED_EVENTS_PURGE_BATCH_SIZE,
+    interval_seconds=settings.REPORT_PROCESSED_EVENTS_PURGE_INTERVAL_SECONDS,
+)
+retention_purgers = [idempotency_purger, report_processed_events_purger]
+
+
+def create_provider_client(name: str, base_url: str, timeout_seconds: float) -> ProviderClient:
+    return ProviderClient(
+        name,
+        base_url,
+        get_http_client,
+        timeout_seconds=timeout_seconds,
+        deadline_seconds=settings.PROVIDER_DEADLINE_SECONDS,
+        retry=RetryPolicy(
+            attempts=settings.PROVIDER_RETRY_ATTEMPTS,
+            base_delay_seconds=settings.PROVIDER_RETRY_BASE_DELAY_MS / 1000,
+        ),
+        breaker=CircuitBreaker(
+            failure_threshold=settings.PROVIDER_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.PROVIDER_CIRCUIT_RESET_SECONDS,
+        ),
+    )
+
+
+# The breakers live as long as the worker, so every request sees the state earlier ones left.
+cnpj_provider_client = create_provider_client(
+    "cnpj", settings.CNPJ_PROVIDER_URL, settings.CNPJ_PROVIDER_TIMEOUT_SECONDS
+)
+cep_provider_client = create_provider_client("cep", settings.CEP_PROVIDER_URL, settings.CEP_PROVIDER_TIMEOUT_SECONDS)
+cnpj_backup_provider_client = create_provider_client(
+    "cnpj_backup", settings.CNPJ_BACKUP_PROVIDER_URL, settings.CNPJ_BACKUP_PROVIDER_TIMEOUT_SECONDS
+)
+cnpj_hedging = (
+    HedgedCnpjProvider(
+        BrasilApiCnpjProvider(cnpj_provider_client),
+        ReceitaWsCnpjProvider(cnpj_backup_provider_client),
+        budget=HedgeBudget(settings.CNPJ_HEDGE_BUDGET_RATIO),
+        min_delay_seconds=settings.CNPJ_HEDGE_MIN_DELAY_MS / 1000,
+        max_delay_seconds=settings.CNPJ_HEDGE_MAX_DELAY_MS / 1000,
+    )
+    if settings.CNPJ_HEDGING_ENABLED
+    else None
+)
+cnpj_provider = BrasilApiCnpjProvider(cnpj_provider_client) if cnpj_hedging is None else cnpj_hedging
+cep_cache = (
+    CachedCepProvider(
+        ViaCepProvider(cep_provider_client),
+        AsyncSessionLocal,
+        max_entries=settings.CEP_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CEP_CACHE_TTL_SECONDS,
+        negative_ttl_seconds=settings.CEP_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+    if settings.CEP_CACHE_ENABLED
+    else None
+)
+cep_network_provider = ViaCepProvider(cep_provider_client) if cep_cache is None else cep_cache
+# Mapped before the launcher forks, so every worker shares the same page-cache pages.
+cep_dataset = CepDataset(settings.CEP_DATASET_PATH) if settings.CEP_DATASET_PATH else None
+offline_cep_provider = OfflineCepProvider(cep_dataset, cep_network_provider) if cep_dataset is not None else None
+cep_provider = cep_network_provider if offline_cep_provider is None else offline_cep_provider
+
+
+def create_message_broker(settings: Settings) -> MessageBrokerPort:
+    if settings.OUTBOX_BROKER == "file":
+        return FileBroker(
+            settings.OUTBOX_FILE_PATH, max_bytes=settings.OUTBOX_FILE_MAX_BYTES, backups=settings.OUTBOX_FILE_BACKUPS
+        )
+    return InMemoryBroker()
+
+
+# The reporting consumer is fed by the relay itself, so it runs whichever broker is configured.
+reporting_consumer = ReportingConsumer() if settings.REPORTING_CONSUMER_ENABLED else None
+
+
+outbox_relay = (
+    OutboxRelay(
+        AsyncSessionLocal,
+        create_message_broker(settings),
+        consumers=[reporting_consumer.handle] if reporting_consumer is not None else [],
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval_seconds=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    )
+    if settings.OUTBOX_RELAY_ENABLED
+    else None
+)
+
+registry.callback(
+    "role_cache_requests_total",
+    "Role cache lookups by result.",
+    lambda: [(("hit",), role_cache.hits), (("miss",), role_cache.misses)],
+    label_names=("result",),
+    metric_type="counter",
+)
+registry.callback(
+    "retention_purged_rows_total",
+    "Rows deleted by the background retention purgers.",
+    lambda: [((purger.table,), purger.purged) for purger in retention_purgers],
+    label_names=("table",),
+    metric_type="counter",
+)
+registry.callback(
+    "retention_purge_failures_total",
+    "Retention purge batches that failed and were retried at the next interval.",
+    lambda: [((purger.table,), purger.failures) for purger in retention_purgers],
+    label_names=("table",),
+    metric_type="counter",
+)
+registry.callback(
+    "provider_circuit_open",
+    "1 while the provider's circuit breaker refuses calls (open or half-open).",
+    lambda: [
+        ((client.name,), float(client.breaker.state != "closed"))
+        for client in (cnpj_provider_client, cnpj_backup_provider_client, cep_provider_client)
+    ],
+    label_names=("provider",),
+)
+if cnpj_hedging is not None:
+    registry.callback(
+        "cnpj_hedge_requests_total",
+        "Backup CNPJ lookups: hedges sent, hedges the backup won, hedges refused by the budget, failovers.",
+        lambda: [
+            (("sent",), cnpj_hedging.hedges),
+            (("won",), cnpj_hedging.hedge_wins),
+            (("denied",), cnpj_hedging.hedges_denied),
+            (("failover",), cnpj_hedging.failovers),
+        ],
+        label_names=("outcome",),
+        metric_type="counter",
+    )
+    registry.callback(
+        "cnpj_hedge_delay_seconds", "Current wait before a CNPJ lookup is hedged.", lambda: cnpj_hedging.hedge_delay
+    )
+    registry.callback(
+        "cnpj_provider_latency_p95_seconds",
+        "p95 latency of the recent calls to each CNPJ provider.",
+        lambda: [
+            ((name,), digest.quantile(0.95) or 0.0)
+            for name, digest in (("primary", cnpj_hedging.primary_latency), ("backup", cnpj_hedging.backup_latency))
+        ],
+        label_names=("provider",),
+    )
+if cep_cache is not None:
+    registry.callback(
+        "cep_cache_requests_total",
+        "CEP cache lookups by result: served from memory, from the cep_addresses table, or fetched.",
+        lambda: [
+            (("memory_hit",), cep_cache.memory_hits),
+            (("database_hit",), cep_cache.database_hits),
+            (("miss",), cep_cache.misses),
+        ],
+        label_names=("result",),
+        metric_type="counter",
+    )
+    registry.callback(
+        "cep_cache_hit_ratio", "Share of CEP lookups answered by either cache tier.", lambda: cep_cache.hit_ratio
+    )
+    registry.callback("cep_cache_entries", "CEPs held in the in-process LRU.", lambda: len(cep_cache))
+    registry.callback(
+        "cep_cache_evictions_total",
+        "CEPs dropped from the in-process LRU to stay within CEP_CACHE_MAX_ENTRIES.",
+        lambda: cep_cache.evictions,
+        metric_type="counter",
+    )
+    registry.callback(
+        "cep_cache_stale_served_total",
+        "Stale CEP entries served while a background refresh ran.",
+        lambda: cep_cache.stale_served,
+        metric_type="counter",
+    )
+    registry.callback(
+        "cep_cache_refresh_failures_total",
+        "Background CEP refreshes that failed, leaving the stale entry in place.",
+        lambda: cep_cache.refresh_failures,
+        metric_type="counter",
+    )
+if offline_cep_provider is not None:
+    registry.callback(
+        "cep_dataset_requests_total",
+        "CEP lookups by result: answered by the offline dataset, or passed on to the cache and provider.",
+        lambda: [(("hit",), offline_cep_provider.hits), (("miss",), offline_cep_provider.misses)],
+        label_names=("result",),
+        metric_type="counter",
+    )
+    registry.callback("cep_dataset_entries", "CEPs in the offline dataset.", lambda: len(offline_cep_provider.dataset))
+if outbox_relay is not None:
+    registry.callback(
+        "outbox_events_relayed_total",
+        "Outbox events published to the broker by this worker.",
+        lambda: outbox_relay.relayed,
+        metric_type="counter",
+    )
+    registry.callback(
+        "outbox_relay_failures_total",
+        "Outbox batches rolled back because claiming or publishing failed.",
+        lambda: outbox_relay.failures,
+        metric_type="counter",
+    )
+if email_filter is not None:
+    registry.callback(
+        "email_filter_ready", "1 once the email Bloom filter has been rebuilt.", lambda: email_filter.ready
+    )
+    registry.callback(
+        "email_filter_lookups_total",
+        "Email Bloom filter lookups by answer; false positives were confirmed absent by the database.",
+        lambda: [
+            (("negative",), email_filter.negatives),
+            (("positive",), email_filter.positives),
+            (("false_positive",), email_filter.false_positives),
+        ],
+        label_names=("answer",),
+        metric_type="counter",
+    )
+    registry.callback(
+        "email_filter_false_positive_rate",
+        "Share of absent emails the filter failed to rule out: observed so far, and expected from its fill.",
+        lambda: [
+            (("observed",), email_filter.observed_false_positive_rate),
+            (("expected",), email_filter.expected_false_positive_rate),
+        ],
+        label_names=("kind",),
+    )
+    registry.callback(
+        "email_filter_memory_bytes",
+        "Bytes held by the email Bloom filter's bit array.",
+        lambda: email_filter.memory_bytes,
+    )
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
@@ -14,12 +309,14 @@ async def get_db() -> AsyncIterator[AsyncSession]:
         yield session
 
 
-async def get_role_repository(db: AsyncSession = Depends(get_db)) -> SqlRoleRepository:
-    return SqlRoleRepository(db)
+async def get_role_repository() -> RoleRepositoryPort:
+    return role_cache
 
 
 async def get_user_repository(db: AsyncSession = Depends(get_db)) -> SqlUserRepository:
-    return SqlUserRepository(db)
+    if user_write_coalescer is not None:
+        return CoalescingUserRepository(db, user_write_coalescer, email_filter)
+    return SqlUserRepository(db, email_filter)
 
 
 async def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> SqlAlchemyUnitOfWork:
@@ -28,13 +325,14 @@ async def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> SqlAlchemyUnit
 
 async def get_create_user_use_case(
     user_repository: SqlUserRepository = Depends(get_user_repository),
-    role_repository: SqlRoleRepository = Depends(get_role_repository),
+    role_repository: RoleRepositoryPort = Depends(get_role_repository),
     unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateUserUseCase:
     return CreateUserUseCase(
         user_repository=user_repository,
         role_repository=role_repository,
         unit_of_work=unit_of_work,
+        observe_stage=observe_create_user_stage,
     )
 
 
@@ -42,3 +340,57 @@ async def get_user_service(
     use_case: CreateUserUseCase = Depends(get_create_user_use_case),
 ) -> CreateUserUseCase:
     return use_case
+
+
+async def get_idempotent_create_user_use_case(
+    use_case: CreateUserUseCase = Depends(get_user_service),
+    role_repository: RoleRepositoryPort = Depends(get_role_repository),
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    db: AsyncSession = Depends(get_db),
+) -> IdempotentCreateUserUseCase:
+    # The coalescer commits on its own connection; the stored response must commit with the user.
+    keyed_use_case = (
+        CreateUserUseCase(
+            user_repository=SqlUserRepository(db, email_filter),
+            role_repository=role_repository,
+            unit_of_work=unit_of_work,
+            observe_stage=observe_create_user_stage,
+        )
+        if user_write_coalescer is not None
+        else None
+    )
+    return IdempotentCreateUserUseCase(
+        use_case,
+        SqlIdempotencyRepository(db),
+        idempotency_in_flight,
+        ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+        keyed_create_user_use_case=keyed_use_case,
+    )
+
+
+async def get_create_users_batch_use_case(
+    user_repository: SqlUserRepository = Depends(get_user_repository),
+    role_repository: RoleRepositoryPort = Depends(get_role_repository),
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> CreateUsersBatchUseCase:
+    return CreateUsersBatchUseCase(
+        user_repository=user_repository,
+        role_repository=role_repository,
+        unit_of_work=unit_of_work,
+    )
+
+
+async def get_list_users_use_case(
+    user_repository: SqlUserRepository = Depends(get_user_repository),
+) -> ListUsersUseCase:
+    return ListUsersUseCase(user_repository=user_repository)
+
+
+async def get_user_report_use_case(db: AsyncSession = Depends(get_db)) -> GetUserReportUseCase:
+    return GetUserReportUseCase(SqlUserReportRepository(db))
+
+
+async def get_validate_company_address_use_case() -> ValidateCompanyAddressUseCase:
+    return ValidateCompanyAddressUseCase(
+        cnpj_provider, cep_provider, min_similarity=settings.ADDRESS_MATCH_MIN_SIMILARITY
+    )
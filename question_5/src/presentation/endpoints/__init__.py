@@ -1,11 +1,16 @@
 from fastapi import APIRouter
 
+from .addresses import addresses_router
 from .health import health_router
+from .metrics import metrics_router
+from .reports import reports_router
 from .users import users_router
 
 api_v1_router = APIRouter()
 api_v1_router.include_router(health_router)
 api_v1_router.include_router(users_router)
+api_v1_router.include_router(reports_router)
+api_v1_router.include_router(addresses_router)
 
 
-__all__ = ["api_v1_router"]
+__all__ = ["api_v1_router", "metrics_router"]
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, status
+
+from src.application.schemas import AddressValidationInput, AddressValidationOutput
+from src.application.use_cases import ValidateCompanyAddressUseCase
+from src.presentation import deps
+
+addresses_router = APIRouter(prefix="/address-validations", tags=["📍 Addresses"])
+
+
+@addresses_router.post("", response_model=AddressValidationOutput, status_code=status.HTTP_200_OK)
+async def validate_company_address(
+    payload: AddressValidationInput,
+    use_case: ValidateCompanyAddressUseCase = Depends(deps.get_validate_company_address_use_case),
+):
+    return await use_case.validate(payload)
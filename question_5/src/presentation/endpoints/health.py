@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 health_router = APIRouter(tags=["❤️ Health"])
 
@@ -6,3 +7,11 @@ health_router = APIRouter(tags=["❤️ Health"])
 @health_router.get("/health", summary="Health check")
 async def health_check():
     return {"status": "ok"}
+
+
+@health_router.get("/ready", summary="Readiness check")
+async def readiness_check(request: Request):
+    # Set by the lifespan once the pool is warm, and cleared again as soon as shutdown starts.
+    if getattr(request.app.state, "ready", False):
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "starting"})
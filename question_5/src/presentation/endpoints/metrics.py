@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.infrastructure.metrics import CONTENT_TYPE, registry
+
+metrics_router = APIRouter(tags=["📈 Metrics"])
+
+
+@metrics_router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
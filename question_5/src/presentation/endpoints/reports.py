@@ -0,0 +1,17 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.application.schemas import UserReport, UserReportQuery
+from src.application.use_cases import GetUserReportUseCase
+from src.presentation import deps
+
+reports_router = APIRouter(prefix="/reports", tags=["📊 Reports"])
+
+
+@reports_router.get("/users", response_model=UserReport, status_code=status.HTTP_200_OK)
+async def user_report(
+    query: Annotated[UserReportQuery, Query()],
+    use_case: GetUserReportUseCase = Depends(deps.get_user_report_use_case),
+):
+    return await use_case.get_report(query)
@@ -1,15 +1,41 @@
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
 
-from src.application.schemas import UserCreateInput, UserOutput
-from src.application.use_cases import CreateUserUseCase
+from fastapi import APIRouter, Depends, Header, Query, status
+
+from src.application.schemas import (
+    UserBatchCreateInput,
+    UserBatchOutput,
+    UserCreateInput,
+    UserListQuery,
+    UserOutput,
+    UserPage,
+)
+from src.application.use_cases import CreateUsersBatchUseCase, IdempotentCreateUserUseCase, ListUsersUseCase
 from src.presentation import deps
 
 users_router = APIRouter(prefix="/users", tags=["🧑🏽 Users"])
 
 
+@users_router.get("", response_model=UserPage, status_code=status.HTTP_200_OK)
+async def list_users(
+    query: Annotated[UserListQuery, Query()],
+    use_case: ListUsersUseCase = Depends(deps.get_list_users_use_case),
+):
+    return await use_case.list_users(query)
+
+
 @users_router.post("", response_model=UserOutput, status_code=status.HTTP_201_CREATED)
 async def create_user(
     payload: UserCreateInput,
-    use_case: CreateUserUseCase = Depends(deps.get_user_service),
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key", min_length=1, max_length=255)] = None,
+    use_case: IdempotentCreateUserUseCase = Depends(deps.get_idempotent_create_user_use_case),
+):
+    return await use_case.create_user(payload, idempotency_key)
+
+
+@users_router.post(":batch", response_model=UserBatchOutput, status_code=status.HTTP_200_OK)
+async def create_users_batch(
+    payload: UserBatchCreateInput,
+    use_case: CreateUsersBatchUseCase = Depends(deps.get_create_users_batch_use_case),
 ):
-    return await use_case.create_user(payload)
+    return await use_case.create_users(payload)
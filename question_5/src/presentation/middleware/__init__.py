@@ -0,0 +1,12 @@
+from .admission_control import AdaptiveConcurrencyLimit, AdmissionControlMiddleware
+from .profiling import ProfilingMiddleware
+from .read_your_writes import ReadYourWritesMiddleware
+from .request_metrics import RequestMetricsMiddleware
+
+__all__ = [
+    "AdaptiveConcurrencyLimit",
+    "AdmissionControlMiddleware",
+    "ProfilingMiddleware",
+    "ReadYourWritesMiddleware",
+    "RequestMetricsMiddleware",
+]
@@ -0,0 +1,161 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Collection
+from time import perf_counter
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.exceptions import ServiceOverloadedError
+from src.infrastructure.metrics import admission_requests_total
+
+
+class AdaptiveConcurrencyLimit:
+    """AIMD limit on concurrent requests, capped by ``capacity()``.
+
+    Each request that finishes within ``latency_target_seconds`` while the limit was in use adds
+    ``1 / limit`` (about one slot per round of requests). A slower request, or one that failed with a
+    5xx, multiplies the limit by ``backoff_ratio``, at most once per latency target so a single burst
+    of slow responses counts as one congestion signal. Requests over the limit wait in a FIFO queue
+    of at most ``max_queued`` entries; a released slot is handed straight to the oldest waiter.
+    """
+
+    def __init__(
+        self,
+        capacity: Callable[[], int],
+        *,
+        latency_target_seconds: float,
+        min_limit: int = 1,
+        max_queued: int = 100,
+        backoff_ratio: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.latency_target_seconds = latency_target_seconds
+        self.min_limit = min_limit
+        self.max_queued = max_queued
+        self.backoff_ratio = backoff_ratio
+        self.clock = clock
+        self.in_flight = 0
+        self._limit = float(max(capacity(), min_limit))
+        self._last_decrease = float("-inf")
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return max(min(int(self._limit), self.capacity()), self.min_limit)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> bool:
+        """Take a slot, waiting up to ``timeout`` seconds for one; ``False`` means the request should be shed."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        if timeout <= 0 or len(self._waiters) >= self.max_queued:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=timeout)
+        except asyncio.CancelledError:
+            if _granted(waiter):
+                self._free_slot()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        # The slot may have been handed over just as the deadline passed; keep it then.
+        if _granted(waiter):
+            return True
+        self._waiters.remove(waiter)
+        return False
+
+    def release(self, latency_seconds: float, *, failed: bool = False) -> None:
+        saturated = self.in_flight * 2 >= self.limit
+        self._adjust(latency_seconds, failed, saturated)
+        self._free_slot()
+
+    def _adjust(self, latency_seconds: float, failed: bool, saturated: bool) -> None:
+        if failed or latency_seconds > self.latency_target_seconds:
+            now = self.clock()
+            if now - self._last_decrease >= self.latency_target_seconds:
+                self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+                self._last_decrease = now
+        elif saturated:
+            self._limit = min(self._limit + 1 / self._limit, max(self.capacity(), self.min_limit))
+
+    def _free_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            waiter.set_result(None)
+            self.in_flight += 1
+
+
+def _granted(waiter: asyncio.Future[None]) -> bool:
+    return waiter.done() and not waiter.cancelled()
+
+
+class AdmissionControlMiddleware:
+    """Admits the ``routes`` (method, path) through ``limit`` and sheds the rest with a 503.
+
+    A request over the limit queues for at most ``queue_timeout_seconds``. If no slot frees up
+    by then, or the queue is full, it gets an RFC 7807 503 with ``Retry-After`` straight away,
+    instead of waiting on the pool or the hashing processes and slowing down everyone else.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limit: AdaptiveConcurrencyLimit,
+        routes: Collection[tuple[str, str]],
+        queue_timeout_seconds: float,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.app = app
+        self.limit = limit
+        self.routes = frozenset(routes)
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        queued = self.limit.in_flight >= self.limit.limit or self.limit.queued > 0
+        if not await self.limit.acquire(self.queue_timeout_seconds):
+            admission_requests_total.inc("shed")
+            await self._shed(scope, receive, send)
+            return
+        admission_requests_total.inc("queued" if queued else "admitted")
+
+        status_code = 500
+        started = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limit.release(perf_counter() - started, failed=status_code >= 500)
+
+    async def _shed(self, scope: Scope, receive: Receive, send: Send) -> None:
+        retry_after = max(self.retry_after_seconds, math.ceil(self.queue_timeout_seconds))
+        error = ServiceOverloadedError(retry_after)
+        response = JSONResponse(
+            status_code=error.status_code,
+            content=error.to_dict(instance=str(Request(scope).url)),
+            headers={"Retry-After": str(retry_after)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,82 @@
+import asyncio
+import random
+from collections.abc import Callable
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.profiling import ProfileSession, ProfileWriter, StackSampler, verify_profile_token
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+
+logger = structlog.get_logger(__name__)
+
+
+class ProfilingMiddleware:
+    """Samples the stacks of a random fraction of requests, plus any request with a valid signed token.
+
+    Only installed when ``PROFILING_ENABLED`` is set; requests that are not picked pay for one
+    ``random()`` call and, when a secret is configured, one header scan.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        sampler: StackSampler,
+        writer: ProfileWriter,
+        sample_rate: float = 0.0,
+        secret: str | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self.sampler = sampler
+        self.writer = writer
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.rng = rng
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        reason = self._profile_reason(scope) if scope["type"] == "http" else None
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession(asyncio.current_task(), reason)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        token = session.activate()
+        self.sampler.add(session)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.sampler.remove(session)
+            session.deactivate(token)
+            route = scope.get("route")
+            details = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route.path if route is not None else scope["path"],
+                "status": status_code,
+            }
+            try:
+                path = await asyncio.to_thread(self.writer.write, session, details)
+            except OSError:
+                logger.exception("profiling.write_failed")
+            else:
+                logger.info("profiling.captured", profile=str(path), **details)
+
+    def _profile_reason(self, scope: Scope) -> str | None:
+        if self.secret is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_TOKEN_HEADER:
+                    return "token" if verify_profile_token(value.decode("latin-1"), self.secret) else None
+        if self.sample_rate > 0 and self.rng() < self.sample_rate:
+            return "sampled"
+        return None
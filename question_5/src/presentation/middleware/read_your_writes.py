@@ -0,0 +1,51 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.persistence.routing import begin_read_consistency
+
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+
+
+class ReadYourWritesMiddleware:
+    """Keeps a client's reads on the primary for ``window_seconds`` after one of its requests wrote.
+
+    The deadline travels in a cookie, so any worker can honour it without shared state.
+    """
+
+    def __init__(self, app: ASGIApp, *, window_seconds: float) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        consistency = begin_read_consistency(_primary_until(scope, self.window_seconds))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and consistency.wrote:
+                deadline = time.time() + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_UNTIL_COOKIE}={deadline:.3f}; Max-Age={int(self.window_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _primary_until(scope: Scope, window_seconds: float) -> float:
+    try:
+        primary_until = float(HTTPConnection(scope).cookies.get(PRIMARY_UNTIL_COOKIE, 0.0))
+    except ValueError:
+        return 0.0
+    if not math.isfinite(primary_until):
+        return 0.0
+    # The cookie is client-controlled: no value may pin reads longer than a write just now would.
+    return min(primary_until, time.time() + window_seconds)
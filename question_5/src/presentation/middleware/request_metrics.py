@@ -0,0 +1,41 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics import http_request_duration_seconds, http_requests_total
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records request count and latency per route template (RED metrics).
+
+    Plain ASGI instead of ``BaseHTTPMiddleware`` so it adds no extra task or body buffering per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # FastAPI stores the matched route in the scope; its path keeps ids out of the label values.
+            route = scope.get("route")
+            route_path = route.path if route is not None else UNMATCHED_ROUTE
+            method = scope["method"]
+            http_request_duration_seconds.observe(perf_counter() - started, method, route_path)
+            http_requests_total.inc(method, route_path, str(status_code))
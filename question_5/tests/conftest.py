@@ -1,12 +1,17 @@
 import asyncio
+import math
 import os
 import sys
+import tempfile
 import uuid
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from time import perf_counter
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
@@ -17,8 +22,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# The settings refuse the file broker without a path; nothing the tests relay needs to be kept.
+os.environ.setdefault("OUTBOX_FILE_PATH", os.path.join(tempfile.gettempdir(), "shipay-test-outbox.jsonl"))
 
-TRUNCATE_CORE_TABLES_SQL = text("TRUNCATE TABLE user_claims, users, claims, roles RESTART IDENTITY CASCADE")
+
+TRUNCATE_CORE_TABLES_SQL = text(
+    "TRUNCATE TABLE cep_addresses, report_processed_events, user_daily_counts, outbox, idempotency_keys, user_claims, users, claims, roles RESTART IDENTITY CASCADE"
+)
 
 
 def _required_env(key: str) -> str:
@@ -41,6 +51,67 @@ def _test_database_name() -> str:
     return f"{_required_env('DATABASE_SCHEMA')}_test"
 
 
+# Multiplies every latency budget, so slow CI machines can relax them without touching the tests.
+# Coverage tracing (on by default through addopts) costs several times the untraced statement time.
+LATENCY_BUDGET_SCALE = float(os.getenv("LATENCY_BUDGET_SCALE", "4" if sys.gettrace() is not None else "1"))
+
+
+@dataclass
+class QueryCapture:
+    statements: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+class QueryBudget:
+    """Counts the SQL statements the test engine runs inside ``with query_budget(...)`` blocks.
+
+    On exit the block fails if it ran more than ``max_statements`` statements or took longer than
+    ``max_ms`` wall time. The failure message lists the statements, so an N+1 is easy to spot.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self._captures: list[QueryCapture] = []
+
+    def attach(self) -> None:
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def detach(self) -> None:
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        for capture in self._captures:
+            capture.statements.append(statement)
+
+    @contextmanager
+    def __call__(self, *, max_statements: int | None = None, max_ms: float | None = None) -> Iterator[QueryCapture]:
+        capture = QueryCapture()
+        self._captures.append(capture)
+        started = perf_counter()
+        try:
+            yield capture
+        finally:
+            capture.elapsed_ms = (perf_counter() - started) * 1000
+            self._captures.remove(capture)
+        if max_statements is not None:
+            listing = "\n".join(f"  {index}. {sql}" for index, sql in enumerate(capture.statements, 1))
+            assert len(capture.statements) <= max_statements, (
+                f"{len(capture.statements)} statements, budget is {max_statements}:\n{listing}"
+            )
+        if max_ms is not None:
+            assert capture.elapsed_ms <= max_ms * LATENCY_BUDGET_SCALE, (
+                f"took {capture.elapsed_ms:.2f} ms, budget is {max_ms * LATENCY_BUDGET_SCALE:.2f} ms"
+            )
+
+
+def assert_p95_within(durations_ms: Sequence[float], budget_ms: float) -> None:
+    ordered = sorted(durations_ms)
+    p95 = ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
+    assert p95 <= budget_ms * LATENCY_BUDGET_SCALE, (
+        f"p95 {p95:.2f} ms over {len(ordered)} runs, budget is {budget_ms * LATENCY_BUDGET_SCALE:.2f} ms"
+    )
+
+
 @pytest.fixture(scope="session")
 def postgres_test_schema() -> Iterator[str]:
     db_env = _database_env()
@@ -120,3 +191,13 @@ async def postgres_prepared_session(
         if session.in_transaction():
             await session.rollback()
         await session.close()
+
+
+@pytest.fixture
+def query_budget(postgres_async_engine: AsyncEngine) -> Iterator[QueryBudget]:
+    budget = QueryBudget(postgres_async_engine)
+    budget.attach()
+    try:
+        yield budget
+    finally:
+        budget.detach()
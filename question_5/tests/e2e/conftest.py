@@ -4,6 +4,7 @@ import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.persistence.repositories import SqlRoleRepository
 from src.main import app
 from src.presentation import deps
 
@@ -23,6 +24,7 @@ async def e2e_client(
 
     original_overrides = dict(app.dependency_overrides)
     app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[deps.get_role_repository] = lambda: SqlRoleRepository(session)
     transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
 
     try:
@@ -12,13 +12,14 @@ async def test_create_user_e2e_persists_user_and_returns_201(e2e_client):
     session.add(role)
     await session.flush()
     await session.commit()
+    role_id = role.id
     # Act
     response = await client.post(
         "/v1/users",
         json={
             "name": "Bruno",
             "email": "bruno@fagundes.com",
-            "role_id": role.id,
+            "role_id": role_id,
             "password": "Senha123!",
         },
     )
@@ -26,7 +27,7 @@ async def test_create_user_e2e_persists_user_and_returns_201(e2e_client):
     assert response.status_code == 201
     body = response.json()
     assert body["email"] == "bruno@fagundes.com"
-    assert body["role_id"] == role.id
+    assert body["role_id"] == role_id
     persisted = await session.scalar(select(User).where(User.email == "bruno@fagundes.com"))
     assert persisted is not None
     assert persisted.password != "Senha123!"
@@ -72,3 +73,51 @@ async def test_create_user_e2e_returns_404_when_role_does_not_exist(e2e_client):
     # Assert
     assert response.status_code == 404
     assert response.json()["type"] == "role-not-found"
+
+
+@pytest.mark.anyio
+async def test_create_users_batch_e2e_persists_valid_items(e2e_client):
+    # Arrange
+    client, session = e2e_client
+    role = Role(description="admin")
+    session.add(role)
+    await session.flush()
+    await session.commit()
+    # Act
+    response = await client.post(
+        "/v1/users:batch",
+        json={
+            "users": [
+                {"name": "A", "email": "batch-a@fagundes.com", "role_id": role.id, "password": "Senha123!"},
+                {"name": "B", "email": "batch-b@fagundes.com", "role_id": 999},
+                {"name": "C", "email": "batch-a@fagundes.com", "role_id": role.id},
+            ]
+        },
+    )
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["results"]] == ["created", "role-not-found", "email-already-exists"]
+    persisted = (await session.scalars(select(User.email))).all()
+    assert persisted == ["batch-a@fagundes.com"]
+
+
+@pytest.mark.anyio
+async def test_list_users_e2e_pages_through_created_users(e2e_client):
+    # Arrange
+    client, session = e2e_client
+    role = Role(description="admin")
+    session.add(role)
+    await session.commit()
+    role_id = role.id
+    for name in ("a", "b", "c"):
+        session.add(User(name=name, email=f"list-{name}@fagundes.com", password="hashed", role_id=role_id))
+    await session.commit()
+    # Act
+    first = await client.get("/v1/users", params={"limit": 2, "role_id": role_id})
+    second = await client.get("/v1/users", params={"limit": 2, "cursor": first.json()["next_cursor"]})
+    # Assert
+    assert [user["email"] for user in first.json()["items"]] == ["list-a@fagundes.com", "list-b@fagundes.com"]
+    assert [user["email"] for user in second.json()["items"]] == ["list-c@fagundes.com"]
+    assert second.json()["next_cursor"] is None
+    assert "password" not in first.json()["items"][0]
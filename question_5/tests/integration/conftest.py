@@ -1,4 +1,8 @@
+import json
+import threading
+import time
 from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import AsyncIterator
 
 import httpx
@@ -36,3 +40,54 @@ async def repo_session(
     postgres_prepared_session: AsyncSession,
 ) -> AsyncIterator[AsyncSession]:
     yield postgres_prepared_session
+
+
+class ProviderStub:
+    """A local HTTP server standing in for the CNPJ and CEP providers.
+
+    ``routes`` maps a path to the responses it gives, in order, as ``(status, body, delay_seconds)``;
+    the last one repeats. ``hits`` records every path requested.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, list[tuple[int, object, float]]] = {}
+        self.hits: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub.hits.append(self.path)
+                responses = stub.routes.get(self.path, [(404, {"message": "not found"}, 0.0)])
+                status, body, delay = responses.pop(0) if len(responses) > 1 else responses[0]
+                time.sleep(delay)
+                payload = json.dumps(body).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, *args) -> None:
+                return None
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def route(self, path: str, *responses: tuple[int, object, float]) -> None:
+        self.routes[path] = list(responses)
+
+
+@pytest.fixture
+def provider_stub():
+    stub = ProviderStub()
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        stub.server.shutdown()
+        stub.server.server_close()
@@ -0,0 +1,288 @@
+import time
+
+import pytest
+
+from src.application.use_cases import ValidateCompanyAddressUseCase
+from src.infrastructure.config import get_settings
+from src.infrastructure.providers import (
+    BrasilApiCnpjProvider,
+    CepDataset,
+    CircuitBreaker,
+    HedgeBudget,
+    HedgedCnpjProvider,
+    OfflineCepProvider,
+    ProviderClient,
+    ReceitaWsCnpjProvider,
+    RetryPolicy,
+    ViaCepProvider,
+    close_http_client,
+    compile_cep_dataset,
+    get_http_client,
+    init_http_client,
+)
+from src.presentation import deps
+
+CNPJ = "11222333000181"
+CEP = "01310100"
+
+BRASIL_API_COMPANY = {
+    "cnpj": CNPJ,
+    "descricao_tipo_de_logradouro": "AVENIDA",
+    "logradouro": "PAULISTA",
+    "numero": "1000",
+    "bairro": "BELA VISTA",
+    "municipio": "SAO PAULO",
+    "uf": "SP",
+    "cep": "01310100",
+}
+VIA_CEP_ADDRESS = {
+    "cep": "01310-100",
+    "logradouro": "Avenida Paulista",
+    "bairro": "Bela Vista",
+    "localidade": "São Paulo",
+    "uf": "SP",
+}
+
+RECEITA_WS_COMPANY = {
+    "status": "OK",
+    "cnpj": "11.222.333/0001-81",
+    "logradouro": "AVENIDA PAULISTA",
+    "numero": "1000",
+    "bairro": "BELA VISTA",
+    "municipio": "SAO PAULO",
+    "uf": "SP",
+    "cep": "01.310-100",
+}
+
+
+@pytest.fixture
+async def http_client():
+    client = init_http_client(get_settings())
+    try:
+        yield client
+    finally:
+        await close_http_client()
+
+
+def _provider_client(name: str, base_url: str, **kwargs) -> ProviderClient:
+    options = {
+        "timeout_seconds": 1.0,
+        "deadline_seconds": 2.0,
+        "retry": RetryPolicy(attempts=3, base_delay_seconds=0.01),
+        "breaker": CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30.0),
+        **kwargs,
+    }
+    return ProviderClient(name, base_url, get_http_client, **options)
+
+
+@pytest.fixture
+def use_case_overrides(provider_stub, http_client):
+    def _overrides(**client_options):
+        use_case = ValidateCompanyAddressUseCase(
+            BrasilApiCnpjProvider(_provider_client("cnpj", f"{provider_stub.url}/api/cnpj/v1", **client_options)),
+            ViaCepProvider(_provider_client("cep", f"{provider_stub.url}/ws", **client_options)),
+        )
+        return {deps.get_validate_company_address_use_case: lambda: use_case}
+
+    return _overrides
+
+
+@pytest.mark.anyio
+async def test_endpoint_validates_cnpj_address_against_cep(api_client, provider_stub, use_case_overrides):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (200, BRASIL_API_COMPANY, 0.0))
+    provider_stub.route(f"/ws/{CEP}/json/", (200, VIA_CEP_ADDRESS, 0.0))
+    # Act
+    async with api_client(use_case_overrides()) as client:
+        response = await client.post(
+            "/v1/address-validations", json={"cnpj": "11.222.333/0001-81", "cep": "01310-100"}
+        )
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert body["matches"] is True
+    assert body["mismatched_fields"] == []
+    assert body["company_address"]["street"] == "AVENIDA PAULISTA"
+    assert body["cep_address"] == {
+        "cep": CEP,
+        "street": "Avenida Paulista",
+        "district": "Bela Vista",
+        "city": "São Paulo",
+        "state": "SP",
+    }
+
+
+@pytest.mark.anyio
+async def test_endpoint_answers_in_the_time_of_the_slower_provider(api_client, provider_stub, use_case_overrides):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (200, BRASIL_API_COMPANY, 0.3))
+    provider_stub.route(f"/ws/{CEP}/json/", (200, VIA_CEP_ADDRESS, 0.3))
+    async with api_client(use_case_overrides()) as client:
+        # Act
+        started = time.perf_counter()
+        response = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+        elapsed = time.perf_counter() - started
+    # Assert
+    assert response.status_code == 200
+    assert elapsed < 0.55
+
+
+@pytest.mark.anyio
+async def test_endpoint_retries_a_failing_provider(api_client, provider_stub, use_case_overrides):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (502, {}, 0.0), (200, BRASIL_API_COMPANY, 0.0))
+    provider_stub.route(f"/ws/{CEP}/json/", (200, {**VIA_CEP_ADDRESS, "localidade": "Campinas"}, 0.0))
+    # Act
+    async with api_client(use_case_overrides()) as client:
+        response = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["mismatched_fields"] == ["city"]
+    assert provider_stub.hits.count(f"/api/cnpj/v1/{CNPJ}") == 2
+
+
+@pytest.mark.anyio
+async def test_endpoint_fails_fast_once_a_slow_provider_trips_the_breaker(
+    api_client, provider_stub, use_case_overrides
+):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (200, BRASIL_API_COMPANY, 0.0))
+    provider_stub.route(f"/ws/{CEP}/json/", (200, VIA_CEP_ADDRESS, 0.5))
+    overrides = use_case_overrides(timeout_seconds=0.05, retry=RetryPolicy(attempts=1))
+    async with api_client(overrides) as client:
+        # Act
+        timed_out = [await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP}) for _ in range(2)]
+        started = time.perf_counter()
+        refused = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+        refused_after = time.perf_counter() - started
+    # Assert
+    assert [response.status_code for response in timed_out] == [503, 503]
+    assert timed_out[0].json()["type"] == "provider-unavailable"
+    assert timed_out[0].json()["reason"] == "timeout"
+    assert refused.status_code == 503
+    assert refused.json()["reason"] == "circuit open"
+    assert refused_after < 0.05
+    assert provider_stub.hits.count(f"/ws/{CEP}/json/") == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("cnpj_response", "cep_response", "problem_type"),
+    [
+        ((404, {"message": "CNPJ não encontrado"}, 0.0), (200, VIA_CEP_ADDRESS, 0.0), "cnpj-not-found"),
+        ((200, BRASIL_API_COMPANY, 0.0), (200, {"erro": "true"}, 0.0), "cep-not-found"),
+    ],
+)
+async def test_endpoint_returns_404_problem_for_unknown_cnpj_or_cep(
+    api_client, provider_stub, use_case_overrides, cnpj_response, cep_response, problem_type
+):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", cnpj_response)
+    provider_stub.route(f"/ws/{CEP}/json/", cep_response)
+    # Act
+    async with api_client(use_case_overrides()) as client:
+        response = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+    # Assert
+    assert response.status_code == 404
+    assert response.json()["type"] == problem_type
+
+
+@pytest.mark.anyio
+async def test_endpoint_rejects_invalid_cnpj_without_calling_providers(api_client, provider_stub, use_case_overrides):
+    # Act
+    async with api_client(use_case_overrides()) as client:
+        response = await client.post("/v1/address-validations", json={"cnpj": "11222333000182", "cep": CEP})
+    # Assert
+    assert response.status_code == 422
+    assert provider_stub.hits == []
+
+
+@pytest.mark.anyio
+async def test_slow_cnpj_provider_is_hedged_with_the_backup(api_client, provider_stub, http_client):
+    # Arrange
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (200, BRASIL_API_COMPANY, 1.0))
+    provider_stub.route(f"/v1/cnpj/{CNPJ}", (200, RECEITA_WS_COMPANY, 0.0))
+    provider_stub.route(f"/ws/{CEP}/json/", (200, VIA_CEP_ADDRESS, 0.0))
+    hedged = HedgedCnpjProvider(
+        BrasilApiCnpjProvider(_provider_client("cnpj", f"{provider_stub.url}/api/cnpj/v1")),
+        ReceitaWsCnpjProvider(_provider_client("cnpj_backup", f"{provider_stub.url}/v1/cnpj")),
+        budget=HedgeBudget(),
+        max_delay_seconds=0.1,
+    )
+    use_case = ValidateCompanyAddressUseCase(
+        hedged, ViaCepProvider(_provider_client("cep", f"{provider_stub.url}/ws"))
+    )
+    async with api_client({deps.get_validate_company_address_use_case: lambda: use_case}) as client:
+        # Act
+        started = time.perf_counter()
+        response = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+        elapsed = time.perf_counter() - started
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["matches"] is True
+    assert response.json()["company_address"]["cep"] == CEP
+    assert elapsed < 0.6
+    assert (hedged.hedges, hedged.hedge_wins) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_cep_in_the_offline_dataset_needs_no_cep_provider_call(api_client, provider_stub, http_client, tmp_path):
+    # Arrange
+    path = str(tmp_path / "ceps.bin")
+    compile_cep_dataset(
+        [{"cep": CEP, "street": "Avenida Paulista", "district": "Bela Vista", "city": "São Paulo", "state": "SP"}],
+        path,
+    )
+    dataset = CepDataset(path)
+    provider_stub.route(f"/api/cnpj/v1/{CNPJ}", (200, BRASIL_API_COMPANY, 0.0))
+    provider_stub.route("/ws/01310200/json/", (200, {**VIA_CEP_ADDRESS, "cep": "01310-200"}, 0.0))
+    use_case = ValidateCompanyAddressUseCase(
+        BrasilApiCnpjProvider(_provider_client("cnpj", f"{provider_stub.url}/api/cnpj/v1")),
+        OfflineCepProvider(dataset, ViaCepProvider(_provider_client("cep", f"{provider_stub.url}/ws"))),
+    )
+    # Act
+    async with api_client({deps.get_validate_company_address_use_case: lambda: use_case}) as client:
+        offline = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": CEP})
+        online = await client.post("/v1/address-validations", json={"cnpj": CNPJ, "cep": "01310200"})
+    dataset.close()
+    # Assert
+    assert offline.status_code == online.status_code == 200
+    assert offline.json()["matches"] is True
+    assert online.json()["cep_address"]["cep"] == "01310200"
+    assert [hit for hit in provider_stub.hits if hit.startswith("/ws/")] == ["/ws/01310200/json/"]
+
+
+@pytest.mark.anyio
+async def test_receita_ws_error_status_means_unknown_cnpj(provider_stub, http_client):
+    # Arrange
+    provider_stub.route(f"/v1/cnpj/{CNPJ}", (200, {"status": "ERROR", "message": "CNPJ inválido"}, 0.0))
+    provider = ReceitaWsCnpjProvider(_provider_client("cnpj_backup", f"{provider_stub.url}/v1/cnpj"))
+    # Act
+    address = await provider.get_company_address(CNPJ)
+    # Assert
+    assert address is None
+
+
+@pytest.mark.anyio
+async def test_default_use_case_uses_the_configured_providers():
+    # Act
+    use_case = await deps.get_validate_company_address_use_case()
+    # Assert
+    assert use_case.cnpj_provider is deps.cnpj_hedging
+    assert use_case.cnpj_provider.primary.client is deps.cnpj_provider_client
+    assert use_case.cnpj_provider.backup.client is deps.cnpj_backup_provider_client
+    assert use_case.cep_provider is deps.cep_cache
+    assert use_case.cep_provider.provider.client is deps.cep_provider_client
+    assert deps.cnpj_provider_client.base_url == get_settings().CNPJ_PROVIDER_URL
+
+
+@pytest.mark.anyio
+async def test_http_client_is_only_available_between_init_and_close():
+    # Arrange
+    init_http_client(get_settings())
+    # Act
+    await close_http_client()
+    await close_http_client()
+    # Assert
+    with pytest.raises(RuntimeError):
+        get_http_client()
@@ -0,0 +1,47 @@
+import asyncio
+
+import asyncpg
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.persistence.models import Role
+from src.infrastructure.persistence.repositories.cached_role_repository import (
+    ROLES_CHANGED_CHANNEL,
+    CachedRoleRepository,
+)
+from tests.conftest import _database_env, _test_database_name
+
+
+async def _connect_listener():
+    db_env = _database_env()
+    return await asyncpg.connect(
+        host=db_env["host"],
+        port=int(db_env["port"]),
+        user=db_env["user"],
+        password=db_env["password"],
+        database=_test_database_name(),
+    )
+
+
+@pytest.mark.anyio
+async def test_cache_is_invalidated_by_roles_changed_notification(repo_session, postgres_async_session_factory):
+    # Arrange
+    repo_session.add(Role(description="admin"))
+    await repo_session.commit()
+    cache = CachedRoleRepository(postgres_async_session_factory)
+    await cache.start(_connect_listener)
+    try:
+        assert await cache.get_existing_ids({1, 2}) == {1}
+        repo_session.add(Role(description="viewer"))
+        await repo_session.flush()
+        # Act
+        await repo_session.execute(text(f"NOTIFY {ROLES_CHANGED_CHANNEL}"))
+        await repo_session.commit()
+        for _ in range(50):
+            if cache._expires_at == 0.0:
+                break
+            await asyncio.sleep(0.02)
+        # Assert
+        assert await cache.get_existing_ids({1, 2}) == {1, 2}
+    finally:
+        await cache.stop()
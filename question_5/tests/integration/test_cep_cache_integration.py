@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.entities import AddressEntity, CachedCepEntity
+from src.infrastructure.config import get_settings
+from src.infrastructure.persistence.repositories import SqlCepCacheRepository
+from src.infrastructure.providers import (
+    CachedCepProvider,
+    CircuitBreaker,
+    ProviderClient,
+    RetryPolicy,
+    ViaCepProvider,
+    close_http_client,
+    get_http_client,
+    init_http_client,
+)
+
+CEP = "01310100"
+PAULISTA = AddressEntity(cep=CEP, street="Avenida Paulista", district="Bela Vista", city="São Paulo", state="SP")
+FETCHED_AT = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.anyio
+async def test_put_stores_found_and_unknown_ceps_and_keeps_the_newest_fetch(repo_session):
+    # Arrange
+    repository = SqlCepCacheRepository(repo_session)
+    older = CachedCepEntity("99999999", PAULISTA, FETCHED_AT - timedelta(days=1))
+    # Act
+    await repository.put(CachedCepEntity(CEP, PAULISTA, FETCHED_AT))
+    await repository.put(CachedCepEntity("99999999", None, FETCHED_AT))
+    await repository.put(older)
+    await repo_session.commit()
+    found = await repository.get(CEP)
+    unknown = await repository.get("99999999")
+    absent = await repository.get("00000000")
+    # Assert
+    assert found == CachedCepEntity(CEP, PAULISTA, FETCHED_AT)
+    assert unknown == CachedCepEntity("99999999", None, FETCHED_AT)
+    assert absent is None
+
+
+@pytest.mark.anyio
+async def test_second_worker_is_served_from_the_table_without_calling_the_provider(
+    repo_session, postgres_async_session_factory, provider_stub
+):
+    # Arrange
+    provider_stub.route(
+        f"/ws/{CEP}/json/",
+        (
+            200,
+            {
+                "cep": "01310-100",
+                "logradouro": "Avenida Paulista",
+                "bairro": "Bela Vista",
+                "localidade": "São Paulo",
+                "uf": "SP",
+            },
+            0.0,
+        ),
+    )
+    init_http_client(get_settings())
+    via_cep = ViaCepProvider(
+        ProviderClient(
+            "cep",
+            f"{provider_stub.url}/ws",
+            get_http_client,
+            timeout_seconds=1.0,
+            deadline_seconds=2.0,
+            retry=RetryPolicy(attempts=1),
+            breaker=CircuitBreaker(),
+        )
+    )
+    first_worker = CachedCepProvider(via_cep, postgres_async_session_factory)
+    second_worker = CachedCepProvider(via_cep, postgres_async_session_factory)
+    try:
+        # Act
+        fetched = await first_worker.get_address(CEP)
+        hits_after_first = len(provider_stub.hits)
+        from_table = await second_worker.get_address(CEP)
+        from_memory = await second_worker.get_address(CEP)
+    finally:
+        await close_http_client()
+    # Assert
+    assert fetched == from_table == from_memory == PAULISTA
+    assert hits_after_first == 1
+    assert len(provider_stub.hits) == 1
+    assert (second_worker.database_hits, second_worker.memory_hits, second_worker.misses) == (1, 1, 0)
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError
+from src.domain.entities import UserEntity
+from src.infrastructure.persistence.models import Role, User
+from src.infrastructure.persistence.repositories import CoalescingUserRepository, UserWriteCoalescer
+from src.infrastructure.persistence.repositories.coalescing_user_repository import batch_size_histogram
+
+
+def _user(email: str, role_id: int) -> UserEntity:
+    return UserEntity(None, email.split("@")[0], email, "hashed", role_id, date(2026, 2, 6), None)
+
+
+async def _create_role(repo_session) -> int:
+    role = Role(description="Admin")
+    repo_session.add(role)
+    await repo_session.commit()
+    return role.id
+
+
+@pytest.mark.anyio
+async def test_concurrent_creates_share_one_insert_and_get_their_own_outcome(
+    repo_session, postgres_async_session_factory
+):
+    # Arrange
+    role_id = await _create_role(repo_session)
+    repo_session.add(User(name="Old", email="old@fagundes.com", password="h", role_id=role_id))
+    await repo_session.commit()
+    coalescer = UserWriteCoalescer(postgres_async_session_factory, max_delay_seconds=0.05)
+    batches = batch_size_histogram.count()
+    # Act
+    results = await asyncio.gather(
+        coalescer.submit(_user("a@fagundes.com", role_id)),
+        coalescer.submit(_user("b@fagundes.com", role_id)),
+        coalescer.submit(_user("a@fagundes.com", role_id)),
+        coalescer.submit(_user("old@fagundes.com", role_id)),
+        coalescer.submit(_user("c@fagundes.com", 999)),
+        return_exceptions=True,
+    )
+    # Assert
+    assert [user.email for user in results[:2]] == ["a@fagundes.com", "b@fagundes.com"]
+    assert all(user.id is not None for user in results[:2])
+    assert isinstance(results[2], EmailAlreadyExistsError)
+    assert isinstance(results[3], EmailAlreadyExistsError)
+    assert isinstance(results[4], RoleNotFoundError)
+    assert batch_size_histogram.count() == batches + 1
+    emails = set(await repo_session.scalars(select(User.email)))
+    assert emails == {"old@fagundes.com", "a@fagundes.com", "b@fagundes.com"}
+
+
+@pytest.mark.anyio
+async def test_full_batch_is_flushed_without_waiting_for_the_delay(repo_session, postgres_async_session_factory):
+    # Arrange
+    role_id = await _create_role(repo_session)
+    coalescer = UserWriteCoalescer(postgres_async_session_factory, max_batch_size=2, max_delay_seconds=60)
+    # Act
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.submit(_user("a@fagundes.com", role_id)),
+            coalescer.submit(_user("b@fagundes.com", role_id)),
+        ),
+        timeout=5,
+    )
+    # Assert
+    assert [user.email for user in results] == ["a@fagundes.com", "b@fagundes.com"]
+
+
+@pytest.mark.anyio
+async def test_failed_batch_is_retried_row_by_row(repo_session, postgres_async_session_factory, monkeypatch):
+    # Arrange
+    role_id = await _create_role(repo_session)
+    coalescer = UserWriteCoalescer(postgres_async_session_factory, max_delay_seconds=0.01)
+
+    async def broken_batch(batch):
+        raise RuntimeError("batch failed")
+
+    monkeypatch.setattr(coalescer, "_write_batch", broken_batch)
+    # Act
+    results = await asyncio.gather(
+        coalescer.submit(_user("a@fagundes.com", role_id)),
+        coalescer.submit(_user("b@fagundes.com", 999)),
+        return_exceptions=True,
+    )
+    # Assert
+    assert results[0].email == "a@fagundes.com"
+    assert isinstance(results[1], RoleNotFoundError)
+    count = await repo_session.scalar(select(func.count()).select_from(User))
+    assert count == 1
+
+
+@pytest.mark.anyio
+async def test_stop_flushes_pending_creates(repo_session, postgres_async_session_factory):
+    # Arrange
+    role_id = await _create_role(repo_session)
+    coalescer = UserWriteCoalescer(postgres_async_session_factory, max_delay_seconds=60)
+    pending = asyncio.create_task(coalescer.submit(_user("a@fagundes.com", role_id)))
+    await asyncio.sleep(0)
+    # Act
+    await coalescer.stop()
+    # Assert
+    assert (await pending).email == "a@fagundes.com"
+    await coalescer.stop()
+
+
+@pytest.mark.anyio
+async def test_repository_routes_creates_through_the_coalescer(repo_session, postgres_async_session_factory):
+    # Arrange
+    role_id = await _create_role(repo_session)
+    coalescer = UserWriteCoalescer(postgres_async_session_factory, max_delay_seconds=0.01)
+    repository = CoalescingUserRepository(repo_session, coalescer)
+    # Act
+    unique = await repository.create_unique(name="A", email="a@fagundes.com", password="h", role_id=role_id)
+    created = await repository.create(name="B", email="b@fagundes.com", password="h", role_id=role_id)
+    # Assert
+    assert (unique.email, created.email) == ("a@fagundes.com", "b@fagundes.com")
+    assert repo_session.in_transaction() is False
+    assert await repository.exists_by_email("b@fagundes.com") is True
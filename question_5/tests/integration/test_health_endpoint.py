@@ -10,3 +10,19 @@ async def test_health_endpoint_returns_ok_status_payload(api_client):
     # Assert
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.anyio
+async def test_ready_endpoint_reports_503_until_warm_up_finishes(api_client, monkeypatch):
+    # Arrange
+    from src.main import app
+
+    monkeypatch.setattr(app.state, "ready", False, raising=False)
+    async with api_client() as client:
+        # Act
+        starting = await client.get("/v1/ready")
+        monkeypatch.setattr(app.state, "ready", True)
+        ready = await client.get("/v1/ready")
+    # Assert
+    assert (starting.status_code, starting.json()) == (503, {"status": "starting"})
+    assert (ready.status_code, ready.json()) == (200, {"status": "ready"})
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, text, update
+
+from src.infrastructure.persistence.models import IdempotencyKey
+from src.infrastructure.persistence.repositories import SqlIdempotencyRepository
+from src.infrastructure.persistence.retention import RetentionPurger
+
+RESPONSE = {"id": 1, "email": "bruno@fagundes.com"}
+
+
+async def _save(repository: SqlIdempotencyRepository, fingerprint: str = "a" * 64) -> bool:
+    return await repository.save("key-1", fingerprint=fingerprint, status_code=201, response=RESPONSE, ttl_seconds=60)
+
+
+@pytest.mark.anyio
+async def test_save_stores_response_until_it_expires(repo_session):
+    # Arrange
+    repository = SqlIdempotencyRepository(repo_session)
+    # Act
+    saved = await _save(repository)
+    await repo_session.commit()
+    stored = await repository.get("key-1")
+    await repo_session.execute(update(IdempotencyKey).values(expires_at=text("now() - interval '1 second'")))
+    await repo_session.commit()
+    expired = await repository.get("key-1")
+    # Assert
+    assert saved is True
+    assert (stored.fingerprint, stored.status_code, stored.response) == ("a" * 64, 201, RESPONSE)
+    assert stored.expires_at > stored.created_at
+    assert expired is None
+
+
+@pytest.mark.anyio
+async def test_save_leaves_live_records_alone_and_takes_over_expired_ones(repo_session):
+    # Arrange
+    repository = SqlIdempotencyRepository(repo_session)
+    await _save(repository)
+    await repo_session.commit()
+    # Act
+    while_live = await _save(repository, "b" * 64)
+    await repo_session.rollback()
+    await repo_session.execute(update(IdempotencyKey).values(expires_at=text("now() - interval '1 second'")))
+    await repo_session.commit()
+    after_expiry = await _save(repository, "c" * 64)
+    await repo_session.commit()
+    # Assert
+    assert (while_live, after_expiry) == (False, True)
+    assert (await repository.get("key-1")).fingerprint == "c" * 64
+
+
+@pytest.mark.anyio
+async def test_concurrent_save_waits_for_the_first_transaction(
+    repo_session, postgres_async_session_factory, postgres_test_schema
+):
+    # Arrange
+    first = SqlIdempotencyRepository(repo_session)
+    await _save(first)
+    async with postgres_async_session_factory() as other_session:
+        second = SqlIdempotencyRepository(other_session)
+        # Act
+        pending = asyncio.create_task(_save(second, "b" * 64))
+        await asyncio.sleep(0.2)
+        blocked = not pending.done()
+        await repo_session.commit()
+        saved = await pending
+        await other_session.rollback()
+    # Assert
+    assert blocked is True
+    assert saved is False
+
+
+@pytest.mark.anyio
+async def test_purger_deletes_expired_keys_in_bounded_batches(repo_session, postgres_async_session_factory):
+    # Arrange
+    repository = SqlIdempotencyRepository(repo_session)
+    for index in range(5):
+        await repository.save(f"key-{index}", fingerprint="a" * 64, status_code=201, response=RESPONSE, ttl_seconds=60)
+    await repo_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key.in_(["key-0", "key-1", "key-2"]))
+        .values(expires_at=text("now() - interval '1 second'"))
+    )
+    await repo_session.commit()
+    purger = RetentionPurger(
+        "idempotency_keys",
+        postgres_async_session_factory,
+        lambda session, limit: SqlIdempotencyRepository(session).purge_expired(limit),
+        batch_size=2,
+    )
+    # Act
+    batches = [await purger.purge_batch() for _ in range(3)]
+    remaining = set(await repo_session.scalars(select(IdempotencyKey.key)))
+    # Assert
+    assert batches == [2, 1, 0]
+    assert purger.purged == 3
+    assert remaining == {"key-3", "key-4"}
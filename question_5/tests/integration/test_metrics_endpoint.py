@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_exposes_request_metrics_in_prometheus_format(api_client):
+    # Arrange
+    async with api_client() as client:
+        await client.get("/v1/health")
+        # Act
+        response = await client.get("/metrics")
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/v1/health",status="200"}' in response.text
+    assert "# TYPE create_user_stage_seconds histogram" in response.text
+    # The pool gauges only appear once the lifespan has created the engine.
+    assert "# TYPE db_pool_checkout_wait_seconds histogram" in response.text
+    assert 'email_filter_false_positive_rate{kind="observed"}' in response.text
+    assert "email_filter_memory_bytes " in response.text
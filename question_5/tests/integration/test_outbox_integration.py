@@ -0,0 +1,161 @@
+import asyncio
+from datetime import date
+
+import asyncpg
+import pytest
+from sqlalchemy import func, select, text
+
+from src.application.exceptions import EmailAlreadyExistsError
+from src.domain.entities import UserEntity
+from src.infrastructure.messaging import FileBroker, InMemoryBroker, OutboxRelay, ReportingConsumer
+from src.infrastructure.messaging.outbox_relay import OUTBOX_PENDING_CHANNEL
+from src.infrastructure.persistence.models import OutboxEvent, Role
+from src.infrastructure.persistence.repositories import (
+    SqlOutboxRepository,
+    SqlUserReportRepository,
+    SqlUserRepository,
+)
+from tests.conftest import _database_env, _test_database_name
+
+
+async def _connect_listener():
+    db_env = _database_env()
+    return await asyncpg.connect(
+        host=db_env["host"],
+        port=int(db_env["port"]),
+        user=db_env["user"],
+        password=db_env["password"],
+        database=_test_database_name(),
+    )
+
+
+async def _role(session) -> int:
+    role = Role(description="admin")
+    session.add(role)
+    await session.commit()
+    return role.id
+
+
+def _user(email: str, role_id: int) -> UserEntity:
+    return UserEntity(None, "Bruno", email, "hash", role_id, date(2026, 2, 6), None)
+
+
+@pytest.mark.anyio
+async def test_every_user_insert_path_writes_a_user_created_event(repo_session):
+    # Arrange
+    role_id = await _role(repo_session)
+    users = SqlUserRepository(repo_session)
+    # Act
+    single = await users.create_unique(name="Bruno", email="one@fagundes.com", password="hash", role_id=role_id)
+    with pytest.raises(EmailAlreadyExistsError):
+        await users.create_unique(name="Bruno", email="one@fagundes.com", password="hash", role_id=role_id)
+    batch = await users.create_many([_user("two@fagundes.com", role_id), _user("one@fagundes.com", role_id)])
+    orm = await users.create(name="Bruno", email="three@fagundes.com", password="hash", role_id=role_id)
+    await repo_session.commit()
+    events = (await repo_session.scalars(select(OutboxEvent).order_by(OutboxEvent.id))).all()
+    # Assert
+    assert [event.key for event in events] == [str(single.id), str(batch[0].id), str(orm.id)]
+    assert {event.topic for event in events} == {"user.created"}
+    assert events[0].payload == {
+        "id": single.id,
+        "name": "Bruno",
+        "email": "one@fagundes.com",
+        "role_id": role_id,
+        "created_at": single.created_at.isoformat(),
+    }
+    assert events[2].payload["created_at"] == orm.created_at.isoformat()
+
+
+@pytest.mark.anyio
+async def test_claims_skip_rows_locked_by_another_relay_and_rollback_returns_them(
+    repo_session, postgres_async_session_factory
+):
+    # Arrange
+    role_id = await _role(repo_session)
+    await SqlUserRepository(repo_session).create_many([_user(f"u{index}@fagundes.com", role_id) for index in range(5)])
+    await repo_session.commit()
+    async with postgres_async_session_factory() as other_session:
+        # Act
+        first = await SqlOutboxRepository(repo_session).claim_batch(3)
+        second = await SqlOutboxRepository(other_session).claim_batch(3)
+        await other_session.rollback()
+        await repo_session.commit()
+        remaining = await other_session.scalar(select(func.count()).select_from(OutboxEvent))
+    # Assert
+    assert [message.id for message in first] == [1, 2, 3]
+    assert [message.id for message in second] == [4, 5]
+    assert remaining == 2
+
+
+@pytest.mark.anyio
+async def test_relay_publishes_committed_events_when_notified(repo_session, postgres_async_session_factory):
+    # Arrange
+    role_id = await _role(repo_session)
+    broker = InMemoryBroker()
+    relay = OutboxRelay(postgres_async_session_factory, broker, batch_size=2, poll_interval_seconds=60)
+    await relay.start(_connect_listener)
+    try:
+        # Act
+        await SqlUserRepository(repo_session).create_many(
+            [_user(f"r{index}@fagundes.com", role_id) for index in range(5)]
+        )
+        await repo_session.execute(text(f"NOTIFY {OUTBOX_PENDING_CHANNEL}"))
+        await repo_session.commit()
+        for _ in range(100):
+            if len(broker.messages) == 5:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await relay.stop()
+    left = await repo_session.scalar(select(func.count()).select_from(OutboxEvent))
+    # Assert
+    assert [message.payload["email"] for message in broker.messages] == [
+        f"r{index}@fagundes.com" for index in range(5)
+    ]
+    assert relay.relayed == 5
+    assert left == 0
+
+
+@pytest.mark.anyio
+async def test_relayed_events_reach_the_reporting_rollup_with_a_file_broker(
+    repo_session, postgres_async_session_factory, tmp_path
+):
+    # Arrange
+    role_id = await _role(repo_session)
+    broker = FileBroker(tmp_path / "outbox.jsonl")
+    consumer = ReportingConsumer()
+    relay = OutboxRelay(postgres_async_session_factory, broker, consumers=[consumer.handle])
+    await SqlUserRepository(repo_session).create_many([_user(f"c{index}@fagundes.com", role_id) for index in range(3)])
+    await repo_session.commit()
+    # Act
+    relayed = await relay.relay_batch()
+    rows = await SqlUserReportRepository(repo_session).daily_counts(role_id=role_id)
+    # Assert
+    assert relayed == 3
+    assert consumer.counted == 3
+    assert len(broker.path.read_bytes().splitlines()) == 3
+    assert [(row.day, row.users) for row in rows] == [(date(2026, 2, 6), 3)]
+
+
+@pytest.mark.anyio
+async def test_failed_consumer_rolls_back_the_batch_and_the_rollup(repo_session, postgres_async_session_factory):
+    # Arrange
+    role_id = await _role(repo_session)
+    reporting = ReportingConsumer()
+
+    async def fail(session, messages) -> None:
+        raise RuntimeError("downstream consumer down")
+
+    relay = OutboxRelay(postgres_async_session_factory, InMemoryBroker(), consumers=[reporting.handle, fail])
+    await SqlUserRepository(repo_session).create_many([_user(f"f{index}@fagundes.com", role_id) for index in range(2)])
+    await repo_session.commit()
+    # Act
+    with pytest.raises(RuntimeError):
+        await relay.relay_batch()
+    left = await repo_session.scalar(select(func.count()).select_from(OutboxEvent))
+    rows = await SqlUserReportRepository(repo_session).daily_counts(role_id=role_id)
+    # Assert
+    assert left == 2
+    assert relay.relayed == 0
+    assert reporting.counted == 2
+    assert rows == []
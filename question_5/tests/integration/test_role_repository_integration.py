@@ -18,3 +18,16 @@ async def test_get_by_id_returns_persisted_role(repo_session):
     assert result is not None
     assert result.id == role.id
     assert result.description == "Admin"
+
+
+@pytest.mark.anyio
+async def test_get_existing_ids_returns_only_persisted_roles(repo_session):
+    # Arrange
+    role = Role(description="Admin")
+    repo_session.add(role)
+    await repo_session.commit()
+    repository = SqlRoleRepository(repo_session)
+    # Act
+    result = await repository.get_existing_ids({role.id, 999})
+    # Assert
+    assert result == {role.id}
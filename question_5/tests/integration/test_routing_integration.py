@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.persistence.models import Role
+from src.infrastructure.persistence.routing import EngineRouter, RoutingSession
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from tests.conftest import _database_env, _test_database_name
+
+
+def _engine(application_name: str, schema: str):
+    db_env = _database_env()
+    url = (
+        f"postgresql+asyncpg://{db_env['user']}:{db_env['password']}"
+        f"@{db_env['host']}:{db_env['port']}/{_test_database_name()}"
+    )
+    return create_async_engine(
+        url,
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": schema, "application_name": application_name}},
+    )
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_writes_on_primary_and_plain_reads_use_replica(
+    postgres_prepared_session, postgres_test_schema
+):
+    # Arrange
+    primary = _engine("primary", postgres_test_schema)
+    replica = _engine("replica", postgres_test_schema)
+    session_factory = async_sessionmaker(
+        sync_session_class=RoutingSession, router=EngineRouter(primary, [replica]), expire_on_commit=False
+    )
+    current_node = text("SELECT current_setting('application_name')")
+    try:
+        async with session_factory() as session:
+            # Act
+            read_node = await session.scalar(current_node)
+            uow = SqlAlchemyUnitOfWork(session)
+            await uow.release()
+            async with uow.transaction():
+                session.add(Role(description="Routed"))
+                await session.flush()
+                write_node = await session.scalar(current_node)
+            after_write_node = await session.scalar(current_node)
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+    # Assert
+    assert read_node == "replica"
+    assert write_node == "primary"
+    assert after_write_node == "primary"
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.persistence.repositories import SqlUserRepository
+from src.infrastructure.persistence.slow_query_log import SlowQueryLog
+
+
+@pytest.fixture
+def slow_query_events(monkeypatch):
+    events: list[tuple[str, dict]] = []
+    monkeypatch.setattr(
+        "src.infrastructure.persistence.slow_query_log.logger.warning",
+        lambda event, **fields: events.append((event, fields)),
+    )
+    return events
+
+
+async def _drain(log: SlowQueryLog) -> None:
+    if log._explains:
+        await asyncio.gather(*log._explains)
+
+
+@pytest.mark.anyio
+async def test_slow_statements_are_logged_with_caller_and_explained_once(
+    repo_session, postgres_async_engine, slow_query_events
+):
+    # Arrange
+    log = SlowQueryLog(postgres_async_engine, threshold_seconds=0, explain=True).attach()
+    repository = SqlUserRepository(repo_session)
+    try:
+        # Act
+        await repository.exists_by_email("bruno@fagundes.com")
+        await repository.exists_by_email("other@fagundes.com")
+        await _drain(log)
+    finally:
+        log.detach()
+    # Assert
+    slow = [fields for event, fields in slow_query_events if event == "db.slow_query"]
+    explains = [fields for event, fields in slow_query_events if event == "db.slow_query.explain"]
+    assert slow[0]["caller"] == "SqlUserRepository.exists_by_email"
+    assert slow[0]["sql"] == "SELECT EXISTS (SELECT * FROM users WHERE users.email = ?) AS anon_1"
+    assert slow[0]["params"] == ["str"]
+    assert len(explains) == 1
+    assert any("Buffers" in line for line in explains[0]["plan"])
+
+
+@pytest.mark.anyio
+async def test_writes_are_never_explained_and_fast_statements_are_not_logged(
+    repo_session, postgres_async_engine, slow_query_events
+):
+    # Arrange
+    log = SlowQueryLog(postgres_async_engine, threshold_seconds=0, explain=True).attach()
+    try:
+        # Act
+        await repo_session.execute(text("INSERT INTO roles (description) VALUES ('Writer')"))
+        await repo_session.rollback()
+        await _drain(log)
+        log.threshold_seconds = 60
+        await repo_session.execute(text("SELECT 1"))
+    finally:
+        log.detach()
+    # Assert
+    assert [event for event, _ in slow_query_events] == ["db.slow_query"]
+
+
+@pytest.mark.anyio
+async def test_failed_explain_is_logged(repo_session, postgres_async_engine, slow_query_events):
+    # Arrange
+    log = SlowQueryLog(postgres_async_engine, threshold_seconds=0, explain=True, explain_timeout_ms=1).attach()
+    try:
+        # Act
+        await repo_session.execute(text("SELECT pg_sleep(0.05)"))
+        await _drain(log)
+    finally:
+        log.detach()
+    # Assert
+    assert [event for event, _ in slow_query_events] == ["db.slow_query", "db.slow_query.explain_failed"]
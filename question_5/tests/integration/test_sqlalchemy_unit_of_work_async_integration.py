@@ -67,3 +67,26 @@ async def test_uow_rolls_back_with_real_async_session(async_session_factory):
     async with async_session_factory() as verify_session:
         result = await verify_session.execute(select(Widget))
         assert result.scalars().all() == []
+
+
+@pytest.mark.anyio
+async def test_uow_release_returns_connection_after_read(async_session_factory):
+    # Arrange
+    async with async_session_factory() as session:
+        uow = SqlAlchemyUnitOfWork(session)
+        await session.execute(select(Widget))
+        assert session.in_transaction()
+
+        # Act
+        await uow.release()
+
+        # Assert
+        assert not session.in_transaction()
+        assert session.sync_session.get_transaction() is None
+        async with uow.transaction():
+            session.add(Widget(name="after-release"))
+            await session.flush()
+
+    async with async_session_factory() as verify_session:
+        result = await verify_session.execute(select(Widget))
+        assert [row.name for row in result.scalars().all()] == ["after-release"]
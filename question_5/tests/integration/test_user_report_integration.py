@@ -0,0 +1,100 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select, text, update
+
+from src.domain.entities import OutboxMessage, UserDailyCountEntity
+from src.infrastructure.messaging import ReportingConsumer
+from src.infrastructure.persistence.models import ReportProcessedEvent
+from src.infrastructure.persistence.repositories import SqlUserReportRepository
+from src.infrastructure.persistence.retention import RetentionPurger
+
+DAY_1, DAY_2, DAY_3 = date(2026, 2, 4), date(2026, 2, 5), date(2026, 2, 6)
+
+
+@pytest.mark.anyio
+async def test_counting_is_idempotent_per_event_id(repo_session):
+    # Arrange
+    repository = SqlUserReportRepository(repo_session)
+    # Act
+    first = await repository.count_created_users([(1, DAY_1, 1), (2, DAY_1, 1), (3, DAY_1, 2)])
+    redelivered = await repository.count_created_users([(2, DAY_1, 1), (3, DAY_1, 2), (4, DAY_2, 1)])
+    await repo_session.commit()
+    rows = await repository.daily_counts()
+    # Assert
+    assert (first, redelivered) == (3, 1)
+    assert rows == [
+        UserDailyCountEntity(DAY_1, 1, 2, 2),
+        UserDailyCountEntity(DAY_1, 2, 1, 1),
+        UserDailyCountEntity(DAY_2, 1, 1, 3),
+    ]
+
+
+@pytest.mark.anyio
+async def test_daily_counts_keep_running_totals_from_before_the_range(repo_session):
+    # Arrange
+    repository = SqlUserReportRepository(repo_session)
+    await repository.count_created_users([(1, DAY_1, 1), (2, DAY_2, 1), (3, DAY_3, 1), (4, DAY_2, 2)])
+    await repo_session.commit()
+    # Act
+    rows = await repository.daily_counts(created_from=DAY_2, created_to=DAY_2, role_id=1)
+    # Assert
+    assert rows == [UserDailyCountEntity(DAY_2, 1, 1, 2)]
+
+
+@pytest.mark.anyio
+async def test_concurrent_consumers_count_a_redelivered_batch_once(repo_session, postgres_async_session_factory):
+    # Arrange
+    consumers = [ReportingConsumer() for _ in range(2)]
+    published_at = datetime(2026, 2, 6, tzinfo=timezone.utc)
+    batch = [
+        OutboxMessage(
+            event_id, "user.created", str(event_id), {"role_id": 1, "created_at": "2026-02-06"}, published_at
+        )
+        for event_id in range(1, 51)
+    ]
+
+    async def consume(consumer: ReportingConsumer) -> None:
+        async with postgres_async_session_factory() as session, session.begin():
+            await consumer.handle(session, batch)
+
+    # Act
+    await asyncio.gather(*(consume(consumer) for consumer in consumers))
+    rows = await SqlUserReportRepository(repo_session).daily_counts()
+    # Assert
+    assert sum(consumer.counted for consumer in consumers) == 50
+    assert rows == [UserDailyCountEntity(DAY_3, 1, 50, 50)]
+
+
+@pytest.mark.anyio
+async def test_purger_forgets_old_event_ids_that_cannot_be_redelivered(repo_session, postgres_async_session_factory):
+    # Arrange
+    await SqlUserReportRepository(repo_session).count_created_users([(index, DAY_1, 1) for index in range(1, 6)])
+    await repo_session.execute(
+        update(ReportProcessedEvent)
+        .where(ReportProcessedEvent.event_id.in_([1, 2, 3, 4]))
+        .values(processed_at=text("now() - interval '2 days'"))
+    )
+    # Event 2 is still waiting in the outbox, so the relay may deliver it again.
+    await repo_session.execute(
+        text(
+            "INSERT INTO outbox (id, topic, key, payload) OVERRIDING SYSTEM VALUE "
+            "VALUES (2, 'user.created', '2', '{}')"
+        )
+    )
+    await repo_session.commit()
+    purger = RetentionPurger(
+        "report_processed_events",
+        postgres_async_session_factory,
+        lambda session, limit: SqlUserReportRepository(session).purge_processed_events(86_400, limit),
+        batch_size=2,
+    )
+    # Act
+    batches = [await purger.purge_batch() for _ in range(3)]
+    remaining = set(await repo_session.scalars(select(ReportProcessedEvent.event_id)))
+    rows = await SqlUserReportRepository(repo_session).daily_counts()
+    # Assert
+    assert batches == [2, 1, 0]
+    assert remaining == {2, 5}
+    assert rows == [UserDailyCountEntity(DAY_1, 1, 5, 5)]
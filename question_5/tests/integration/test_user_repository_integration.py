@@ -1,8 +1,15 @@
+import asyncio
+from datetime import date
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects import postgresql
 
+from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError, StaleCursorError
+from src.domain.entities import UserEntity
 from src.infrastructure.persistence.models import Role, User
 from src.infrastructure.persistence.repositories.sql_user_repository import SqlUserRepository
+from tests.conftest import assert_p95_within
 
 
 async def _create_role(repo_session, description: str = "Admin") -> Role:
@@ -71,3 +78,241 @@ async def test_delete_removes_user_from_database(repo_session):
     # Assert
     remaining = await repo_session.scalar(select(User).where(User.id == user.id))
     assert remaining is None
+
+
+@pytest.mark.anyio
+async def test_create_unique_inserts_and_returns_user_in_one_statement(repo_session):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    # Act
+    user = await repository.create_unique(
+        name="Bruno",
+        email="bruno-unique@fagundes.com",
+        password="hashed",
+        role_id=role.id,
+    )
+    await repo_session.commit()
+    # Assert
+    assert user.id is not None
+    assert user.created_at is not None
+    persisted = await repo_session.scalar(select(User).where(User.id == user.id))
+    assert persisted.email == "bruno-unique@fagundes.com"
+
+
+@pytest.mark.anyio
+async def test_create_unique_raises_role_not_found_without_inserting(repo_session):
+    # Arrange
+    repository = SqlUserRepository(repo_session)
+    # Act & Assert
+    with pytest.raises(RoleNotFoundError):
+        await repository.create_unique(name="NoRole", email="norole@fagundes.com", password="hashed", role_id=999)
+    assert await repo_session.scalar(select(func.count()).select_from(User)) == 0
+
+
+@pytest.mark.anyio
+async def test_create_unique_raises_email_conflict_for_existing_email(repo_session):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    await repository.create_unique(name="First", email="dup@fagundes.com", password="hashed", role_id=role.id)
+    await repo_session.commit()
+    # Act & Assert
+    with pytest.raises(EmailAlreadyExistsError):
+        await repository.create_unique(name="Second", email="dup@fagundes.com", password="hashed", role_id=role.id)
+
+
+@pytest.mark.anyio
+async def test_create_unique_rejects_concurrent_duplicate_email(
+    repo_session,
+    postgres_async_session_factory,
+    postgres_test_schema,
+):
+    # Arrange
+    role = await _create_role(repo_session)
+    async with postgres_async_session_factory() as other_session:
+        await other_session.execute(text(f'SET search_path TO "{postgres_test_schema}"'))
+        await other_session.commit()
+        first = SqlUserRepository(repo_session)
+        second = SqlUserRepository(other_session)
+        await first.create_unique(name="First", email="race@fagundes.com", password="hashed", role_id=role.id)
+        # Act
+        pending = asyncio.create_task(
+            second.create_unique(name="Second", email="race@fagundes.com", password="hashed", role_id=role.id)
+        )
+        await asyncio.sleep(0.2)
+        assert not pending.done()
+        await repo_session.commit()
+        # Assert
+        with pytest.raises(EmailAlreadyExistsError):
+            await pending
+        await other_session.rollback()
+    count = await repo_session.scalar(select(func.count()).select_from(User).where(User.email == "race@fagundes.com"))
+    assert count == 1
+
+
+@pytest.mark.anyio
+async def test_get_existing_emails_and_create_many_skip_conflicting_rows(repo_session):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    await repository.create_unique(name="Old", email="old@fagundes.com", password="hashed", role_id=role.id)
+    await repo_session.commit()
+    entities = [
+        UserEntity(None, name, f"{name}@fagundes.com", "hashed", role.id, date.today(), None)
+        for name in ("old", "new-a", "new-b")
+    ]
+    # Act
+    existing = await repository.get_existing_emails({"old@fagundes.com", "new-a@fagundes.com"})
+    created = await repository.create_many(entities)
+    await repo_session.commit()
+    # Assert
+    assert existing == {"old@fagundes.com"}
+    assert sorted(user.email for user in created) == ["new-a@fagundes.com", "new-b@fagundes.com"]
+    assert all(user.id is not None for user in created)
+    assert await repo_session.scalar(select(func.count()).select_from(User)) == 3
+
+
+@pytest.mark.anyio
+async def test_stream_emails_returns_every_registered_email(repo_session):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    for name in ("a", "b", "c"):
+        await repository.create_unique(name=name, email=f"{name}@fagundes.com", password="hashed", role_id=role.id)
+    await repo_session.commit()
+    # Act
+    emails = [email async for email in repository.stream_emails(batch_size=2)]
+    # Assert
+    assert sorted(emails) == ["a@fagundes.com", "b@fagundes.com", "c@fagundes.com"]
+
+
+@pytest.mark.anyio
+async def test_list_page_walks_pages_by_id_with_filters(repo_session):
+    # Arrange
+    admin = await _create_role(repo_session)
+    viewer = await _create_role(repo_session, description="Viewer")
+    repository = SqlUserRepository(repo_session)
+    for index in range(5):
+        repo_session.add(
+            User(
+                name=f"U{index}",
+                email=f"u{index}@fagundes.com",
+                password="hashed",
+                role_id=admin.id if index % 2 == 0 else viewer.id,
+                created_at=date(2026, 2, index + 1),
+            )
+        )
+    await repo_session.commit()
+    # Act
+    first = await repository.list_page(after_id=None, limit=2, role_id=admin.id)
+    second = await repository.list_page(after_id=first[-1]["id"], limit=2, role_id=admin.id)
+    ranged = await repository.list_page(
+        after_id=None, limit=10, created_from=date(2026, 2, 2), created_to=date(2026, 2, 4)
+    )
+    # Assert
+    assert [row["email"] for row in first] == ["u0@fagundes.com", "u2@fagundes.com"]
+    assert [row["email"] for row in second] == ["u4@fagundes.com"]
+    assert [row["email"] for row in ranged] == ["u1@fagundes.com", "u2@fagundes.com", "u3@fagundes.com"]
+    assert "password" not in first[0]
+
+
+@pytest.mark.anyio
+async def test_list_page_walks_a_date_range_along_the_created_at_index(repo_session, monkeypatch):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    # Inserted out of date order, so (created_at, id) order differs from id order.
+    days = [5, 2, 4, 2, 3, 1, 4]
+    for index, day in enumerate(days):
+        repo_session.add(
+            User(
+                name=f"U{index}",
+                email=f"u{index}@fagundes.com",
+                password="hashed",
+                role_id=role.id,
+                created_at=date(2026, 3, day),
+            )
+        )
+    await repo_session.commit()
+    statements = []
+    execute = repo_session.execute
+
+    async def capture(statement, *args, **kwargs):
+        statements.append(statement)
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(repo_session, "execute", capture)
+    window = {"created_from": date(2026, 3, 2), "created_to": date(2026, 3, 4)}
+    # Act
+    pages, after_id = [], None
+    while True:
+        page = await repository.list_page(after_id=after_id, limit=2, **window)
+        if not page:
+            break
+        pages.append([row["email"] for row in page])
+        after_id = page[-1]["id"]
+    monkeypatch.undo()
+    await repo_session.execute(text("SET enable_seqscan = off"))
+    sql = statements[-1].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = "\n".join((await repo_session.execute(text(f"EXPLAIN {sql}"))).scalars())
+    await repo_session.execute(text("RESET enable_seqscan"))
+    # Assert
+    assert pages == [
+        ["u1@fagundes.com", "u3@fagundes.com"],
+        ["u4@fagundes.com", "u2@fagundes.com"],
+        ["u6@fagundes.com"],
+    ]
+    assert "ix_users_created_at_id" in plan
+    assert "Sort" not in plan
+
+
+@pytest.mark.anyio
+async def test_create_unique_is_one_statement_under_10ms_p95(repo_session, query_budget):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    await repository.exists_by_email("warm-up@fagundes.com")
+    durations: list[float] = []
+    # Act
+    for index in range(40):
+        with query_budget(max_statements=1) as capture:
+            await repository.create_unique(
+                name="Budget", email=f"budget{index}@fagundes.com", password="hashed", role_id=role.id
+            )
+        durations.append(capture.elapsed_ms)
+    # Assert
+    assert_p95_within(durations, 10.0)
+
+
+@pytest.mark.anyio
+async def test_date_filtered_page_after_a_deleted_cursor_user_is_rejected(repo_session):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    for name in ("a", "b", "c"):
+        await repository.create_unique(name=name, email=f"{name}@fagundes.com", password="hashed", role_id=role.id)
+    await repo_session.commit()
+    window = {"created_from": date(2000, 1, 1)}
+    first = await repository.list_page(after_id=None, limit=2, **window)
+    await repo_session.execute(delete(User).where(User.id == first[-1]["id"]))
+    await repo_session.commit()
+    # Act / Assert
+    with pytest.raises(StaleCursorError):
+        await repository.list_page(after_id=first[-1]["id"], limit=2, **window)
+    assert await repository.list_page(after_id=first[0]["id"], limit=2, **window) != []
+
+
+@pytest.mark.anyio
+async def test_list_page_never_lazy_loads_relationships(repo_session, query_budget):
+    # Arrange
+    role = await _create_role(repo_session)
+    repository = SqlUserRepository(repo_session)
+    for index in range(5):
+        await repository.create_unique(name="U", email=f"lazy{index}@fagundes.com", password="hashed", role_id=role.id)
+    await repo_session.commit()
+    # Act
+    with query_budget(max_statements=1):
+        rows = await repository.list_page(after_id=None, limit=5)
+    # Assert
+    assert len(rows) == 5
@@ -1,9 +1,25 @@
 from datetime import date
 
 import pytest
+from sqlalchemy import text
 
 from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError
-from src.application.schemas import UserCreateInput, UserOutput
+from src.application.schemas import (
+    UserBatchCreateInput,
+    UserBatchItemResult,
+    UserBatchOutput,
+    UserCreateInput,
+    UserListQuery,
+    UserOutput,
+    UserPage,
+)
+from src.infrastructure.persistence.models import Role
+from src.infrastructure.persistence.repositories import (
+    CachedRoleRepository,
+    SqlUserReportRepository,
+    UserWriteCoalescer,
+)
+from src.infrastructure.persistence.repositories.coalescing_user_repository import batch_size_histogram
 from src.presentation import deps
 
 
@@ -133,3 +149,235 @@ async def test_create_user_returns_422_for_invalid_payload(api_client):
 
     # Assert
     assert response.status_code == 422
+
+
+class FakeBatchService:
+    def __init__(self, result: UserBatchOutput):
+        self.result = result
+        self.calls: list[UserBatchCreateInput] = []
+
+    async def create_users(self, payload: UserBatchCreateInput) -> UserBatchOutput:
+        self.calls.append(payload)
+        return self.result
+
+
+@pytest.mark.anyio
+async def test_create_users_batch_returns_per_item_results(api_client):
+    # Arrange
+    user_output = UserOutput(
+        id=1,
+        name="Bruno",
+        email="bruno@fagundes.com",
+        role_id=1,
+        created_at=date(2026, 2, 6),
+        updated_at=None,
+    )
+    batch_output = UserBatchOutput(
+        created=1,
+        failed=1,
+        results=[
+            UserBatchItemResult(index=0, status="created", user=user_output),
+            UserBatchItemResult(
+                index=1,
+                status="role-not-found",
+                problem=RoleNotFoundError(99).to_dict(),
+            ),
+        ],
+    )
+    fake_service = FakeBatchService(batch_output)
+
+    # Act
+    async def _override():
+        return fake_service
+
+    async with api_client({deps.get_create_users_batch_use_case: _override}) as client:
+        response = await client.post(
+            "/v1/users:batch",
+            json={
+                "users": [
+                    {"name": "Bruno", "email": "bruno@fagundes.com", "role_id": 1, "password": "Senha123!"},
+                    {"name": "Ana", "email": "ana@fagundes.com", "role_id": 99},
+                ]
+            },
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == batch_output.model_dump(mode="json")
+    assert len(fake_service.calls[0].users) == 2
+
+
+@pytest.mark.anyio
+async def test_create_users_batch_returns_422_for_empty_batch(api_client):
+    # Arrange
+    fake_service = FakeBatchService(UserBatchOutput(created=0, failed=0, results=[]))
+
+    # Act
+    async def _override():
+        return fake_service
+
+    async with api_client({deps.get_create_users_batch_use_case: _override}) as client:
+        response = await client.post("/v1/users:batch", json={"users": []})
+
+    # Assert
+    assert response.status_code == 422
+    assert fake_service.calls == []
+
+
+class FakeListUsersUseCase:
+    def __init__(self) -> None:
+        self.queries: list[UserListQuery] = []
+
+    async def list_users(self, query: UserListQuery) -> UserPage:
+        self.queries.append(query)
+        user = UserOutput(
+            id=7, name="Bruno", email="bruno@fagundes.com", role_id=1, created_at=date(2026, 2, 6), updated_at=None
+        )
+        return UserPage(items=[user], next_cursor=7)
+
+
+@pytest.mark.anyio
+async def test_list_users_returns_page_with_next_cursor(api_client):
+    # Arrange
+    use_case = FakeListUsersUseCase()
+    # Act
+    async with api_client({deps.get_list_users_use_case: lambda: use_case}) as client:
+        response = await client.get("/v1/users", params={"cursor": 3, "limit": 1, "role_id": 1})
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] == 7
+    assert response.json()["items"][0]["email"] == "bruno@fagundes.com"
+    assert (use_case.queries[0].cursor, use_case.queries[0].limit, use_case.queries[0].role_id) == (3, 1, 1)
+
+
+@pytest.mark.anyio
+async def test_list_users_rejects_invalid_filters(api_client):
+    # Arrange
+    use_case = FakeListUsersUseCase()
+    # Act
+    async with api_client({deps.get_list_users_use_case: lambda: use_case}) as client:
+        response = await client.get("/v1/users", params={"created_from": "2026-02-07", "created_to": "2026-02-06"})
+    # Assert
+    assert response.status_code == 422
+    assert use_case.queries == []
+
+
+@pytest.fixture
+async def database_overrides(repo_session, postgres_async_session_factory):
+    role = Role(description="Admin")
+    repo_session.add(role)
+    await repo_session.commit()
+    role_cache = CachedRoleRepository(postgres_async_session_factory)
+    await role_cache.refresh()
+
+    async def _override_get_db():
+        try:
+            yield repo_session
+        finally:
+            if repo_session.in_transaction():
+                await repo_session.rollback()
+
+    return role.id, {deps.get_db: _override_get_db, deps.get_role_repository: lambda: role_cache}
+
+
+@pytest.mark.anyio
+async def test_create_user_issues_at_most_two_statements(api_client, database_overrides, query_budget):
+    # Arrange
+    role_id, overrides = database_overrides
+    payload = {"name": "Bruno", "email": "budget@fagundes.com", "role_id": role_id, "password": "Senha123!"}
+    # Act
+    async with api_client(overrides) as client:
+        with query_budget(max_statements=2) as capture:
+            response = await client.post("/v1/users", json=payload)
+    # Assert
+    assert response.status_code == 201
+    assert len(capture.statements) == 2
+
+
+@pytest.mark.anyio
+async def test_list_users_issues_one_statement_per_page(api_client, database_overrides, query_budget):
+    # Arrange
+    role_id, overrides = database_overrides
+    async with api_client(overrides) as client:
+        for index in range(3):
+            await client.post(
+                "/v1/users",
+                json={"name": "U", "email": f"page{index}@fagundes.com", "role_id": role_id, "password": "Senha123!"},
+            )
+        # Act
+        with query_budget(max_statements=1):
+            response = await client.get("/v1/users", params={"limit": 2, "role_id": role_id})
+    # Assert
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.anyio
+async def test_create_user_replays_response_for_repeated_idempotency_key(api_client, database_overrides, repo_session):
+    # Arrange
+    role_id, overrides = database_overrides
+    payload = {"name": "Bruno", "email": "retry@fagundes.com", "role_id": role_id, "password": "Senha123!"}
+    headers = {"Idempotency-Key": "3f0c2a9e-retry"}
+    # Act
+    async with api_client(overrides) as client:
+        first = await client.post("/v1/users", json=payload, headers=headers)
+        retry = await client.post("/v1/users", json=payload, headers=headers)
+        reused = await client.post("/v1/users", json={**payload, "name": "Other"}, headers=headers)
+    users = await repo_session.scalar(text("SELECT count(*) FROM users WHERE email = 'retry@fagundes.com'"))
+    # Assert
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json()
+    assert users == 1
+    assert reused.status_code == 422
+    assert reused.json()["idempotency_key"] == "3f0c2a9e-retry"
+
+
+@pytest.mark.anyio
+async def test_user_report_reads_the_rollup(api_client, database_overrides, repo_session, query_budget):
+    # Arrange
+    _, overrides = database_overrides
+    await SqlUserReportRepository(repo_session).count_created_users(
+        [(1, date(2026, 2, 5), 1), (2, date(2026, 2, 6), 1), (3, date(2026, 2, 6), 2)]
+    )
+    await repo_session.commit()
+    # Act
+    async with api_client(overrides) as client:
+        with query_budget(max_statements=1):
+            response = await client.get("/v1/reports/users", params={"created_from": "2026-02-06"})
+        invalid = await client.get(
+            "/v1/reports/users", params={"created_from": "2026-02-06", "created_to": "2026-02-05"}
+        )
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [
+            {"day": "2026-02-06", "role_id": 1, "users": 1, "cumulative_users": 2},
+            {"day": "2026-02-06", "role_id": 2, "users": 1, "cumulative_users": 1},
+        ],
+        "total_users": 2,
+    }
+    assert invalid.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_keyed_creates_bypass_the_write_coalescer(
+    api_client, database_overrides, repo_session, postgres_async_session_factory, monkeypatch
+):
+    # Arrange
+    role_id, overrides = database_overrides
+    monkeypatch.setattr(deps, "user_write_coalescer", UserWriteCoalescer(postgres_async_session_factory))
+    batches = batch_size_histogram.count()
+
+    def payload(email: str) -> dict:
+        return {"name": "Bruno", "email": email, "role_id": role_id, "password": "Senha123!"}
+
+    # Act
+    async with api_client(overrides) as client:
+        keyed = await client.post("/v1/users", json=payload("keyed@fagundes.com"), headers={"Idempotency-Key": "k1"})
+        coalesced = await client.post("/v1/users", json=payload("coalesced@fagundes.com"))
+        await deps.user_write_coalescer.stop()
+    stored = await repo_session.scalar(text("SELECT count(*) FROM idempotency_keys WHERE key = 'k1'"))
+    # Assert
+    assert (keyed.status_code, coalesced.status_code) == (201, 201)
+    assert batch_size_histogram.count() == batches + 1
+    assert stored == 1
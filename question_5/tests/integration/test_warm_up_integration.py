@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.persistence.models import User
+from src.infrastructure.persistence.warm_up import warm_up_pool, warm_up_validators
+
+
+@pytest.mark.anyio
+async def test_warm_up_pool_leaves_connections_open_with_hot_statements_prepared(
+    postgres_async_engine, postgres_test_schema, repo_session
+):
+    # Arrange
+    pooled = create_async_engine(
+        postgres_async_engine.url,
+        connect_args={"server_settings": {"search_path": postgres_test_schema}},
+        pool_size=2,
+    )
+    try:
+        # Act
+        await warm_up_pool(pooled, 2)
+        # Assert
+        assert pooled.sync_engine.pool.checkedin() == 2
+        async with pooled.connect() as connection:
+            prepared = await connection.scalar(text("SELECT count(*) FROM pg_prepared_statements"))
+        assert prepared >= 3
+    finally:
+        await pooled.dispose()
+    assert await repo_session.scalar(select(func.count()).select_from(User)) == 0
+
+
+def test_warm_up_validators_runs_every_request_schema():
+    # Arrange / Act / Assert
+    warm_up_validators()
@@ -0,0 +1,90 @@
+import pytest
+
+from src.application.address_normalization import (
+    address_tokens,
+    compare_address_batch,
+    compare_addresses,
+    indel_ratio,
+    normalize_address_text,
+    token_set_ratio,
+)
+from src.domain.entities import AddressEntity
+
+
+def _address(street: str, district: str = "Bela Vista", city: str = "São Paulo", cep: str = "01310100"):
+    return AddressEntity(cep=cep, street=street, district=district, city=city, state="SP")
+
+
+@pytest.mark.parametrize(
+    ("value", "tokens"),
+    [
+        ("  Av. São  João, nº 1 ", ("avenida", "sao", "joao", "no", "1")),
+        ("R. Dr. João de Barros", ("rua", "doutor", "joao", "barros")),
+        ("PÇA. N.S. DA CONCEIÇÃO", ("praca", "n", "s", "conceicao")),
+        ("Pça NS Conceição", ("praca", "nossa", "senhora", "conceicao")),
+        ("Estr. do M’Boi Mirim – km 3", ("estrada", "m", "boi", "mirim", "km", "3")),
+        ("", ()),
+    ],
+)
+def test_address_tokens_fold_accents_punctuation_and_abbreviations(value, tokens):
+    # Act / Assert
+    assert address_tokens(value) == tokens
+
+
+def test_normalize_address_text_joins_the_tokens():
+    # Act / Assert
+    assert normalize_address_text("Al. Santos, 1000") == "alameda santos 1000"
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        ("", "", 1.0),
+        ("abc", "", 0.0),
+        ("paulista", "paulista", 1.0),
+        ("abcd", "xyzw", 0.0),
+        ("kitten", "sitting", 2 * 4 / 13),
+    ],
+)
+def test_indel_ratio_is_twice_the_lcs_over_the_total_length(left, right, expected):
+    # Act / Assert
+    assert indel_ratio(left, right) == pytest.approx(expected)
+
+
+def test_token_set_ratio_ignores_order_repetition_and_contained_values():
+    # Act / Assert
+    assert token_set_ratio(("avenida", "paulista"), ("paulista", "avenida", "paulista")) == 1.0
+    assert token_set_ratio(("paulista",), ("avenida", "paulista")) == 1.0
+    assert token_set_ratio((), ()) == 1.0
+    assert token_set_ratio(("paulista",), ()) == 0.0
+    assert token_set_ratio(("bela", "vista"), ("bela", "vsta")) == pytest.approx(18 / 19)
+    assert token_set_ratio(("oscar", "freire"), ("augusta",)) < 0.5
+
+
+def test_compare_addresses_scores_fields_and_skips_empty_ones():
+    # Arrange
+    company = _address("AV PAULISTA", district="BELA VISTA", city="SAO PAULO")
+    town_wide_cep = _address("", district="", city="Campinas", cep="13000000")
+    # Act
+    same = compare_addresses(company, _address("Avenida Paulista"))
+    different = compare_addresses(company, town_wide_cep)
+    # Assert
+    assert same.matches is True
+    assert same.scores == {"cep": 1.0, "state": 1.0, "city": 1.0, "district": 1.0, "street": 1.0}
+    assert different.matches is False
+    assert different.mismatched_fields == ["cep", "city"]
+    assert set(different.scores) == {"cep", "state", "city"}
+
+
+def test_compare_address_batch_matches_single_comparisons():
+    # Arrange
+    pairs = [
+        (_address("R. Augusta"), _address("Rua Augusta")),
+        (_address("R. Augusta"), _address("Rua Oscar Freire")),
+        (_address("Al. Santos"), _address("Alameda Santos")),
+    ]
+    # Act
+    results = compare_address_batch(pairs, min_similarity=0.9)
+    # Assert
+    assert results == [compare_addresses(left, right, min_similarity=0.9) for left, right in pairs]
+    assert [result.matches for result in results] == [True, False, True]
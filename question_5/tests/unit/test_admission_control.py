@@ -0,0 +1,192 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.infrastructure.metrics import admission_requests_total
+from src.presentation.middleware import AdaptiveConcurrencyLimit, AdmissionControlMiddleware
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limit(capacity: int = 4, **kwargs) -> AdaptiveConcurrencyLimit:
+    kwargs.setdefault("latency_target_seconds", 0.5)
+    return AdaptiveConcurrencyLimit(lambda: capacity, **kwargs)
+
+
+@pytest.mark.anyio
+async def test_limit_backs_off_once_per_window_on_slow_or_failed_requests():
+    # Arrange
+    clock = FakeClock()
+    limit = _limit(10, clock=clock)
+    for _ in range(3):
+        await limit.acquire(0)
+    # Act
+    limit.release(0.9)
+    limit.release(0.1, failed=True)
+    after_burst = limit.limit
+    clock.now = 1.0
+    limit.release(0.9)
+    # Assert
+    assert after_burst == 9
+    assert limit.limit == 8
+    assert limit.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_limit_grows_additively_while_in_use_up_to_capacity():
+    # Arrange
+    clock = FakeClock()
+    limit = _limit(4, min_limit=2, clock=clock)
+    await limit.acquire(0)
+    limit.release(1.0)
+    shrunk = limit.limit
+    # Act
+    for _ in range(20):
+        for _ in range(3):
+            await limit.acquire(0)
+        for _ in range(3):
+            limit.release(0.1)
+    idle_before = limit._limit
+    await limit.acquire(0)
+    limit.release(0.1)
+    # Assert
+    assert shrunk == 3
+    assert limit.limit == 4
+    assert limit._limit == idle_before
+
+
+@pytest.mark.anyio
+async def test_limit_never_drops_below_min_limit():
+    # Arrange
+    clock = FakeClock()
+    limit = _limit(2, min_limit=2, clock=clock)
+    # Act
+    for second in range(5):
+        clock.now = float(second)
+        await limit.acquire(0)
+        limit.release(0.0, failed=True)
+    # Assert
+    assert limit.limit == 2
+
+
+@pytest.mark.anyio
+async def test_waiters_get_released_slots_in_order_and_others_time_out():
+    # Arrange
+    limit = _limit(1, max_queued=1)
+    await limit.acquire(0)
+    first = asyncio.create_task(limit.acquire(1.0))
+    await asyncio.sleep(0)
+    # Act
+    queue_full = await limit.acquire(1.0)
+    no_wait = await limit.acquire(0)
+    limit.release(0.1)
+    admitted = await first
+    timed_out = await limit.acquire(0.01)
+    # Assert
+    assert (queue_full, no_wait, admitted, timed_out) == (False, False, True, False)
+    assert (limit.in_flight, limit.queued) == (1, 0)
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_gives_back_its_place_or_slot():
+    # Arrange
+    limit = _limit(1)
+    await limit.acquire(0)
+    waiting = asyncio.create_task(limit.acquire(1.0))
+    await asyncio.sleep(0)
+    granted = asyncio.create_task(limit.acquire(1.0))
+    await asyncio.sleep(0)
+    # Act
+    waiting.cancel()
+    await asyncio.sleep(0)
+    limit.release(0.1)
+    granted.cancel()
+    await asyncio.gather(waiting, granted, return_exceptions=True)
+    # Assert
+    assert (limit.in_flight, limit.queued) == (0, 0)
+
+
+@pytest.mark.anyio
+async def test_slot_handed_over_as_the_deadline_passes_is_kept():
+    # Arrange
+    limit = _limit(1)
+    await limit.acquire(0)
+    loop = asyncio.get_running_loop()
+    # The hand-over and the timeout land in the same loop iteration.
+    loop.call_later(0.01, limit.release, 0.1)
+    # Act
+    admitted = await limit.acquire(0.01)
+    # Assert
+    assert admitted is True
+    assert limit.in_flight == 1
+
+
+def _build_app(limit: AdaptiveConcurrencyLimit, gate: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware, limit=limit, routes={("POST", "/create")}, queue_timeout_seconds=0.05
+    )
+
+    @app.post("/create")
+    async def create():
+        await gate.wait()
+        return JSONResponse({"ok": True}, status_code=201)
+
+    @app.get("/create")
+    async def read():
+        return {"ok": True}
+
+    return app
+
+
+@pytest.mark.anyio
+async def test_middleware_sheds_excess_creates_with_problem_response():
+    # Arrange
+    gate = asyncio.Event()
+    limit = _limit(1)
+    app = _build_app(limit, gate)
+    shed_before = admission_requests_total.value("shed")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.post("/create"))
+        await asyncio.sleep(0.01)
+        # Act
+        shed = await client.post("/create")
+        read = await client.get("/create")
+        queued = asyncio.create_task(client.post("/create"))
+        await asyncio.sleep(0.01)
+        gate.set()
+        responses = await asyncio.gather(running, queued)
+    # Assert
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert shed.json()["type"] == "service-overloaded"
+    assert shed.json()["instance"] == "http://test/create"
+    assert read.status_code == 200
+    assert [response.status_code for response in responses] == [201, 201]
+    assert admission_requests_total.value("shed") == shed_before + 1
+    assert limit.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_middleware_passes_non_http_scopes_through():
+    # Arrange
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = AdmissionControlMiddleware(app, limit=_limit(), routes=set(), queue_timeout_seconds=0.05)
+    # Act
+    await middleware({"type": "lifespan"}, None, None)
+    # Assert
+    assert seen == ["lifespan"]
@@ -0,0 +1,270 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.application.exceptions import ProviderUnavailableError
+from src.domain.entities import AddressEntity, CachedCepEntity
+from src.infrastructure.providers import CachedCepProvider
+
+CEP = "01310100"
+PAULISTA = AddressEntity(cep=CEP, street="Avenida Paulista", district="Bela Vista", city="São Paulo", state="SP")
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **delta) -> None:
+        self.now += timedelta(**delta)
+
+
+class FakeCepProvider:
+    def __init__(self, addresses: dict[str, AddressEntity | None] | None = None) -> None:
+        self.addresses = addresses if addresses is not None else {CEP: PAULISTA}
+        self.calls: list[str] = []
+        self.error: Exception | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        self.calls.append(cep)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return self.addresses.get(cep)
+
+
+class FakeSessionFactory:
+    def __init__(self) -> None:
+        self.rows: dict[str, CachedCepEntity] = {}
+        self.error: Exception | None = None
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        if self.error is not None:
+            raise self.error
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def begin(self):
+        return self
+
+
+class FakeCepCacheRepository:
+    def __init__(self, session: FakeSessionFactory) -> None:
+        self.session = session
+
+    async def get(self, cep: str) -> CachedCepEntity | None:
+        return self.session.rows.get(cep)
+
+    async def put(self, entry: CachedCepEntity) -> None:
+        self.session.rows[entry.cep] = entry
+
+
+async def _settle() -> None:
+    # Lets background refreshes run to completion, done callbacks included.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def cache_parts(monkeypatch):
+    monkeypatch.setattr(
+        "src.infrastructure.providers.cached_cep_provider.SqlCepCacheRepository", FakeCepCacheRepository
+    )
+    clock = FakeClock()
+    provider = FakeCepProvider()
+    sessions = FakeSessionFactory()
+
+    def _cache(**kwargs) -> CachedCepProvider:
+        options = {"ttl_seconds": 3600.0, "negative_ttl_seconds": 60.0, "now": clock, **kwargs}
+        return CachedCepProvider(provider, sessions, **options)
+
+    return _cache, provider, sessions, clock
+
+
+@pytest.mark.anyio
+async def test_miss_fetches_once_and_fills_both_tiers(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, _ = cache_parts
+    cache = make_cache()
+    # Act
+    first = await cache.get_address(CEP)
+    second = await cache.get_address(CEP)
+    # Assert
+    assert first == second == PAULISTA
+    assert provider.calls == [CEP]
+    assert sessions.rows[CEP] == CachedCepEntity(CEP, PAULISTA, START)
+    assert (cache.misses, cache.memory_hits, cache.database_hits) == (1, 1, 0)
+    assert cache.hit_ratio == 0.5
+
+
+@pytest.mark.anyio
+async def test_database_tier_serves_what_another_worker_fetched(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, _ = cache_parts
+    sessions.rows[CEP] = CachedCepEntity(CEP, PAULISTA, START)
+    cache = make_cache()
+    # Act
+    address = await cache.get_address(CEP)
+    await cache.get_address(CEP)
+    # Assert
+    assert address == PAULISTA
+    assert provider.calls == []
+    assert (cache.database_hits, cache.memory_hits, len(cache)) == (1, 1, 1)
+
+
+@pytest.mark.anyio
+async def test_unknown_cep_is_cached_for_the_negative_ttl(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, clock = cache_parts
+    provider.addresses = {}
+    cache = make_cache()
+    # Act
+    first = await cache.get_address(CEP)
+    clock.advance(seconds=30)
+    within_ttl = await cache.get_address(CEP)
+    calls_within_ttl = list(provider.calls)
+    clock.advance(seconds=30)
+    provider.addresses = {CEP: PAULISTA}
+    stale = await cache.get_address(CEP)
+    await _settle()
+    refreshed = await cache.get_address(CEP)
+    # Assert
+    assert (first, within_ttl, stale) == (None, None, None)
+    assert calls_within_ttl == [CEP]
+    assert refreshed == PAULISTA
+    assert sessions.rows[CEP].address == PAULISTA
+
+
+@pytest.mark.anyio
+async def test_stale_entry_is_served_at_once_and_refreshed_in_the_background(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, clock = cache_parts
+    cache = make_cache()
+    await cache.get_address(CEP)
+    clock.advance(hours=2)
+    renamed = AddressEntity(cep=CEP, street="Av. Paulista", district="Bela Vista", city="São Paulo", state="SP")
+    provider.addresses = {CEP: renamed}
+    provider.gate = asyncio.Event()
+    # Act
+    stale = await cache.get_address(CEP)
+    stale_again = await cache.get_address(CEP)
+    provider.gate.set()
+    await _settle()
+    fresh = await cache.get_address(CEP)
+    # Assert
+    assert stale == stale_again == PAULISTA
+    assert fresh == renamed
+    assert provider.calls == [CEP, CEP]
+    assert cache.stale_served == 2
+    assert sessions.rows[CEP].fetched_at == clock.now
+
+
+@pytest.mark.anyio
+async def test_failed_refresh_keeps_serving_the_stale_entry(cache_parts):
+    # Arrange
+    make_cache, provider, _, clock = cache_parts
+    cache = make_cache()
+    await cache.get_address(CEP)
+    clock.advance(hours=2)
+    provider.error = ProviderUnavailableError("cep", "timeout")
+    # Act
+    stale = await cache.get_address(CEP)
+    await _settle()
+    still_stale = await cache.get_address(CEP)
+    await _settle()
+    # Assert
+    assert stale == still_stale == PAULISTA
+    assert cache.refresh_failures == 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_provider_call(cache_parts):
+    # Arrange
+    make_cache, provider, _, _ = cache_parts
+    provider.gate = asyncio.Event()
+    cache = make_cache()
+    waiters = [asyncio.create_task(cache.get_address(CEP)) for _ in range(5)]
+    await _settle()
+    # Act
+    waiters[0].cancel()
+    provider.gate.set()
+    results = await asyncio.gather(*waiters[1:])
+    # Assert
+    assert results == [PAULISTA] * 4
+    assert provider.calls == [CEP]
+
+
+@pytest.mark.anyio
+async def test_provider_failure_on_a_miss_reaches_the_caller_and_is_not_cached(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, _ = cache_parts
+    provider.error = ProviderUnavailableError("cep", "circuit open")
+    cache = make_cache()
+    # Act
+    with pytest.raises(ProviderUnavailableError):
+        await cache.get_address(CEP)
+    provider.error = None
+    address = await cache.get_address(CEP)
+    # Assert
+    assert address == PAULISTA
+    assert provider.calls == [CEP, CEP]
+
+
+@pytest.mark.anyio
+async def test_lru_evicts_the_least_recently_used_cep(cache_parts):
+    # Arrange
+    make_cache, provider, _, _ = cache_parts
+    provider.addresses = {cep: None for cep in ("00000001", "00000002", "00000003")}
+    cache = make_cache(max_entries=2)
+    # Act
+    await cache.get_address("00000001")
+    await cache.get_address("00000002")
+    await cache.get_address("00000001")
+    await cache.get_address("00000003")
+    # Assert
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert list(cache._entries) == ["00000001", "00000003"]
+
+
+@pytest.mark.anyio
+async def test_cache_table_failures_fall_back_to_the_provider(cache_parts):
+    # Arrange
+    make_cache, provider, sessions, _ = cache_parts
+    sessions.error = ConnectionError("database down")
+    cache = make_cache()
+    # Act
+    address = await cache.get_address(CEP)
+    # Assert
+    assert address == PAULISTA
+    assert provider.calls == [CEP]
+    assert sessions.rows == {}
+
+
+@pytest.mark.anyio
+async def test_stop_cancels_pending_refreshes(cache_parts):
+    # Arrange
+    make_cache, provider, _, clock = cache_parts
+    cache = make_cache()
+    await cache.get_address(CEP)
+    clock.advance(hours=2)
+    provider.gate = asyncio.Event()
+    await cache.get_address(CEP)
+    await _settle()
+    # Act
+    await cache.stop()
+    # Assert
+    assert cache._refreshes == {}
+    assert cache.refresh_failures == 0
+    assert cache.hit_ratio == 0.5
@@ -0,0 +1,203 @@
+import pytest
+
+from src.infrastructure.persistence.models import Role
+from src.infrastructure.persistence.repositories.cached_role_repository import (
+    ROLES_CHANGED_CHANNEL,
+    CachedRoleRepository,
+)
+
+
+class FakeScalarResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return list(self.rows)
+
+
+class FakeAsyncSession:
+    def __init__(self, factory):
+        self.factory = factory
+        self.info = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def scalars(self, query):
+        self.factory.queries += 1
+        self.factory.events.append("query")
+        if self.factory.during_query is not None:
+            during_query, self.factory.during_query = self.factory.during_query, None
+            during_query()
+        return FakeScalarResult(self.factory.roles)
+
+
+class FakeSessionFactory:
+    def __init__(self, roles):
+        self.roles = roles
+        self.queries = 0
+        self.events = []
+        self.during_query = None
+
+    def __call__(self):
+        return FakeAsyncSession(self)
+
+
+class FakeListenerConnection:
+    def __init__(self, events=None):
+        self.events = events if events is not None else []
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.events.append("listen")
+        self.listeners[channel] = callback
+
+    def notify(self):
+        self.listeners[ROLES_CHANGED_CHANNEL](self, 1, ROLES_CHANGED_CHANNEL, "UPDATE")
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.anyio
+async def test_get_by_id_serves_from_memory_after_warm_up():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory)
+    await cache.start()
+    # Act
+    found = await cache.get_by_id(1)
+    missing = await cache.get_by_id(2)
+    # Assert
+    assert found.description == "admin"
+    assert missing is None
+    assert factory.queries == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_get_existing_ids_counts_hits_and_misses():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin"), Role(id=2, description="viewer")])
+    cache = CachedRoleRepository(factory)
+    # Act
+    found = await cache.get_existing_ids({1, 2, 3})
+    # Assert
+    assert found == {1, 2}
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert factory.queries == 1
+
+
+@pytest.mark.anyio
+async def test_cache_reloads_once_ttl_expires(monkeypatch):
+    # Arrange
+    now = [100.0]
+    monkeypatch.setattr(
+        "src.infrastructure.persistence.repositories.cached_role_repository.time.monotonic", lambda: now[0]
+    )
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory, ttl_seconds=10)
+    await cache.get_by_id(1)
+    factory.roles = [Role(id=1, description="admin"), Role(id=2, description="viewer")]
+    # Act
+    before_expiry = await cache.get_by_id(2)
+    now[0] = 111.0
+    after_expiry = await cache.get_by_id(2)
+    # Assert
+    assert before_expiry is None
+    assert after_expiry.description == "viewer"
+    assert factory.queries == 2
+
+
+@pytest.mark.anyio
+async def test_notification_invalidates_cache_and_stop_closes_listener():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory)
+    connection = FakeListenerConnection()
+
+    async def connect():
+        return connection
+
+    await cache.start(connect)
+    factory.roles = []
+    # Act
+    connection.listeners[ROLES_CHANGED_CHANNEL](connection, 1, ROLES_CHANGED_CHANNEL, "DELETE")
+    result = await cache.get_by_id(1)
+    await cache.stop()
+    # Assert
+    assert result is None
+    assert factory.queries == 2
+    assert connection.closed is True
+
+
+@pytest.mark.anyio
+async def test_lost_listener_falls_back_to_ttl():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory)
+    connection = FakeListenerConnection()
+
+    async def connect():
+        return connection
+
+    await cache.start(connect)
+    # Act
+    connection.termination_listeners[0](connection)
+    await cache.get_by_id(1)
+    await cache.stop()
+    # Assert
+    assert factory.queries == 2
+    assert connection.closed is False
+
+
+@pytest.mark.anyio
+async def test_notification_during_a_reload_keeps_the_cache_expired():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory)
+    connection = FakeListenerConnection()
+
+    async def connect():
+        return connection
+
+    await cache.start(connect)
+    cache.invalidate()
+    factory.during_query = connection.notify
+    # Act
+    await cache.get_by_id(1)
+    factory.roles = [Role(id=1, description="owner")]
+    role = await cache.get_by_id(1)
+    again = await cache.get_by_id(1)
+    # Assert
+    assert role.description == "owner"
+    assert again.description == "owner"
+    assert factory.queries == 3
+
+
+@pytest.mark.anyio
+async def test_start_listens_before_the_initial_load():
+    # Arrange
+    factory = FakeSessionFactory([Role(id=1, description="admin")])
+    cache = CachedRoleRepository(factory)
+    connection = FakeListenerConnection(factory.events)
+    factory.during_query = connection.notify
+
+    async def connect():
+        return connection
+
+    # Act
+    await cache.start(connect)
+    factory.roles = [Role(id=1, description="owner")]
+    role = await cache.get_by_id(1)
+    # Assert
+    assert factory.events == ["listen", "query", "query"]
+    assert role.description == "owner"
@@ -0,0 +1,237 @@
+import os
+import runpy
+import sys
+
+import pytest
+
+from src import import_ceps
+from src.domain.entities import AddressEntity
+from src.infrastructure.providers import CepDataset, OfflineCepProvider, compile_cep_dataset
+from src.infrastructure.providers.cep_dataset import read_cep_csv
+
+PAULISTA = AddressEntity(
+    cep="01310100", street="Avenida Paulista", district="Bela Vista", city="São Paulo", state="SP"
+)
+AUGUSTA = AddressEntity(cep="01305000", street="Rua Augusta", district="Consolação", city="São Paulo", state="SP")
+COPACABANA = AddressEntity(
+    cep="22070011", street="Avenida Atlântica", district="Copacabana", city="Rio de Janeiro", state="RJ"
+)
+
+
+def _row(address: AddressEntity, **overrides) -> dict[str, str]:
+    row = {
+        "cep": address.cep,
+        "street": address.street,
+        "district": address.district,
+        "city": address.city,
+        "state": address.state,
+    }
+    return {**row, **overrides}
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = str(tmp_path / "ceps.bin")
+    compile_cep_dataset([_row(COPACABANA), _row(PAULISTA, cep="01310-100"), _row(AUGUSTA)], path)
+    return path
+
+
+@pytest.fixture
+def dataset(dataset_path):
+    dataset = CepDataset(dataset_path)
+    try:
+        yield dataset
+    finally:
+        dataset.close()
+
+
+class FakeCepProvider:
+    def __init__(self, addresses: dict[str, AddressEntity]) -> None:
+        self.addresses = addresses
+        self.calls: list[str] = []
+
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        self.calls.append(cep)
+        return self.addresses.get(cep)
+
+
+def test_dataset_finds_every_compiled_cep(dataset):
+    # Act
+    found = [dataset.get(address.cep) for address in (PAULISTA, AUGUSTA, COPACABANA)]
+    # Assert
+    assert found == [PAULISTA, AUGUSTA, COPACABANA]
+    assert len(dataset) == 3
+
+
+@pytest.mark.parametrize("cep", ["00000000", "01310099", "01310101", "99999999", "0131010", "0131010a", ""])
+def test_dataset_answers_none_for_ceps_it_does_not_hold(dataset, cep):
+    # Act / Assert
+    assert dataset.get(cep) is None
+
+
+def test_compile_sorts_ceps_and_stores_each_string_once(tmp_path):
+    # Arrange
+    path = str(tmp_path / "ceps.bin")
+    rows = [_row(COPACABANA), _row(AUGUSTA), _row(PAULISTA)]
+    # Act
+    ceps, strings = compile_cep_dataset(rows, path)
+    # Assert
+    assert (ceps, strings) == (3, 8)
+    with open(path, "rb") as file:
+        content = file.read()
+    assert content.count("São Paulo".encode()) == 1
+    assert content.index(b"Augusta") < content.index(b"Paulista") < content.index(b"Copacabana")
+    assert not os.path.exists(f"{path}.partial")
+
+
+def test_compile_keeps_the_last_row_of_a_repeated_cep(tmp_path):
+    # Arrange
+    path = str(tmp_path / "ceps.bin")
+    rows = [_row(PAULISTA, street="Av. Paulista"), _row(PAULISTA, state=" sp ")]
+    # Act
+    ceps, _ = compile_cep_dataset(rows, path)
+    dataset = CepDataset(path)
+    # Assert
+    assert ceps == 1
+    assert dataset.get(PAULISTA.cep) == PAULISTA
+    dataset.close()
+
+
+def test_compile_replaces_an_existing_dataset_without_disturbing_its_readers(dataset_path, dataset):
+    # Act
+    compile_cep_dataset([_row(AUGUSTA)], dataset_path)
+    replaced = CepDataset(dataset_path)
+    # Assert
+    assert dataset.get(PAULISTA.cep) == PAULISTA
+    assert replaced.get(PAULISTA.cep) is None
+    assert replaced.get(AUGUSTA.cep) == AUGUSTA
+    replaced.close()
+
+
+def test_empty_dataset_holds_nothing(tmp_path):
+    # Arrange
+    path = str(tmp_path / "ceps.bin")
+    compile_cep_dataset([], path)
+    # Act
+    dataset = CepDataset(path)
+    # Assert
+    assert len(dataset) == 0
+    assert dataset.get(PAULISTA.cep) is None
+    dataset.close()
+
+
+@pytest.mark.parametrize(
+    ("row", "message"),
+    [
+        (_row(PAULISTA, cep="1310-100"), r"line 2: '1310-100' is not an 8-digit CEP"),
+        (_row(PAULISTA, state="São Paulo"), r"line 2: 'São Paulo' is not a two-letter state"),
+        (_row(PAULISTA, street="x" * 70_000), r"is longer than 65535 bytes"),
+    ],
+)
+def test_compile_rejects_rows_that_do_not_fit_the_format(tmp_path, row, message):
+    # Act / Assert
+    with pytest.raises(ValueError, match=message):
+        compile_cep_dataset([row], str(tmp_path / "ceps.bin"))
+
+
+@pytest.mark.parametrize("corrupt", [lambda content: b"NOTACEPS" + content[8:], lambda content: content[:10]])
+def test_dataset_refuses_files_it_did_not_write(dataset_path, tmp_path, corrupt):
+    # Arrange
+    path = tmp_path / "corrupt.bin"
+    with open(dataset_path, "rb") as file:
+        path.write_bytes(corrupt(file.read()))
+    # Act / Assert
+    with pytest.raises(ValueError, match="is not a CEP dataset"):
+        CepDataset(str(path))
+
+
+def test_dataset_refuses_truncated_files(dataset_path, tmp_path):
+    # Arrange
+    path = tmp_path / "truncated.bin"
+    with open(dataset_path, "rb") as file:
+        path.write_bytes(file.read()[:-1])
+    # Act / Assert
+    with pytest.raises(ValueError, match="is truncated"):
+        CepDataset(str(path))
+
+
+def test_read_cep_csv_accepts_via_cep_column_names(tmp_path):
+    # Arrange
+    path = tmp_path / "ceps.csv"
+    path.write_text(
+        "\ufeffCEP;Logradouro;Bairro;Localidade;UF;IBGE\n01310-100;Avenida Paulista;Bela Vista;São Paulo;SP;3550308\n"
+        "01305000;Rua Augusta;Consolação;São Paulo\n",
+        encoding="utf-8",
+    )
+    # Act
+    rows = list(read_cep_csv(str(path), delimiter=";"))
+    # Assert
+    assert rows == [
+        {
+            "cep": "01310-100",
+            "street": "Avenida Paulista",
+            "district": "Bela Vista",
+            "city": "São Paulo",
+            "state": "SP",
+            "ibge": "3550308",
+        },
+        {
+            "cep": "01305000",
+            "street": "Rua Augusta",
+            "district": "Consolação",
+            "city": "São Paulo",
+            "state": "",
+            "ibge": "",
+        },
+    ]
+
+
+def test_read_cep_csv_requires_every_column(tmp_path):
+    # Arrange
+    path = tmp_path / "ceps.csv"
+    path.write_text("cep,street,city\n01310100,Avenida Paulista,São Paulo\n", encoding="utf-8")
+    # Act / Assert
+    with pytest.raises(ValueError, match="has no district, state column"):
+        list(read_cep_csv(str(path)))
+
+
+@pytest.mark.anyio
+async def test_offline_provider_only_asks_the_fallback_about_ceps_missing_from_the_dataset(dataset):
+    # Arrange
+    novo = AddressEntity(cep="01310200", street="Avenida Nova", district="Bela Vista", city="São Paulo", state="SP")
+    fallback = FakeCepProvider({novo.cep: novo})
+    provider = OfflineCepProvider(dataset, fallback)
+    # Act
+    found = [await provider.get_address(cep) for cep in (PAULISTA.cep, novo.cep, "99999999", AUGUSTA.cep)]
+    # Assert
+    assert found == [PAULISTA, novo, None, AUGUSTA]
+    assert fallback.calls == [novo.cep, "99999999"]
+    assert (provider.hits, provider.misses) == (2, 2)
+
+
+def test_import_command_compiles_a_csv(tmp_path, capsys):
+    # Arrange
+    csv_path = tmp_path / "ceps.csv"
+    csv_path.write_text(
+        "cep,street,district,city,state\n01310-100,Avenida Paulista,Bela Vista,São Paulo,SP\n", encoding="utf-8"
+    )
+    output_path = str(tmp_path / "ceps.bin")
+    # Act
+    import_ceps.main([str(csv_path), output_path])
+    dataset = CepDataset(output_path)
+    # Assert
+    assert dataset.get(PAULISTA.cep) == PAULISTA
+    assert f"1 CEPs, 3 distinct strings, 0.0 MiB written to {output_path}" in capsys.readouterr().out
+    dataset.close()
+
+
+def test_import_module_runs_main_when_executed(monkeypatch, capsys):
+    # Arrange
+    monkeypatch.setattr("sys.argv", ["src.import_ceps", "--help"])
+    monkeypatch.delitem(sys.modules, "src.import_ceps")
+    # Act
+    with pytest.raises(SystemExit) as exited:
+        runpy.run_module("src.import_ceps", run_name="__main__")
+    # Assert
+    assert exited.value.code == 0
+    assert "offline CEP dataset" in capsys.readouterr().out
@@ -6,6 +6,7 @@ from typing import Any
 
 import pytest
 
+from src.application.exceptions import EmailAlreadyExistsError
 from src.application.schemas import UserCreateInput
 from src.application.use_cases.create_user import CreateUserUseCase
 from src.domain.entities import RoleEntity
@@ -24,22 +25,25 @@ class FakeRoleRepository:
 
 @dataclass
 class FakeConcurrentUserRepository:
+    """Mimics the unique index on ``users.email``: the check and the insert happen atomically."""
+
     existing_emails: set[str] = field(default_factory=set)
     created_users: list[User] = field(default_factory=list)
-    _exists_calls: int = 0
+    _create_calls: int = 0
 
     def __post_init__(self) -> None:
         self._barrier = asyncio.Event()
 
     async def exists_by_email(self, email: str) -> bool:
-        exists_snapshot = email in self.existing_emails
-        self._exists_calls += 1
-        if self._exists_calls == 2:
+        return email in self.existing_emails
+
+    async def create_unique(self, *, name: str, email: str, password: str, role_id: int) -> Any:
+        self._create_calls += 1
+        if self._create_calls == 2:
             self._barrier.set()
         await self._barrier.wait()
-        return exists_snapshot
-
-    async def create(self, *, name: str, email: str, password: str, role_id: int) -> Any:
+        if email in self.existing_emails:
+            raise EmailAlreadyExistsError(email)
         user = User(
             id=len(self.created_users) + 1,
             name=name,
@@ -53,18 +57,18 @@ class FakeConcurrentUserRepository:
         self.existing_emails.add(email)
         return user
 
-    async def refresh(self, instance: Any) -> None:
-        return None
-
 
 class FakeUnitOfWork:
     @asynccontextmanager
     async def transaction(self):
         yield
 
+    async def release(self) -> None:
+        return None
+
 
 @pytest.mark.anyio
-async def test_create_user_allows_duplicate_email_under_race_condition():
+async def test_create_user_rejects_duplicate_email_under_race_condition():
     # Arrange
     user_repository = FakeConcurrentUserRepository()
     role_repository = FakeRoleRepository(role=RoleEntity(id=1, description="Admin"))
@@ -75,9 +79,12 @@ async def test_create_user_allows_duplicate_email_under_race_condition():
         return await use_case.create_user(payload)
 
     # Act
-    result_one, result_two = await asyncio.gather(_run_once(), _run_once())
+    results = await asyncio.gather(_run_once(), _run_once(), return_exceptions=True)
 
     # Assert
-    assert result_one.email == payload.email
-    assert result_two.email == payload.email
-    assert len(user_repository.created_users) == 2
+    created = [result for result in results if not isinstance(result, Exception)]
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert [user.email for user in created] == [payload.email]
+    assert len(errors) == 1
+    assert isinstance(errors[0], EmailAlreadyExistsError)
+    assert len(user_repository.created_users) == 1
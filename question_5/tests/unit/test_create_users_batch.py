@@ -0,0 +1,153 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+import pytest
+
+from src.application.schemas import UserBatchCreateInput, UserCreateInput
+from src.application.use_cases.create_users_batch import CreateUsersBatchUseCase
+from src.infrastructure.persistence.models import User
+
+
+@dataclass
+class FakeRoleRepository:
+    role_ids: set[int] = field(default_factory=lambda: {1})
+    requested: list[set[int]] = field(default_factory=list)
+
+    async def get_existing_ids(self, role_ids) -> set[int]:
+        self.requested.append(set(role_ids))
+        return self.role_ids & set(role_ids)
+
+
+@dataclass
+class FakeUserRepository:
+    existing_emails: set[str] = field(default_factory=set)
+    racing_emails: set[str] = field(default_factory=set)
+    inserted: list[Any] = field(default_factory=list)
+
+    async def get_existing_emails(self, emails) -> set[str]:
+        return self.existing_emails & set(emails)
+
+    async def create_many(self, users) -> list[Any]:
+        created = []
+        for user in users:
+            if user.email in self.racing_emails:
+                continue
+            created.append(
+                User(
+                    id=len(self.inserted) + len(created) + 1,
+                    name=user.name,
+                    email=user.email,
+                    password=user.password,
+                    role_id=user.role_id,
+                    created_at=user.created_at,
+                    updated_at=None,
+                )
+            )
+        self.inserted.extend(users)
+        return created
+
+
+@dataclass
+class FakeUnitOfWork:
+    transaction_committed: bool = False
+    events: list[str] = field(default_factory=list)
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.events.append("transaction")
+        yield
+        self.transaction_committed = True
+
+    async def release(self) -> None:
+        self.events.append("release")
+
+
+def _payload(*items: tuple[str, int]) -> UserBatchCreateInput:
+    return UserBatchCreateInput(
+        users=[
+            UserCreateInput(name="User", email=email, role_id=role_id, password="Plain123!")
+            for email, role_id in items
+        ]
+    )
+
+
+@pytest.mark.anyio
+async def test_create_users_reports_per_item_results():
+    # Arrange
+    role_repo = FakeRoleRepository()
+    user_repo = FakeUserRepository(existing_emails={"taken@fagundes.com"})
+    unit_of_work = FakeUnitOfWork()
+    use_case = CreateUsersBatchUseCase(user_repo, role_repo, unit_of_work)
+    payload = _payload(
+        ("new@fagundes.com", 1),
+        ("norole@fagundes.com", 9),
+        ("taken@fagundes.com", 1),
+        ("new@fagundes.com", 1),
+    )
+    # Act
+    result = await use_case.create_users(payload)
+    # Assert
+    assert role_repo.requested == [{1, 9}]
+    assert [item.status for item in result.results] == [
+        "created",
+        "role-not-found",
+        "email-already-exists",
+        "email-already-exists",
+    ]
+    assert result.created == 1
+    assert result.failed == 3
+    assert result.results[0].user.email == "new@fagundes.com"
+    assert result.results[1].problem["status"] == 404
+    assert result.results[1].problem["role_id"] == 9
+    assert result.results[2].problem["type"] == "email-already-exists"
+    assert [user.email for user in user_repo.inserted] == ["new@fagundes.com"]
+    assert user_repo.inserted[0].password.startswith("$argon2")
+    assert unit_of_work.transaction_committed is True
+
+
+@pytest.mark.anyio
+async def test_create_users_reports_conflict_when_insert_loses_a_race():
+    # Arrange
+    user_repo = FakeUserRepository(racing_emails={"race@fagundes.com"})
+    use_case = CreateUsersBatchUseCase(user_repo, FakeRoleRepository(), FakeUnitOfWork())
+    payload = _payload(("race@fagundes.com", 1), ("ok@fagundes.com", 1))
+    # Act
+    result = await use_case.create_users(payload)
+    # Assert
+    assert [item.status for item in result.results] == ["email-already-exists", "created"]
+    assert result.results[0].user is None
+    assert result.created == 1
+
+
+@pytest.mark.anyio
+async def test_create_users_generates_passwords_when_not_supplied(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("src.application.use_cases.create_users_batch.generate_password", lambda: "TempPass1!")
+    user_repo = FakeUserRepository()
+    use_case = CreateUsersBatchUseCase(user_repo, FakeRoleRepository(), FakeUnitOfWork())
+    payload = UserBatchCreateInput(users=[UserCreateInput(name="Ana", email="ana@fagundes.com", role_id=1)])
+    # Act
+    result = await use_case.create_users(payload)
+    # Assert
+    assert result.results[0].status == "created"
+    assert result.results[0].user.created_at == date.today()
+    assert "TempPass1!" not in user_repo.inserted[0].password
+
+
+@pytest.mark.anyio
+async def test_create_users_releases_connection_before_hashing(monkeypatch):
+    # Arrange
+    unit_of_work = FakeUnitOfWork()
+
+    async def recording_hash(password: str) -> str:
+        unit_of_work.events.append("hash")
+        return "hashed"
+
+    monkeypatch.setattr("src.application.use_cases.create_users_batch.hash_password_async", recording_hash)
+    use_case = CreateUsersBatchUseCase(FakeUserRepository(), FakeRoleRepository(), unit_of_work)
+    # Act
+    await use_case.create_users(_payload(("a@fagundes.com", 1), ("b@fagundes.com", 1)))
+    # Assert
+    assert unit_of_work.events == ["release", "hash", "hash", "transaction"]
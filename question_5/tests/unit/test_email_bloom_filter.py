@@ -0,0 +1,81 @@
+import pytest
+
+from src.infrastructure.persistence.email_bloom_filter import EmailBloomFilter
+
+
+async def _emails(*emails: str):
+    for email in emails:
+        yield email
+
+
+def test_sizing_for_fifty_million_emails_stays_bounded():
+    # Arrange / Act
+    bloom = EmailBloomFilter(capacity=50_000_000, false_positive_rate=0.01)
+    # Assert
+    assert bloom.hash_count == 7
+    assert bloom.memory_bytes < 64 * 1024 * 1024
+
+
+def test_filter_answers_maybe_until_rebuilt():
+    # Arrange
+    bloom = EmailBloomFilter(capacity=1_000)
+    # Act / Assert
+    assert bloom.might_contain("anything@fagundes.com") is True
+    assert bloom.negatives == bloom.positives == 0
+
+
+@pytest.mark.anyio
+async def test_rebuild_loads_existing_emails_and_rules_out_unknown_ones():
+    # Arrange
+    bloom = EmailBloomFilter(capacity=1_000)
+    bloom.add("stale@fagundes.com")
+    # Act
+    await bloom.rebuild(_emails("a@fagundes.com", "b@fagundes.com"))
+    # Assert
+    assert bloom.ready is True
+    assert bloom.items == 2
+    assert bloom.might_contain("a@fagundes.com") is True
+    assert bloom.might_contain("b@fagundes.com") is True
+    assert sum(bloom.might_contain(f"new-{index}@fagundes.com") for index in range(1_000)) < 50
+    assert bloom.expected_false_positive_rate < 0.01
+
+
+@pytest.mark.anyio
+async def test_rebuild_in_chunks_keeps_emails_added_while_it_runs():
+    # Arrange
+    bloom = EmailBloomFilter(capacity=1_000)
+
+    async def emails_with_a_concurrent_signup():
+        for index in range(5):
+            if index == 3:
+                bloom.add("late@fagundes.com")
+            yield f"{index}@fagundes.com"
+
+    # Act
+    await bloom.rebuild(emails_with_a_concurrent_signup(), chunk_size=2)
+    # Assert
+    assert bloom.items == 6
+    assert all(bloom.might_contain(f"{index}@fagundes.com") for index in range(5))
+    assert bloom.might_contain("late@fagundes.com") is True
+    assert bloom._added_during_rebuild is None
+
+
+@pytest.mark.anyio
+async def test_false_positive_rate_is_tracked_only_once_ready():
+    # Arrange
+    bloom = EmailBloomFilter(capacity=1_000)
+    bloom.record_false_positives()
+    await bloom.rebuild(_emails())
+    # Act
+    bloom.might_contain("a@fagundes.com")
+    bloom.record_false_positives(1)
+    # Assert
+    assert bloom.false_positives == 1
+    assert bloom.observed_false_positive_rate == 0.5
+
+
+def test_observed_false_positive_rate_is_zero_without_lookups():
+    # Arrange / Act
+    bloom = EmailBloomFilter(capacity=10)
+    # Assert
+    assert bloom.observed_false_positive_rate == 0.0
@@ -0,0 +1,199 @@
+import asyncio
+
+import pytest
+
+from src.application.exceptions import ProviderUnavailableError
+from src.domain.entities import AddressEntity
+from src.infrastructure.providers import HedgeBudget, HedgedCnpjProvider, LatencyDigest
+
+CNPJ = "11222333000181"
+
+
+def _address(street: str) -> AddressEntity:
+    return AddressEntity(cep="01310100", street=street, district="Bela Vista", city="São Paulo", state="SP")
+
+
+class FakeCnpjProvider:
+    def __init__(self, name: str, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return _address(self.name)
+
+
+async def _settle() -> None:
+    # Lets cancelled losers finish unwinding and run their done callbacks.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def _hedged(primary, backup, *, budget: HedgeBudget | None = None, **kwargs) -> HedgedCnpjProvider:
+    options = {"min_delay_seconds": 0.01, "max_delay_seconds": 0.05, "min_samples": 3, **kwargs}
+    return HedgedCnpjProvider(primary, backup, budget=budget or HedgeBudget(), **options)
+
+
+def test_latency_digest_quantiles_follow_the_recent_window():
+    # Arrange
+    digest = LatencyDigest(window=100)
+    empty = digest.quantile(0.95)
+    # Act
+    for millis in range(1, 201):
+        digest.record(millis / 1000)
+    # Assert
+    assert empty is None
+    assert len(digest) == 100
+    assert digest.quantile(0.5) == 0.151
+    assert digest.quantile(0.95) == 0.196
+    assert digest.quantile(1.0) == 0.2
+
+
+def test_hedge_budget_allows_one_hedge_per_ratio_of_lookups():
+    # Arrange
+    budget = HedgeBudget(ratio=0.25, burst=1.0)
+    # Act
+    first = budget.try_spend()
+    refused = budget.try_spend()
+    for _ in range(4):
+        budget.earn()
+    after_four_lookups = budget.try_spend()
+    # Assert
+    assert (first, refused, after_four_lookups) == (True, False, True)
+
+
+@pytest.mark.anyio
+async def test_fast_primary_answers_without_a_hedge():
+    # Arrange
+    primary, backup = FakeCnpjProvider("primary"), FakeCnpjProvider("backup")
+    provider = _hedged(primary, backup)
+    # Act
+    address = await provider.get_company_address(CNPJ)
+    # Assert
+    assert address.street == "primary"
+    assert backup.calls == 0
+    assert provider.hedges == 0
+    assert len(provider.primary_latency) == 1
+
+
+@pytest.mark.anyio
+async def test_slow_primary_is_hedged_and_the_loser_cancelled():
+    # Arrange
+    primary, backup = FakeCnpjProvider("primary", delay=1.0), FakeCnpjProvider("backup", delay=0.01)
+    provider = _hedged(primary, backup)
+    loop = asyncio.get_running_loop()
+    # Act
+    started = loop.time()
+    address = await provider.get_company_address(CNPJ)
+    elapsed = loop.time() - started
+    await _settle()
+    # Assert
+    assert address.street == "backup"
+    assert elapsed < 0.5
+    assert primary.cancelled == 1
+    assert (provider.hedges, provider.hedge_wins) == (1, 1)
+    assert len(provider.primary_latency) == len(provider.backup_latency) == 1
+
+
+@pytest.mark.anyio
+async def test_primary_that_answers_after_the_hedge_still_wins():
+    # Arrange
+    primary, backup = FakeCnpjProvider("primary", delay=0.08), FakeCnpjProvider("backup", delay=1.0)
+    provider = _hedged(primary, backup)
+    # Act
+    address = await provider.get_company_address(CNPJ)
+    await _settle()
+    # Assert
+    assert address.street == "primary"
+    assert backup.cancelled == 1
+    assert (provider.hedges, provider.hedge_wins) == (1, 0)
+
+
+@pytest.mark.anyio
+async def test_exhausted_budget_waits_for_the_primary():
+    # Arrange
+    primary, backup = FakeCnpjProvider("primary", delay=0.08), FakeCnpjProvider("backup")
+    provider = _hedged(primary, backup, budget=HedgeBudget(ratio=0.0, burst=0.0))
+    # Act
+    address = await provider.get_company_address(CNPJ)
+    # Assert
+    assert address.street == "primary"
+    assert backup.calls == 0
+    assert provider.hedges_denied == 1
+
+
+@pytest.mark.anyio
+async def test_failed_primary_fails_over_without_spending_budget():
+    # Arrange
+    primary = FakeCnpjProvider("primary", error=ProviderUnavailableError("cnpj", "circuit open"))
+    backup = FakeCnpjProvider("backup")
+    budget = HedgeBudget(ratio=0.0, burst=0.0)
+    provider = _hedged(primary, backup, budget=budget)
+    # Act
+    address = await provider.get_company_address(CNPJ)
+    # Assert
+    assert address.street == "backup"
+    assert provider.failovers == 1
+    assert provider.hedge_wins == 0
+    assert len(provider.primary_latency) == 0
+
+
+@pytest.mark.anyio
+async def test_both_failing_raises_the_primary_error():
+    # Arrange
+    primary_error = ProviderUnavailableError("cnpj", "timeout")
+    primary = FakeCnpjProvider("primary", delay=0.08, error=primary_error)
+    backup = FakeCnpjProvider("backup", error=ProviderUnavailableError("cnpj_backup", "status 500"))
+    provider = _hedged(primary, backup)
+    # Act
+    with pytest.raises(ProviderUnavailableError) as error:
+        await provider.get_company_address(CNPJ)
+    # Assert
+    assert error.value is primary_error
+    assert provider.hedges == 1
+
+
+@pytest.mark.anyio
+async def test_hedge_delay_tracks_the_primary_p95_within_bounds():
+    # Arrange
+    provider = _hedged(FakeCnpjProvider("primary"), FakeCnpjProvider("backup"), max_delay_seconds=0.5)
+    cold = provider.hedge_delay
+    # Act
+    for seconds in (0.1, 0.2, 0.3):
+        provider.primary_latency.record(seconds)
+    warm = provider.hedge_delay
+    for _ in range(100):
+        provider.primary_latency.record(0.001)
+    floored = provider.hedge_delay
+    # Assert
+    assert cold == 0.5
+    assert warm == 0.3
+    assert floored == 0.01
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("cancel_after", [0.005, 0.07])
+async def test_cancelled_lookup_cancels_the_calls_in_flight(cancel_after):
+    # Arrange
+    primary, backup = FakeCnpjProvider("primary", delay=1.0), FakeCnpjProvider("backup", delay=1.0)
+    provider = _hedged(primary, backup)
+    lookup = asyncio.create_task(provider.get_company_address(CNPJ))
+    await asyncio.sleep(cancel_after)
+    # Act
+    lookup.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lookup
+    await _settle()
+    # Assert
+    assert primary.cancelled == 1
+    assert backup.cancelled == backup.calls
@@ -0,0 +1,191 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.application.exceptions import EmailAlreadyExistsError, IdempotencyKeyReusedError
+from src.application.schemas import UserCreateInput, UserOutput
+from src.application.use_cases import IdempotentCreateUserUseCase, InFlightRequests
+from src.application.use_cases.idempotent_create_user import request_fingerprint
+from src.domain.entities import IdempotencyRecord
+
+PAYLOAD = UserCreateInput(name="Bruno", email="bruno@fagundes.com", role_id=1, password="Senha123!")
+OUTPUT = UserOutput(
+    id=7, name="Bruno", email="bruno@fagundes.com", role_id=1, created_at=date(2026, 2, 6), updated_at=None
+)
+
+
+class FakeIdempotencyRepository:
+    def __init__(self, *, accept_saves: bool = True) -> None:
+        self.records: dict[str, IdempotencyRecord] = {}
+        self.accept_saves = accept_saves
+        self.gets = 0
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        self.gets += 1
+        return self.records.get(key)
+
+    async def save(self, key, *, fingerprint, status_code, response, ttl_seconds) -> bool:
+        if not self.accept_saves:
+            return False
+        now = datetime.now(timezone.utc)
+        self.records[key] = IdempotencyRecord(key, fingerprint, status_code, response, now, now)
+        return True
+
+    def store(self, key: str, payload: UserCreateInput = PAYLOAD) -> None:
+        now = datetime.now(timezone.utc)
+        self.records[key] = IdempotencyRecord(
+            key, request_fingerprint(payload), 201, OUTPUT.model_dump(mode="json"), now, now
+        )
+
+
+class FakeCreateUser:
+    def __init__(self, *, error: Exception | None = None, gate: asyncio.Event | None = None) -> None:
+        self.error = error
+        self.gate = gate
+        self.calls = 0
+
+    async def create_user(self, payload: UserCreateInput, *, on_created=None) -> UserOutput:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        if on_created is not None:
+            await on_created(OUTPUT)
+        return OUTPUT
+
+
+def _use_case(create_user: FakeCreateUser, repository: FakeIdempotencyRepository) -> IdempotentCreateUserUseCase:
+    return IdempotentCreateUserUseCase(create_user, repository, InFlightRequests(), ttl_seconds=60)
+
+
+@pytest.mark.anyio
+async def test_without_key_creates_directly():
+    # Arrange
+    create_user = FakeCreateUser()
+    repository = FakeIdempotencyRepository()
+    # Act
+    result = await _use_case(create_user, repository).create_user(PAYLOAD)
+    # Assert
+    assert result == OUTPUT
+    assert (create_user.calls, repository.gets, repository.records) == (1, 0, {})
+
+
+@pytest.mark.anyio
+async def test_keyed_creates_go_through_the_keyed_use_case():
+    # Arrange
+    create_user, keyed_create_user = FakeCreateUser(), FakeCreateUser()
+    repository = FakeIdempotencyRepository()
+    use_case = IdempotentCreateUserUseCase(
+        create_user, repository, InFlightRequests(), keyed_create_user_use_case=keyed_create_user
+    )
+    # Act
+    await use_case.create_user(PAYLOAD)
+    await use_case.create_user(PAYLOAD, "key-1")
+    # Assert
+    assert (create_user.calls, keyed_create_user.calls) == (1, 1)
+    assert set(repository.records) == {"key-1"}
+
+
+@pytest.mark.anyio
+async def test_first_request_stores_response_and_retry_replays_it():
+    # Arrange
+    create_user = FakeCreateUser()
+    use_case = _use_case(create_user, FakeIdempotencyRepository())
+    # Act
+    first = await use_case.create_user(PAYLOAD, "key-1")
+    retry = await use_case.create_user(PAYLOAD, "key-1")
+    # Assert
+    assert first == retry == OUTPUT
+    assert create_user.calls == 1
+
+
+@pytest.mark.anyio
+async def test_key_reused_for_a_different_payload_is_rejected():
+    # Arrange
+    repository = FakeIdempotencyRepository()
+    repository.store("key-1")
+    other = PAYLOAD.model_copy(update={"name": "Someone else"})
+    # Act & Assert
+    with pytest.raises(IdempotencyKeyReusedError) as error:
+        await _use_case(FakeCreateUser(), repository).create_user(other, "key-1")
+    assert error.value.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicates_in_process_wait_for_the_first_and_replay():
+    # Arrange
+    gate = asyncio.Event()
+    create_user = FakeCreateUser(gate=gate)
+    use_case = _use_case(create_user, FakeIdempotencyRepository())
+    # Act
+    requests = [asyncio.create_task(use_case.create_user(PAYLOAD, "key-1")) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*requests)
+    # Assert
+    assert results == [OUTPUT] * 3
+    assert create_user.calls == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_disturb_the_owner():
+    # Arrange
+    gate = asyncio.Event()
+    use_case = _use_case(FakeCreateUser(gate=gate), FakeIdempotencyRepository())
+    owner = asyncio.create_task(use_case.create_user(PAYLOAD, "key-1"))
+    waiter = asyncio.create_task(use_case.create_user(PAYLOAD, "key-1"))
+    await asyncio.sleep(0)
+    # Act
+    waiter.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+    # Assert
+    assert await owner == OUTPUT
+    assert waiter.cancelled()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("create_user", "repository"),
+    [
+        (FakeCreateUser(error=EmailAlreadyExistsError("bruno@fagundes.com")), None),
+        (FakeCreateUser(), FakeIdempotencyRepository(accept_saves=False)),
+    ],
+    ids=["email-taken", "key-taken"],
+)
+async def test_losing_a_cross_process_race_replays_the_winner(create_user, repository):
+    # Arrange
+    repository = repository or FakeIdempotencyRepository()
+    use_case = _use_case(create_user, repository)
+    original_get = repository.get
+
+    async def get_after_winner_commits(key: str):
+        if repository.gets == 1:
+            repository.store(key)
+        return await original_get(key)
+
+    repository.get = get_after_winner_commits
+    # Act
+    result = await use_case.create_user(PAYLOAD, "key-1")
+    # Assert
+    assert result == OUTPUT
+
+
+@pytest.mark.anyio
+async def test_email_conflict_without_stored_response_is_raised():
+    # Arrange
+    use_case = _use_case(
+        FakeCreateUser(error=EmailAlreadyExistsError("bruno@fagundes.com")), FakeIdempotencyRepository()
+    )
+    # Act & Assert
+    with pytest.raises(EmailAlreadyExistsError):
+        await use_case.create_user(PAYLOAD, "key-1")
+    assert use_case.in_flight._running == {}
+
+
+def test_fingerprint_ignores_password():
+    # Arrange / Act / Assert
+    assert request_fingerprint(PAYLOAD) == request_fingerprint(PAYLOAD.model_copy(update={"password": "Other123!"}))
+    assert request_fingerprint(PAYLOAD) != request_fingerprint(PAYLOAD.model_copy(update={"role_id": 2}))
@@ -0,0 +1,204 @@
+import gc
+import runpy
+import signal
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src import launcher
+from src.launcher import WorkerSupervisor, bind_socket, worker_settings
+
+
+def _settings(**overrides):
+    values = {
+        "DATABASE_MAX_CONNECTIONS": 80,
+        "DATABASE_WARM_UP_CONNECTIONS": 5,
+        "HASHING_WORKERS": None,
+        "OUTBOX_RELAY_ENABLED": False,
+    }
+    return SimpleNamespace(**{**values, **overrides})
+
+
+def test_worker_settings_split_connection_and_cpu_budgets():
+    # Arrange / Act
+    split = worker_settings(_settings(), workers=4, cpu_count=8)
+    tight = worker_settings(_settings(DATABASE_MAX_CONNECTIONS=6, HASHING_WORKERS=3), workers=8, cpu_count=4)
+    with_relay = worker_settings(_settings(OUTBOX_RELAY_ENABLED=True), workers=4, cpu_count=8)
+    # Assert
+    assert split == {
+        "DATABASE_POOL_SIZE": 19,
+        "DATABASE_MAX_OVERFLOW": 0,
+        "DATABASE_WARM_UP_CONNECTIONS": 5,
+        "HASHING_WORKERS": 2,
+    }
+    assert tight["DATABASE_POOL_SIZE"] == 1
+    assert tight["DATABASE_WARM_UP_CONNECTIONS"] == 1
+    assert tight["HASHING_WORKERS"] == 3
+    assert with_relay["DATABASE_POOL_SIZE"] == 18
+
+
+def test_supervisor_restarts_workers_until_stopped():
+    # Arrange
+    supervisor = WorkerSupervisor(lambda index: None, 2, min_uptime_seconds=1.0, restart_delay_seconds=0.01)
+    runner = threading.Thread(target=supervisor.run)
+    # Act
+    runner.start()
+    deadline = time.monotonic() + 5
+    while supervisor.restarts < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    supervisor.stop()
+    runner.join(timeout=5)
+    # Assert
+    assert not runner.is_alive()
+    assert supervisor.restarts >= 3
+
+
+def test_supervisor_stop_terminates_running_workers():
+    # Arrange
+    supervisor = WorkerSupervisor(lambda index: time.sleep(30), 2)
+    runner = threading.Thread(target=supervisor.run)
+    runner.start()
+    deadline = time.monotonic() + 5
+    while len(supervisor._children) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Act
+    supervisor.stop()
+    runner.join(timeout=5)
+    # Assert
+    assert not runner.is_alive()
+    assert supervisor.restarts == 0
+
+
+def test_supervisor_stop_ignores_workers_that_already_exited(monkeypatch):
+    # Arrange
+    supervisor = WorkerSupervisor(lambda index: None, 1)
+    supervisor._children[999_999_999] = (0, time.monotonic())
+
+    def missing(pid, signum):
+        raise ProcessLookupError(pid)
+
+    monkeypatch.setattr(launcher.os, "kill", missing)
+    # Act
+    supervisor.stop()
+    # Assert
+    assert supervisor._stopping is True
+
+
+def test_supervisor_run_returns_when_children_are_gone(monkeypatch):
+    # Arrange
+    supervisor = WorkerSupervisor(lambda index: None, 1)
+    monkeypatch.setattr(supervisor, "_spawn", lambda index: supervisor._children.update({1: (index, 0.0)}))
+
+    def no_children():
+        raise ChildProcessError
+
+    monkeypatch.setattr(launcher.os, "wait", no_children)
+    # Act
+    supervisor.run()
+    # Assert
+    assert supervisor.restarts == 0
+
+
+@pytest.mark.parametrize(("run_worker", "exit_code"), [(lambda index: None, 0), (lambda index: 1 / 0, 1)])
+def test_child_runs_worker_and_exits_without_returning(monkeypatch, run_worker, exit_code):
+    # Arrange
+    exits: list[int] = []
+    handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+
+    def fake_exit(code: int) -> None:
+        exits.append(code)
+        raise SystemExit(code)
+
+    monkeypatch.setattr(launcher.os, "_exit", fake_exit)
+    monkeypatch.setattr(launcher.os, "fork", lambda: 0)
+    supervisor = WorkerSupervisor(run_worker, 1)
+    # Act
+    try:
+        with pytest.raises(SystemExit):
+            supervisor._spawn(0)
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    # Assert
+    assert exits == [exit_code]
+
+
+def test_bind_socket_listens_and_is_inheritable():
+    # Arrange / Act
+    sock = bind_socket("127.0.0.1", 0)
+    try:
+        # Assert
+        assert sock.get_inheritable() is True
+        assert sock.getsockname()[1] > 0
+    finally:
+        sock.close()
+
+
+def test_serve_applies_overrides_before_running_uvicorn(monkeypatch):
+    # Arrange
+    served: list[tuple] = []
+    settings = SimpleNamespace(DATABASE_POOL_SIZE=10)
+
+    class FakeServer:
+        def __init__(self, config) -> None:
+            self.config = config
+
+        def run(self, sockets) -> None:
+            served.append((self.config.lifespan, sockets, settings.DATABASE_POOL_SIZE))
+
+    monkeypatch.setattr(launcher, "get_settings", lambda: settings)
+    monkeypatch.setattr(launcher.uvicorn, "Server", FakeServer)
+    monkeypatch.setattr(launcher, "log_writer", SimpleNamespace(close=lambda: served.append("log_writer.close")))
+    # Act
+    launcher.serve("socket", {"DATABASE_POOL_SIZE": 3})
+    # Assert
+    assert served == [("on", ["socket"], 3), "log_writer.close"]
+
+
+def test_main_freezes_heap_and_supervises_workers(monkeypatch):
+    # Arrange
+    started: list[tuple] = []
+    handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+
+    class FakeSupervisor:
+        def __init__(self, run_worker, workers) -> None:
+            self.run_worker = run_worker
+            self.workers = workers
+
+        def run(self) -> None:
+            started.append((self.workers, gc.isenabled(), gc.get_freeze_count() > 0))
+            self.run_worker(0)
+
+        def stop(self, *_) -> None:
+            return None
+
+    monkeypatch.setattr(launcher, "WorkerSupervisor", FakeSupervisor)
+    monkeypatch.setattr(launcher, "bind_socket", lambda host, port: (host, port))
+    monkeypatch.setattr(
+        launcher, "serve", lambda sock, overrides: started.append((sock, overrides["DATABASE_MAX_OVERFLOW"]))
+    )
+    # Act
+    try:
+        launcher.main(["--host", "0.0.0.0", "--port", "9000", "--workers", "3"])
+    finally:
+        gc.unfreeze()
+        gc.enable()
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    # Assert
+    assert started == [(3, False, True), (("0.0.0.0", 9000), 0)]
+
+
+def test_module_runs_main_when_executed(monkeypatch, capsys):
+    # Arrange
+    monkeypatch.setattr("sys.argv", ["src.launcher", "--help"])
+    monkeypatch.delitem(sys.modules, "src.launcher")
+    # Act
+    with pytest.raises(SystemExit) as exited:
+        runpy.run_module("src.launcher", run_name="__main__")
+    # Assert
+    assert exited.value.code == 0
+    assert "pre-forked uvicorn workers" in capsys.readouterr().out
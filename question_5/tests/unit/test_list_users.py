@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from src.application.schemas import UserListQuery
+from src.application.use_cases import ListUsersUseCase
+
+
+def _row(user_id: int) -> dict[str, Any]:
+    return {
+        "id": user_id,
+        "name": f"User {user_id}",
+        "email": f"user{user_id}@fagundes.com",
+        "role_id": 1,
+        "created_at": date(2026, 2, 6),
+        "updated_at": None,
+    }
+
+
+@dataclass
+class FakeUserRepository:
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    async def list_page(self, **kwargs) -> list[dict[str, Any]]:
+        self.calls.append(kwargs)
+        after_id = kwargs["after_id"] or 0
+        return [row for row in self.rows if row["id"] > after_id][: kwargs["limit"]]
+
+
+@pytest.mark.anyio
+async def test_list_users_returns_cursor_when_more_rows_exist():
+    # Arrange
+    repository = FakeUserRepository(rows=[_row(user_id) for user_id in (1, 2, 3)])
+    use_case = ListUsersUseCase(repository)
+    # Act
+    page = await use_case.list_users(UserListQuery(limit=2, role_id=1, created_from=date(2026, 1, 1)))
+    # Assert
+    assert [user.id for user in page.items] == [1, 2]
+    assert page.next_cursor == 2
+    assert repository.calls == [
+        {"after_id": None, "limit": 3, "role_id": 1, "created_from": date(2026, 1, 1), "created_to": None}
+    ]
+
+
+@pytest.mark.anyio
+async def test_list_users_last_page_has_no_cursor():
+    # Arrange
+    repository = FakeUserRepository(rows=[_row(user_id) for user_id in (1, 2, 3)])
+    use_case = ListUsersUseCase(repository)
+    # Act
+    page = await use_case.list_users(UserListQuery(cursor=2, limit=2))
+    # Assert
+    assert [user.id for user in page.items] == [3]
+    assert page.next_cursor is None
+
+
+def test_list_query_rejects_inverted_created_range():
+    # Arrange / Act / Assert
+    with pytest.raises(ValidationError):
+        UserListQuery(created_from=date(2026, 2, 7), created_to=date(2026, 2, 6))
+
+
+def test_list_query_bounds_page_size():
+    # Arrange / Act / Assert
+    with pytest.raises(ValidationError):
+        UserListQuery(limit=501)
@@ -0,0 +1,160 @@
+import logging
+import os
+import sys
+
+import pytest
+import structlog
+
+from src.infrastructure import log_writer as log_writer_module
+from src.infrastructure.log_writer import EventSampler, LogWriter, LogWriterHandler
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def test_writer_thread_writes_queued_lines_to_the_descriptor(pipe):
+    # Arrange
+    read_fd, write_fd = pipe
+    writer = LogWriter(write_fd)
+    # Act
+    for index in range(3):
+        writer.write(f'{{"n":{index}}}\n'.encode())
+    writer.close()
+    # Assert
+    assert os.read(read_fd, 1024) == b'{"n":0}\n{"n":1}\n{"n":2}\n'
+    assert (writer.written, writer.dropped) == (3, 0)
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking(pipe, monkeypatch):
+    # Arrange
+    read_fd, write_fd = pipe
+    writer = LogWriter(write_fd, max_queued=2)
+    monkeypatch.setattr(writer, "_start", lambda: None)
+    # Act
+    for line in (b"a\n", b"b\n", b"c\n"):
+        writer.write(line)
+    writer.close()
+    # Assert
+    assert writer.dropped == 1
+    assert os.read(read_fd, 1024) == b"a\nb\n"
+
+
+def test_drain_batches_lines_and_finishes_partial_writes(monkeypatch):
+    # Arrange
+    calls: list[bytes] = []
+
+    def short_write(fd: int, data) -> int:
+        calls.append(bytes(data))
+        return min(len(data), 3)
+
+    writer = LogWriter(99, max_batch_bytes=4)
+    monkeypatch.setattr(writer, "_start", lambda: None)
+    monkeypatch.setattr(log_writer_module.os, "write", short_write)
+    for line in (b"ab\n", b"cd\n", b"ef\n"):
+        writer.write(line)
+    # Act
+    writer.close()
+    # Assert
+    assert calls == [b"ab\ncd\n", b"cd\n", b"ef\n"]
+    assert writer.written == 3
+
+
+def test_failed_write_counts_the_batch_as_dropped(pipe, monkeypatch):
+    # Arrange
+    _, write_fd = pipe
+    writer = LogWriter(write_fd)
+    monkeypatch.setattr(writer, "_start", lambda: None)
+    writer.write(b"lost\n")
+    os.close(write_fd)
+    # Act
+    writer.close()
+    # Assert
+    assert (writer.written, writer.dropped) == (0, 1)
+
+
+def test_writer_restarts_after_close_and_resets_in_forked_children(pipe):
+    # Arrange
+    read_fd, write_fd = pipe
+    writer = LogWriter(write_fd)
+    writer.write(b"first\n")
+    writer.close()
+    # Act
+    writer.write(b"second\n")
+    writer.close()
+    writer._queue.append(b"parent\n")
+    writer._reset()
+    # Assert
+    assert os.read(read_fd, 1024) == b"first\nsecond\n"
+    assert (len(writer._queue), writer._thread) == (0, None)
+
+
+def test_sampler_drops_info_events_by_rate_but_keeps_warnings():
+    # Arrange
+    sampler = EventSampler(0.5, {"hot": 0.0, "rare": 1.0}, rng=lambda: 0.7)
+    # Act
+    kept = [
+        sampler(None, level, {"event": event})["event"]
+        for level, event in [("warning", "hot"), ("error", "other"), ("info", "rare")]
+    ]
+    for level, event in [("info", "hot"), ("debug", "other")]:
+        with pytest.raises(structlog.DropEvent):
+            sampler(None, level, {"event": event})
+    # Assert
+    assert kept == ["hot", "other", "rare"]
+    assert sampler.sampled_out == 2
+    assert EventSampler()(None, "info", {"event": "x"}) == {"event": "x"}
+
+
+class RecordingWriter:
+    def __init__(self) -> None:
+        self.lines: list = []
+
+    def write(self, line) -> None:
+        self.lines.append(line)
+
+
+def _record(level: int, message: str, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("uvicorn.error", level, __file__, 1, message, (), exc_info)
+
+
+def test_handler_renders_stdlib_records_through_the_processors():
+    # Arrange
+    writer = RecordingWriter()
+    handler = LogWriterHandler(writer, [structlog.processors.add_log_level, structlog.processors.format_exc_info])
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        exc_info = sys.exc_info()
+    # Act
+    handler.emit(_record(logging.ERROR, "failed", exc_info))
+    # Assert
+    line = writer.lines[0]
+    assert (line["event"], line["logger"], line["level"]) == ("failed", "uvicorn.error", "error")
+    assert "ValueError: bad" in line["exception"]
+
+
+def test_handler_skips_sampled_out_and_reports_broken_records(monkeypatch):
+    # Arrange
+    writer = RecordingWriter()
+    errors: list[logging.LogRecord] = []
+
+    def broken(_, __, event_dict):
+        raise RuntimeError("processor bug")
+
+    sampled = LogWriterHandler(writer, [EventSampler(0.0)])
+    failing = LogWriterHandler(writer, [broken])
+    monkeypatch.setattr(failing, "handleError", errors.append)
+    # Act
+    sampled.emit(_record(logging.INFO, "noise"))
+    failing.emit(_record(logging.WARNING, "lost"))
+    # Assert
+    assert writer.lines == []
+    assert [record.getMessage() for record in errors] == ["lost"]
@@ -1,10 +1,13 @@
 import os
+import threading
+from types import SimpleNamespace
 
 import httpx
 import pytest
 
 from src.application.exceptions import RFC7807Exception
-from src.main import create_application
+from src.main import create_application, rebuild_email_filter
+from src.presentation.middleware import AdmissionControlMiddleware, ProfilingMiddleware, ReadYourWritesMiddleware
 
 DEFAULT_ENV = {
     "DATABASE_HOST": "localhost",
@@ -85,3 +88,295 @@ async def test_root_redirects_to_docs():
     # Assert
     assert response.status_code == 307
     assert response.headers["location"] == "/docs"
+
+
+def test_read_your_writes_middleware_is_only_installed_with_replicas(monkeypatch):
+    # Arrange
+    settings = SimpleNamespace(
+        DATABASE_REPLICA_URLS=["postgresql+asyncpg://replica/db"],
+        DATABASE_READ_YOUR_WRITES_SECONDS=2,
+        PROFILING_ENABLED=False,
+        ADMISSION_CONTROL_ENABLED=False,
+    )
+    monkeypatch.setattr("src.main.get_settings", lambda: settings)
+    # Act
+    with_replicas = create_application()
+    settings.DATABASE_REPLICA_URLS = []
+    without_replicas = create_application()
+    # Assert
+    assert ReadYourWritesMiddleware in [middleware.cls for middleware in with_replicas.user_middleware]
+    assert ReadYourWritesMiddleware not in [middleware.cls for middleware in without_replicas.user_middleware]
+
+
+def test_profiling_middleware_is_only_installed_when_enabled(monkeypatch, tmp_path):
+    # Arrange
+    settings = SimpleNamespace(
+        DATABASE_REPLICA_URLS=[],
+        PROFILING_ENABLED=True,
+        PROFILING_INTERVAL_MS=2.0,
+        PROFILING_DIRECTORY=str(tmp_path),
+        PROFILING_MAX_PROFILES=10,
+        PROFILING_SAMPLE_RATE=0.01,
+        PROFILING_SECRET=None,
+        ADMISSION_CONTROL_ENABLED=False,
+    )
+    monkeypatch.setattr("src.main.get_settings", lambda: settings)
+    # Act
+    enabled = create_application()
+    settings.PROFILING_ENABLED = False
+    disabled = create_application()
+    # Assert
+    assert ProfilingMiddleware in [middleware.cls for middleware in enabled.user_middleware]
+    assert ProfilingMiddleware not in [middleware.cls for middleware in disabled.user_middleware]
+
+
+def test_admission_control_limit_follows_pool_and_hashing_capacity(monkeypatch):
+    # Arrange
+    settings = SimpleNamespace(
+        DATABASE_REPLICA_URLS=[],
+        PROFILING_ENABLED=False,
+        ADMISSION_CONTROL_ENABLED=True,
+        ADMISSION_LATENCY_TARGET_MS=500.0,
+        ADMISSION_QUEUE_TIMEOUT_MS=100.0,
+        ADMISSION_MAX_QUEUED=10,
+        ADMISSION_RETRY_AFTER_SECONDS=1,
+        DATABASE_POOL_SIZE=4,
+        DATABASE_MAX_OVERFLOW=0,
+    )
+    monkeypatch.setattr("src.main.get_settings", lambda: settings)
+    monkeypatch.setattr("src.main.hashing_capacity", lambda: 2)
+    # Act
+    app = create_application()
+    middleware = next(item for item in app.user_middleware if item.cls is AdmissionControlMiddleware)
+    limit = middleware.kwargs["limit"]
+    before = limit.limit
+    settings.DATABASE_POOL_SIZE = 1
+    # Assert
+    assert before == 6
+    assert limit.limit == 3
+    assert ("POST", "/v1/users") in middleware.kwargs["routes"]
+
+
+class FakeRoleCache:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+        self.connect = None
+
+    async def start(self, connect) -> None:
+        self.connect = connect
+        self.calls.append("role_cache.start")
+
+    async def stop(self) -> None:
+        self.calls.append("role_cache.stop")
+
+
+class FakeCoalescer:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+
+    async def stop(self) -> None:
+        self.calls.append("coalescer.stop")
+
+
+class FakeCepCache:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+
+    async def stop(self) -> None:
+        self.calls.append("cep_cache.stop")
+
+
+class FakeOutboxRelay:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+        self.connect = None
+
+    async def start(self, connect) -> None:
+        self.connect = connect
+        self.calls.append("outbox_relay.start")
+
+    async def stop(self) -> None:
+        self.calls.append("outbox_relay.stop")
+
+
+class FakePurger:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+
+    async def start(self) -> None:
+        self.calls.append("purger.start")
+
+    async def stop(self) -> None:
+        self.calls.append("purger.stop")
+
+
+def _fake_lifespan_resources(monkeypatch) -> tuple[list[str], FakeRoleCache, FakeOutboxRelay]:
+    calls: list[str] = []
+    role_cache = FakeRoleCache(calls)
+    monkeypatch.setattr("src.main.start_hashing_executor", lambda max_workers: calls.append("hashing.start"))
+
+    def fake_shutdown_hashing_executor() -> None:
+        # Waits for the pool's processes to exit, so it must not block the event loop's thread.
+        assert threading.current_thread() is not threading.main_thread()
+        calls.append("hashing.shutdown")
+
+    monkeypatch.setattr("src.main.shutdown_hashing_executor", fake_shutdown_hashing_executor)
+    monkeypatch.setattr("src.main.init_http_client", lambda settings: calls.append("http_client.init"))
+
+    async def fake_close_http_client() -> None:
+        calls.append("http_client.close")
+
+    monkeypatch.setattr("src.main.close_http_client", fake_close_http_client)
+    monkeypatch.setattr("src.main.deps.role_cache", role_cache)
+    monkeypatch.setattr("src.main.asyncpg.connect", lambda dsn: dsn)
+
+    async def fake_rebuild() -> None:
+        calls.append("email_filter.rebuild")
+
+    monkeypatch.setattr("src.main.rebuild_email_filter", fake_rebuild)
+    monkeypatch.setattr("src.main.deps.user_write_coalescer", FakeCoalescer(calls))
+    outbox_relay = FakeOutboxRelay(calls)
+    monkeypatch.setattr("src.main.deps.outbox_relay", outbox_relay)
+    monkeypatch.setattr("src.main.deps.cep_cache", FakeCepCache(calls))
+    monkeypatch.setattr("src.main.deps.retention_purgers", [FakePurger(calls)])
+    monkeypatch.setattr("src.main.init_database", lambda: calls.append("database.init") or "engine")
+
+    async def fake_warm_up_pool(engine, connections: int) -> None:
+        calls.append(f"warm_up_pool:{engine}:{connections}")
+
+    async def fake_dispose_database() -> None:
+        calls.append("database.dispose")
+
+    monkeypatch.setattr("src.main.warm_up_pool", fake_warm_up_pool)
+    monkeypatch.setattr("src.main.warm_up_validators", lambda: calls.append("warm_up_validators"))
+    monkeypatch.setattr("src.main.dispose_database", fake_dispose_database)
+    return calls, role_cache, outbox_relay
+
+
+@pytest.mark.anyio
+async def test_lifespan_starts_and_shuts_down_background_resources(monkeypatch):
+    # Arrange
+    calls, role_cache, outbox_relay = _fake_lifespan_resources(monkeypatch)
+    app = create_application()
+
+    # Act
+    async with app.router.lifespan_context(app):
+        started = list(calls)
+        ready_while_running = app.state.ready
+
+    # Assert
+    assert started[:6] == [
+        "database.init",
+        "hashing.start",
+        "http_client.init",
+        "role_cache.start",
+        "outbox_relay.start",
+        "purger.start",
+    ]
+    assert started[-2:] == ["warm_up_pool:engine:5", "warm_up_validators"]
+    assert ready_while_running is True
+    assert app.state.ready is False
+    assert calls[-8:] == [
+        "coalescer.stop",
+        "purger.stop",
+        "outbox_relay.stop",
+        "cep_cache.stop",
+        "role_cache.stop",
+        "http_client.close",
+        "hashing.shutdown",
+        "database.dispose",
+    ]
+    assert role_cache.connect().startswith("postgresql://")
+    assert outbox_relay.connect().startswith("postgresql://")
+
+
+@pytest.mark.anyio
+async def test_lifespan_tears_down_what_started_when_startup_fails(monkeypatch):
+    # Arrange
+    calls, _, _ = _fake_lifespan_resources(monkeypatch)
+
+    async def unreachable_database(engine, connections: int) -> None:
+        raise ConnectionRefusedError("database unreachable")
+
+    monkeypatch.setattr("src.main.warm_up_pool", unreachable_database)
+    app = create_application()
+    # Act
+    with pytest.raises(ConnectionRefusedError):
+        async with app.router.lifespan_context(app):
+            calls.append("served")
+    # Assert
+    assert calls[-8:] == [
+        "coalescer.stop",
+        "purger.stop",
+        "outbox_relay.stop",
+        "cep_cache.stop",
+        "role_cache.stop",
+        "http_client.close",
+        "hashing.shutdown",
+        "database.dispose",
+    ]
+    assert "served" not in calls
+    assert not getattr(app.state, "ready", False)
+
+
+class FakeEmailFilter:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.emails: list[str] = []
+
+    async def rebuild(self, emails) -> None:
+        if self.error is not None:
+            raise self.error
+        self.emails = [email async for email in emails]
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class FakeUserRepository:
+    def __init__(self, session) -> None:
+        self.session = session
+
+    async def stream_emails(self):
+        yield "a@fagundes.com"
+
+
+@pytest.mark.anyio
+async def test_rebuild_email_filter_streams_registered_emails(monkeypatch):
+    # Arrange
+    email_filter = FakeEmailFilter()
+    monkeypatch.setattr("src.main.deps.email_filter", email_filter)
+    monkeypatch.setattr("src.main.AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr("src.main.SqlUserRepository", FakeUserRepository)
+    # Act
+    await rebuild_email_filter()
+    # Assert
+    assert email_filter.emails == ["a@fagundes.com"]
+
+
+@pytest.mark.anyio
+async def test_rebuild_email_filter_logs_and_keeps_serving_on_failure(monkeypatch):
+    # Arrange
+    logged: list[str] = []
+    monkeypatch.setattr("src.main.deps.email_filter", FakeEmailFilter(RuntimeError("db down")))
+    monkeypatch.setattr("src.main.AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr("src.main.SqlUserRepository", FakeUserRepository)
+    monkeypatch.setattr("src.main.logger.exception", lambda event: logged.append(event))
+    # Act
+    await rebuild_email_filter()
+    # Assert
+    assert logged == ["email_filter.rebuild_failed"]
+
+
+@pytest.mark.anyio
+async def test_rebuild_email_filter_is_noop_when_disabled(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("src.main.deps.email_filter", None)
+    monkeypatch.setattr("src.main.AsyncSessionLocal", lambda: pytest.fail("no session expected"))
+    # Act / Assert
+    await rebuild_email_filter()
@@ -0,0 +1,75 @@
+from src.infrastructure.metrics import MetricsRegistry
+
+
+def test_counter_renders_one_sample_per_label_set():
+    # Arrange
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("route",))
+    # Act
+    counter.inc("/v1/users")
+    counter.inc("/v1/users", amount=2)
+    counter.inc('/odd"\\path\n')
+    # Assert
+    output = registry.render()
+    assert "# TYPE requests_total counter" in output
+    assert 'requests_total{route="/v1/users"} 3.0' in output
+    assert 'requests_total{route="/odd\\"\\\\path\\n"} 1.0' in output
+    assert counter.value("/v1/users") == 3
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    # Arrange
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stages.", ("stage",), buckets=(0.1, 1.0))
+    # Act
+    histogram.observe(0.05, "hash")
+    histogram.observe(0.1, "hash")
+    histogram.observe(3.0, "hash")
+    # Assert
+    output = registry.render()
+    assert 'stage_seconds_bucket{stage="hash",le="0.1"} 2.0' in output
+    assert 'stage_seconds_bucket{stage="hash",le="1.0"} 2.0' in output
+    assert 'stage_seconds_bucket{stage="hash",le="+Inf"} 3.0' in output
+    assert 'stage_seconds_sum{stage="hash"} 3.15' in output
+    assert 'stage_seconds_count{stage="hash"} 3.0' in output
+    assert histogram.count("hash") == 3
+    assert histogram.count("insert") == 0
+
+
+def test_unlabelled_histogram_is_exported_before_first_observation():
+    # Arrange
+    registry = MetricsRegistry()
+    registry.histogram("wait_seconds", "Waits.", buckets=(1.0,))
+    # Act
+    output = registry.render()
+    # Assert
+    assert 'wait_seconds_bucket{le="+Inf"} 0.0' in output
+    assert "wait_seconds_count 0.0" in output
+
+
+def test_callback_metrics_are_read_at_scrape_time():
+    # Arrange
+    registry = MetricsRegistry()
+    state = {"checked_out": 1, "hits": 4}
+    registry.callback("pool_checked_out", "Checked out.", lambda: state["checked_out"])
+    registry.callback(
+        "cache_total", "Cache.", lambda: [(("hit",), state["hits"])], label_names=("result",), metric_type="counter"
+    )
+    state["checked_out"] = 7
+    # Act
+    output = registry.render()
+    # Assert
+    assert "pool_checked_out 7.0" in output
+    assert "# TYPE cache_total counter" in output
+    assert 'cache_total{result="hit"} 4.0' in output
+
+
+def test_registering_same_name_replaces_previous_metric():
+    # Arrange
+    registry = MetricsRegistry()
+    registry.callback("filter_ready", "Ready.", lambda: 0)
+    # Act
+    registry.callback("filter_ready", "Ready.", lambda: 1)
+    # Assert
+    assert registry.render().count("# TYPE filter_ready") == 1
+    assert "filter_ready 1.0" in registry.render()
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from src.domain.entities import OutboxMessage
+from src.infrastructure.config import Settings
+from src.infrastructure.messaging import FileBroker, InMemoryBroker, OutboxRelay
+from src.infrastructure.messaging.outbox_relay import OUTBOX_PENDING_CHANNEL
+
+CREATED_AT = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
+
+
+def _message(message_id: int) -> OutboxMessage:
+    return OutboxMessage(message_id, "user.created", str(message_id), {"id": message_id}, CREATED_AT)
+
+
+class ScriptedRelay(OutboxRelay):
+    """Relay whose batches come from a script instead of the database."""
+
+    def __init__(self, script: list, **kwargs) -> None:
+        super().__init__(None, InMemoryBroker(), **kwargs)
+        self.script = script
+        self.batches = 0
+        self.idle = asyncio.Event()
+
+    async def relay_batch(self) -> int:
+        self.batches += 1
+        if not self.script:
+            self.idle.set()
+            return 0
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+class FakeListener:
+    def __init__(self) -> None:
+        self.callbacks = {}
+        self.on_terminated = None
+        self.closed = False
+
+    async def add_listener(self, channel, callback) -> None:
+        self.callbacks[channel] = callback
+
+    def add_termination_listener(self, callback) -> None:
+        self.on_terminated = callback
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.anyio
+async def test_relay_drains_full_batches_then_sleeps_until_notified():
+    # Arrange
+    listener = FakeListener()
+    relay = ScriptedRelay([2, 2, 1], batch_size=2, poll_interval_seconds=60)
+
+    async def connect():
+        return listener
+
+    await relay.start(connect)
+    # Act
+    await _wait_for(lambda: relay.batches == 3)
+    await asyncio.sleep(0.02)
+    drained = relay.batches
+    relay.script.append(1)
+    listener.callbacks[OUTBOX_PENDING_CHANNEL](listener, 1, OUTBOX_PENDING_CHANNEL, "")
+    await _wait_for(lambda: relay.batches == 4)
+    await relay.stop()
+    # Assert
+    assert drained == 3
+    assert relay.batches == 4
+    assert listener.closed is True
+
+
+@pytest.mark.anyio
+async def test_relay_retries_failed_batches_and_polls_without_listener():
+    # Arrange
+    relay = ScriptedRelay([RuntimeError("broker down"), 1], poll_interval_seconds=0.01, retry_delay_seconds=0.01)
+    # Act
+    await relay.start()
+    await _wait_for(lambda: relay.idle.is_set())
+    await relay.stop()
+    # Assert
+    assert relay.failures == 1
+    assert relay.batches >= 3
+
+
+@pytest.mark.anyio
+async def test_lost_listener_falls_back_to_polling():
+    # Arrange
+    listener = FakeListener()
+    relay = ScriptedRelay([], poll_interval_seconds=60)
+
+    async def connect():
+        return listener
+
+    await relay.start(connect)
+    # Act
+    listener.on_terminated(listener)
+    await relay.stop()
+    # Assert
+    assert listener.closed is False
+    assert relay._listener is None
+
+
+@pytest.mark.anyio
+async def test_in_memory_broker_keeps_the_latest_messages():
+    # Arrange
+    broker = InMemoryBroker(max_messages=2)
+    # Act
+    await broker.publish([_message(1), _message(2)])
+    await broker.publish([_message(3)])
+    # Assert
+    assert [message.id for message in broker.messages] == [2, 3]
+
+
+@pytest.mark.anyio
+async def test_file_broker_appends_one_json_line_per_message(tmp_path):
+    # Arrange
+    broker = FileBroker(tmp_path / "events" / "outbox.jsonl")
+    # Act
+    await broker.publish([_message(1), _message(2)])
+    await broker.publish([_message(3)])
+    # Assert
+    lines = [orjson.loads(line) for line in broker.path.read_bytes().splitlines()]
+    assert [line["id"] for line in lines] == [1, 2, 3]
+    assert lines[0] == {
+        "id": 1,
+        "topic": "user.created",
+        "key": "1",
+        "payload": {"id": 1},
+        "created_at": "2026-02-06T12:00:00+00:00",
+    }
+
+
+@pytest.mark.anyio
+async def test_file_broker_rotates_before_a_batch_would_exceed_the_cap(tmp_path):
+    # Arrange
+    broker = FileBroker(tmp_path / "outbox.jsonl", max_bytes=300, backups=2)
+    # Act
+    for message_id in range(1, 6):
+        await broker.publish([_message(message_id)])
+    # Assert
+    files = [broker.path, tmp_path / "outbox.jsonl.1", tmp_path / "outbox.jsonl.2"]
+    ids = [[orjson.loads(line)["id"] for line in path.read_bytes().splitlines()] for path in files]
+    assert ids == [[5], [3, 4], [1, 2]]
+    assert not (tmp_path / "outbox.jsonl.3").exists()
+    assert all(path.stat().st_size <= 300 for path in files)
+
+
+@pytest.mark.anyio
+async def test_file_broker_without_backups_starts_over(tmp_path):
+    # Arrange
+    broker = FileBroker(tmp_path / "outbox.jsonl", max_bytes=200, backups=0)
+    # Act
+    for message_id in range(1, 4):
+        await broker.publish([_message(message_id)])
+    # Assert
+    assert [orjson.loads(line)["id"] for line in broker.path.read_bytes().splitlines()] == [3]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["outbox.jsonl", "outbox.jsonl.lock"]
+
+
+def test_file_broker_needs_an_explicit_path(monkeypatch):
+    # Arrange
+    monkeypatch.delenv("OUTBOX_FILE_PATH", raising=False)
+    # Act / Assert
+    with pytest.raises(ValidationError, match="OUTBOX_FILE_PATH must point at a persistent volume"):
+        Settings(_env_file=None, OUTBOX_BROKER="file")
+    assert Settings(_env_file=None, OUTBOX_BROKER="memory").OUTBOX_FILE_PATH is None
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.profiling import (
+    ProfileSession,
+    ProfileWriter,
+    StackSampler,
+    record_stage,
+    sign_profile_token,
+    verify_profile_token,
+)
+
+
+def test_profile_token_is_valid_until_it_expires():
+    # Arrange
+    token = sign_profile_token("s3cret", 2_000)
+    # Act / Assert
+    assert verify_profile_token(token, "s3cret", now=1_999) is True
+    assert verify_profile_token(token, "s3cret", now=2_001) is False
+    assert verify_profile_token(token, "other", now=1_999) is False
+    assert verify_profile_token("garbage", "s3cret", now=1_999) is False
+    assert verify_profile_token(sign_profile_token("s3cret", int(time.time()) + 60), "s3cret") is True
+
+
+@pytest.mark.anyio
+async def test_session_samples_running_and_awaiting_stacks():
+    # Arrange
+    session = ProfileSession(asyncio.current_task(), "sampled")
+    waiter = asyncio.get_running_loop().create_future()
+
+    async def suspended():
+        await waiter
+
+    other = ProfileSession(asyncio.create_task(suspended()), "sampled")
+    await asyncio.sleep(0)
+    # Act
+    session.sample()
+    other.sample()
+    waiter.set_result(None)
+    await other.task
+    # Assert
+    assert session.running_samples == 1
+    assert any(
+        stack.endswith(
+            "test_session_samples_running_and_awaiting_stacks;src.infrastructure.profiling:ProfileSession.sample"
+        )
+        for stack in session.stacks
+    )
+    assert other.awaiting_samples == 1
+    [awaiting_stack] = other.stacks
+    assert awaiting_stack.endswith(
+        "test_session_samples_running_and_awaiting_stacks.<locals>.suspended;[await FutureIter]"
+    )
+
+
+@pytest.mark.anyio
+async def test_removed_session_ignores_samples_already_in_flight():
+    # Arrange
+    session = ProfileSession(asyncio.current_task(), "sampled")
+    session.sample()
+    sampler = StackSampler()
+    # Act
+    sampler.remove(session)
+    session.sample()
+    # Assert
+    assert session.running_samples == 1
+    assert sum(session.stacks.values()) == 1
+
+
+@pytest.mark.anyio
+async def test_stages_are_recorded_only_while_a_profile_is_active():
+    # Arrange
+    session = ProfileSession(asyncio.current_task(), "token")
+    record_stage("before", 1.0)
+    # Act
+    token = session.activate()
+    record_stage("hash", 0.25)
+    session.deactivate(token)
+    record_stage("after", 1.0)
+    # Assert
+    assert session.stages == [("hash", 0.25)]
+    assert session.duration > 0
+
+
+@pytest.mark.anyio
+async def test_writer_emits_collapsed_stacks_and_timings_and_rotates(tmp_path):
+    # Arrange
+    writer = ProfileWriter(tmp_path / "profiles", max_profiles=2)
+    session = ProfileSession(asyncio.current_task(), "sampled")
+    session.stacks["app:handler;app:hash"] = 3
+    session.stages.append(("hash", 0.0125))
+    details = {"method": "POST", "path": "/v1/users", "route": "/v1/users", "status": 201}
+    # Act
+    paths = [writer.write(session, details) for _ in range(3)]
+    # Assert
+    assert sorted(path.name for path in (tmp_path / "profiles").glob("*.collapsed")) == [p.name for p in paths[1:]]
+    assert paths[-1].read_text() == "app:handler;app:hash 3\n"
+    timings = json.loads(paths[-1].with_suffix(".json").read_text())
+    assert timings["reason"] == "sampled"
+    assert timings["stages_ms"] == [["hash", 12.5]]
+    assert paths[-1].name.endswith("-POST-v1_users.collapsed")
+
+
+def test_sampler_thread_samples_active_sessions_and_survives_errors():
+    # Arrange
+    sampled = threading.Event()
+
+    class FlakySession:
+        calls = 0
+
+        def sample(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("torn frame")
+            sampled.set()
+
+        def stop(self):
+            pass
+
+    sampler = StackSampler(interval_seconds=0.001)
+    session = FlakySession()
+    # Act
+    sampler.add(session)
+    sampler.add(session)
+    assert sampled.wait(timeout=2)
+    sampler.remove(session)
+    # Assert
+    assert session.calls >= 2
+    time.sleep(0.01)
+    calls = session.calls
+    time.sleep(0.01)
+    assert session.calls == calls
+    sampled.clear()
+    sampler.add(session)
+    assert sampled.wait(timeout=2)
+    sampler.remove(session)
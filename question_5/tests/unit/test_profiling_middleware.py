@@ -0,0 +1,110 @@
+import json
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.metrics import observe_create_user_stage
+from src.infrastructure.profiling import ProfileWriter, StackSampler, sign_profile_token
+from src.presentation.middleware import ProfilingMiddleware
+
+
+class FailingWriter:
+    def write(self, session, details):
+        raise OSError("disk full")
+
+
+def _build_app(writer, *, sample_rate: float = 0.0, secret: str | None = "s3cret") -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware,
+        sampler=StackSampler(interval_seconds=0.001),
+        writer=writer,
+        sample_rate=sample_rate,
+        secret=secret,
+        rng=lambda: 0.5,
+    )
+
+    @app.post("/users/{user_id}")
+    async def create(user_id: int):
+        observe_create_user_stage("hash", 0.002)
+        return {"id": user_id}
+
+    return app
+
+
+async def _post(app: FastAPI, headers: dict[str, str] | None = None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post("/users/1", headers=headers)
+
+
+@pytest.mark.anyio
+async def test_signed_header_profiles_request_with_stage_breakdown(tmp_path):
+    # Arrange
+    app = _build_app(ProfileWriter(tmp_path))
+    token = sign_profile_token("s3cret", int(time.time()) + 60)
+    # Act
+    response = await _post(app, {"X-Profile-Token": token, "X-Other": "1"})
+    # Assert
+    assert response.status_code == 200
+    [timings_file] = tmp_path.glob("*.json")
+    timings = json.loads(timings_file.read_text())
+    assert timings["route"] == "/users/{user_id}"
+    assert timings["status"] == 200
+    assert timings["reason"] == "token"
+    assert timings["stages_ms"] == [["hash", 2.0]]
+    assert list(tmp_path.glob("*.collapsed"))
+
+
+@pytest.mark.anyio
+async def test_requests_are_not_profiled_without_valid_token_or_sampling(tmp_path):
+    # Arrange
+    app = _build_app(ProfileWriter(tmp_path), sample_rate=0.1)
+    # Act
+    await _post(app)
+    await _post(app, {"X-Profile-Token": sign_profile_token("wrong", int(time.time()) + 60)})
+    # Assert
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_random_sampling_profiles_without_token(tmp_path):
+    # Arrange
+    app = _build_app(ProfileWriter(tmp_path), sample_rate=0.9, secret=None)
+    # Act
+    await _post(app)
+    # Assert
+    [timings_file] = tmp_path.glob("*.json")
+    assert json.loads(timings_file.read_text())["reason"] == "sampled"
+
+
+@pytest.mark.anyio
+async def test_write_failure_does_not_fail_the_request(monkeypatch):
+    # Arrange
+    logged: list[str] = []
+    monkeypatch.setattr(
+        "src.presentation.middleware.profiling.logger.exception", lambda event, **kwargs: logged.append(event)
+    )
+    app = _build_app(FailingWriter(), sample_rate=1.0)
+    # Act
+    response = await _post(app)
+    # Assert
+    assert response.status_code == 200
+    assert logged == ["profiling.write_failed"]
+
+
+@pytest.mark.anyio
+async def test_non_http_scopes_pass_through(tmp_path):
+    # Arrange
+    seen: list[str] = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = ProfilingMiddleware(inner, sampler=StackSampler(), writer=ProfileWriter(tmp_path), sample_rate=1.0)
+    # Act
+    await middleware({"type": "lifespan"}, None, None)
+    # Assert
+    assert seen == ["lifespan"]
@@ -0,0 +1,222 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.application.exceptions import ProviderUnavailableError
+from src.infrastructure.metrics import provider_requests_total, provider_retries_total
+from src.infrastructure.providers import CircuitBreaker, ProviderClient, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _client(responses, clock: FakeClock, **kwargs) -> tuple[ProviderClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+    pending = list(responses)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = pending.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    options = {
+        "timeout_seconds": 1.0,
+        "deadline_seconds": 5.0,
+        "retry": RetryPolicy(attempts=3, base_delay_seconds=0.1),
+        "breaker": CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30.0, clock=clock),
+        "clock": clock,
+        "sleep": clock.sleep,
+        "rng": lambda: 1.0,
+        **kwargs,
+    }
+    return ProviderClient("test", "http://provider/api/", lambda: http_client, **options), requests
+
+
+def test_retry_delay_is_jittered_exponential_backoff_capped_at_the_maximum():
+    # Arrange
+    policy = RetryPolicy(base_delay_seconds=0.1, max_delay_seconds=0.5)
+    # Act
+    delays = [policy.delay(retry, rng=lambda: 1.0) for retry in range(4)]
+    # Assert
+    assert delays == [0.1, 0.2, 0.4, 0.5]
+    assert policy.delay(3, rng=lambda: 0.5) == 0.25
+
+
+def test_circuit_breaker_opens_after_threshold_and_allows_one_trial_after_reset():
+    # Arrange
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10.0, clock=clock)
+    # Act
+    breaker.record_failure()
+    closed_after_one = breaker.state
+    breaker.record_failure()
+    open_state, open_allows = breaker.state, breaker.allow()
+    clock.now = 10.0
+    trial_allowed, second_trial_allowed = breaker.allow(), breaker.allow()
+    breaker.record_failure()
+    reopened = breaker.state
+    clock.now = 20.0
+    breaker.allow()
+    breaker.record_success()
+    # Assert
+    assert closed_after_one == "closed"
+    assert (open_state, open_allows) == ("open", False)
+    assert (trial_allowed, second_trial_allowed) == (True, False)
+    assert reopened == "open"
+    assert breaker.state == "closed"
+    assert breaker.opened == 2
+
+
+def test_circuit_breaker_release_frees_the_trial_slot():
+    # Arrange
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=1.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 1.0
+    breaker.allow()
+    # Act
+    breaker.release()
+    # Assert
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+
+
+@pytest.mark.anyio
+async def test_get_json_returns_body_and_none_for_404():
+    # Arrange
+    clock = FakeClock()
+    client, requests = _client([httpx.Response(200, json={"uf": "SP"}), httpx.Response(404)], clock)
+    # Act
+    found = await client.get_json("/01310100/json/")
+    missing = await client.get_json("/99999999/json/")
+    # Assert
+    assert found == {"uf": "SP"}
+    assert missing is None
+    assert str(requests[0].url) == "http://provider/api/01310100/json/"
+    assert requests[0].extensions["timeout"]["read"] == 1.0
+
+
+@pytest.mark.anyio
+async def test_get_json_retries_transient_failures_with_backoff():
+    # Arrange
+    clock = FakeClock()
+    retries_before = provider_retries_total.value("test")
+    client, requests = _client(
+        [
+            httpx.ReadTimeout("slow"),
+            httpx.Response(503),
+            httpx.Response(200, json={"ok": True}),
+        ],
+        clock,
+    )
+    # Act
+    body = await client.get_json("/x")
+    # Assert
+    assert body == {"ok": True}
+    assert len(requests) == 3
+    assert clock.now == pytest.approx(0.3)
+    assert provider_retries_total.value("test") - retries_before == 2
+    assert client.breaker.failures == 0
+
+
+@pytest.mark.anyio
+async def test_get_json_fails_after_last_attempt_and_opens_the_breaker():
+    # Arrange
+    clock = FakeClock()
+    failures = [httpx.ConnectError("refused"), httpx.Response(200, content=b"<html>"), httpx.Response(500)]
+    client, requests = _client(failures * 2, clock)
+    short_circuited_before = provider_requests_total.value("test", "short_circuited")
+    # Act
+    with pytest.raises(ProviderUnavailableError) as first:
+        await client.get_json("/x")
+    with pytest.raises(ProviderUnavailableError):
+        await client.get_json("/x")
+    with pytest.raises(ProviderUnavailableError) as refused:
+        await client.get_json("/x")
+    # Assert
+    assert first.value.extra == {"provider": "test", "reason": "status 500"}
+    assert first.value.status_code == 503
+    assert refused.value.extra["reason"] == "circuit open"
+    assert len(requests) == 6
+    assert client.breaker.state == "open"
+    assert provider_requests_total.value("test", "short_circuited") - short_circuited_before == 1
+
+
+@pytest.mark.anyio
+async def test_get_json_stops_retrying_when_the_deadline_would_pass():
+    # Arrange
+    clock = FakeClock()
+    client, requests = _client(
+        [httpx.ConnectError("refused"), httpx.ConnectError("refused")],
+        clock,
+        deadline_seconds=0.25,
+        retry=RetryPolicy(attempts=5, base_delay_seconds=0.1),
+    )
+    # Act
+    with pytest.raises(ProviderUnavailableError) as error:
+        await client.get_json("/x")
+    # Assert
+    assert len(requests) == 2
+    assert error.value.extra["reason"] == "connection error (ConnectError)"
+    assert requests[1].extensions["timeout"]["read"] == pytest.approx(0.15)
+
+
+@pytest.mark.anyio
+async def test_get_json_does_not_retry_or_trip_the_breaker_on_client_errors():
+    # Arrange
+    clock = FakeClock()
+    client, requests = _client([httpx.Response(400), httpx.Response(400)], clock)
+    # Act
+    for _ in range(2):
+        with pytest.raises(ProviderUnavailableError) as error:
+            await client.get_json("/x")
+    # Assert
+    assert error.value.extra["reason"] == "status 400"
+    assert len(requests) == 2
+    assert client.breaker.state == "closed"
+
+
+@pytest.mark.anyio
+async def test_cancelled_trial_call_frees_the_half_open_slot():
+    # Arrange
+    clock = FakeClock()
+    started = asyncio.Event()
+
+    async def hang(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.Event().wait()
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(hang))
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=1.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 1.0
+    client = ProviderClient(
+        "test",
+        "http://provider",
+        lambda: http_client,
+        timeout_seconds=1.0,
+        deadline_seconds=1.0,
+        retry=RetryPolicy(),
+        breaker=breaker,
+        clock=clock,
+    )
+    task = asyncio.create_task(client.get_json("/x"))
+    await started.wait()
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # Assert
+    assert breaker.allow() is True
@@ -0,0 +1,94 @@
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.persistence.routing import reads_pinned_to_primary, record_write
+from src.presentation.middleware import ReadYourWritesMiddleware
+from src.presentation.middleware.read_your_writes import PRIMARY_UNTIL_COOKIE
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=2.0)
+
+    @app.post("/write")
+    async def write():
+        record_write()
+        return {"pinned": reads_pinned_to_primary()}
+
+    @app.get("/read")
+    async def read():
+        return {"pinned": reads_pinned_to_primary()}
+
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_write_sets_cookie_that_pins_following_reads():
+    # Arrange
+    app = _build_app()
+    async with _client(app) as client:
+        # Act
+        fresh = await client.get("/read")
+        written = await client.post("/write")
+        followed = await client.get("/read")
+    # Assert
+    assert fresh.json() == {"pinned": False}
+    assert PRIMARY_UNTIL_COOKIE not in fresh.headers.get("set-cookie", "")
+    assert "Max-Age=3" in written.headers["set-cookie"]
+    assert followed.json() == {"pinned": True}
+
+
+@pytest.mark.anyio
+async def test_expired_or_malformed_cookie_reads_from_replicas():
+    # Arrange
+    app = _build_app()
+    async with _client(app) as client:
+        # Act
+        expired = await client.get("/read", headers={"cookie": f"{PRIMARY_UNTIL_COOKIE}=1.0"})
+        malformed = await client.get("/read", headers={"cookie": f"{PRIMARY_UNTIL_COOKIE}=soon"})
+    # Assert
+    assert expired.json() == {"pinned": False}
+    assert malformed.json() == {"pinned": False}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("cookie", "pinned"), [("1e12", [True, False]), ("inf", [False, False]), ("nan", [False, False])]
+)
+async def test_cookie_never_pins_reads_beyond_the_window(monkeypatch, cookie, pinned):
+    # Arrange
+    now = [1_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    seen: list[bool] = []
+
+    async def inner(scope, receive, send):
+        seen.append(reads_pinned_to_primary())
+        now[0] += 2.5
+        seen.append(reads_pinned_to_primary())
+
+    scope = {"type": "http", "headers": [(b"cookie", f"{PRIMARY_UNTIL_COOKIE}={cookie}".encode())]}
+    # Act
+    await ReadYourWritesMiddleware(inner, window_seconds=2.0)(scope, None, None)
+    # Assert
+    assert seen == pinned
+
+
+@pytest.mark.anyio
+async def test_non_http_scopes_pass_through():
+    # Arrange
+    seen: list[str] = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    # Act
+    await ReadYourWritesMiddleware(inner, window_seconds=1.0)({"type": "lifespan"}, None, None)
+    # Assert
+    assert seen == ["lifespan"]
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.metrics import http_request_duration_seconds, http_requests_total
+from src.presentation.middleware import RequestMetricsMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/broken")
+    async def broken():
+        raise RuntimeError("boom")
+
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.anyio
+async def test_middleware_labels_requests_with_route_template():
+    # Arrange
+    app = _build_app()
+    before = http_requests_total.value("GET", "/items/{item_id}", "200")
+    observed = http_request_duration_seconds.count("GET", "/items/{item_id}")
+    # Act
+    await _get(app, "/items/1")
+    await _get(app, "/items/2")
+    # Assert
+    assert http_requests_total.value("GET", "/items/{item_id}", "200") == before + 2
+    assert http_request_duration_seconds.count("GET", "/items/{item_id}") == observed + 2
+
+
+@pytest.mark.anyio
+async def test_middleware_counts_unhandled_errors_and_unmatched_paths():
+    # Arrange
+    app = _build_app()
+    errors = http_requests_total.value("GET", "/broken", "500")
+    missing = http_requests_total.value("GET", "unmatched", "404")
+    # Act
+    broken = await _get(app, "/broken")
+    not_found = await _get(app, "/nope")
+    # Assert
+    assert broken.status_code == 500
+    assert not_found.status_code == 404
+    assert http_requests_total.value("GET", "/broken", "500") == errors + 1
+    assert http_requests_total.value("GET", "unmatched", "404") == missing + 1
+
+
+@pytest.mark.anyio
+async def test_middleware_passes_through_non_http_scopes():
+    # Arrange
+    seen: list[str] = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = RequestMetricsMiddleware(inner)
+    # Act
+    await middleware({"type": "lifespan"}, None, None)
+    # Assert
+    assert seen == ["lifespan"]
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.persistence.retention import RetentionPurger
+
+
+class ScriptedPurger(RetentionPurger):
+    """Purger whose batches come from a script instead of the database."""
+
+    def __init__(self, script: list, **kwargs) -> None:
+        super().__init__("scripted", None, None, **kwargs)
+        self.script = script
+        self.batches = 0
+        self.idle = asyncio.Event()
+
+    async def purge_batch(self) -> int:
+        self.batches += 1
+        if not self.script:
+            self.idle.set()
+            return 0
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+class FakeSessionFactory:
+    def __init__(self) -> None:
+        self.transactions = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def begin(self):
+        self.transactions += 1
+        return self
+
+
+@pytest.mark.anyio
+async def test_purge_batch_runs_one_transaction_and_counts_deleted_rows():
+    # Arrange
+    factory = FakeSessionFactory()
+    limits: list[int] = []
+
+    async def purge(session, limit: int) -> int:
+        limits.append(limit)
+        return 7
+
+    purger = RetentionPurger("idempotency_keys", factory, purge, batch_size=10)
+    # Act
+    deleted = await purger.purge_batch()
+    # Assert
+    assert deleted == 7
+    assert limits == [10]
+    assert factory.transactions == 1
+    assert purger.purged == 7
+
+
+@pytest.mark.anyio
+async def test_purger_drains_full_batches_back_to_back_then_waits():
+    # Arrange
+    purger = ScriptedPurger([3, 3, 1], batch_size=3, interval_seconds=60)
+    # Act
+    await purger.start()
+    await asyncio.sleep(0.05)
+    await purger.stop()
+    # Assert
+    assert purger.batches == 3
+    assert purger.script == []
+
+
+@pytest.mark.anyio
+async def test_purger_survives_a_failing_batch_and_retries_after_the_interval():
+    # Arrange
+    purger = ScriptedPurger([RuntimeError("database is down"), 2], batch_size=3, interval_seconds=0.01)
+    # Act
+    await purger.start()
+    await asyncio.wait_for(purger.idle.wait(), 1)
+    await purger.stop()
+    # Assert
+    assert purger.failures == 1
+    assert purger.batches >= 3
+
+
+@pytest.mark.anyio
+async def test_stop_without_start_is_a_no_op():
+    # Arrange
+    purger = ScriptedPurger([])
+    # Act
+    await purger.stop()
+    # Assert
+    assert purger.batches == 0
@@ -13,6 +13,10 @@ class FakeAsyncSession:
         self.received_query = query
         return self.result
 
+    async def scalars(self, query):
+        self.received_query = query
+        return iter(self.result)
+
 
 @pytest.mark.anyio
 async def test_get_by_id_returns_role_when_record_exists():
@@ -25,3 +29,27 @@ async def test_get_by_id_returns_role_when_record_exists():
     assert role is not None
     assert role.description == "Admin"
     assert "WHERE roles.id = :" in str(fake_session.received_query)
+
+
+@pytest.mark.anyio
+async def test_get_existing_ids_returns_found_ids_with_a_single_query():
+    # Arrange
+    fake_session = FakeAsyncSession([1, 3])
+    repo = SqlRoleRepository(fake_session)
+    # Act
+    role_ids = await repo.get_existing_ids({1, 2, 3})
+    # Assert
+    assert role_ids == {1, 3}
+    assert "WHERE roles.id IN (" in str(fake_session.received_query)
+
+
+@pytest.mark.anyio
+async def test_get_existing_ids_skips_query_for_empty_input():
+    # Arrange
+    fake_session = FakeAsyncSession([])
+    repo = SqlRoleRepository(fake_session)
+    # Act
+    role_ids = await repo.get_existing_ids(set())
+    # Assert
+    assert role_ids == set()
+    assert fake_session.received_query is None
@@ -0,0 +1,37 @@
+from datetime import date
+
+from src.infrastructure.persistence.slow_query_log import calling_repository_method, normalize_sql, parameter_shape
+
+
+def test_normalize_sql_hides_placeholders_and_collapses_lists():
+    # Arrange
+    statement = """
+        INSERT INTO users (name, email) VALUES ($1::VARCHAR, $2::VARCHAR), ($3::VARCHAR, $4::VARCHAR)
+        ON CONFLICT (email) DO NOTHING
+    """
+    # Act / Assert
+    assert (
+        normalize_sql(statement)
+        == "INSERT INTO users (name, email) VALUES (?, ...), ... ON CONFLICT (email) DO NOTHING"
+    )
+    assert normalize_sql("SELECT id FROM roles WHERE id IN ($1::INTEGER, $2::INTEGER)") == (
+        "SELECT id FROM roles WHERE id IN (...)"
+    )
+    assert normalize_sql("SELECT 1 WHERE a = %(a)s AND b = %s") == "SELECT 1 WHERE a = ? AND b = ?"
+
+
+def test_parameter_shape_reports_types_never_values():
+    # Arrange / Act / Assert
+    assert parameter_shape(("bruno@fagundes.com", 1, None)) == ["str", "int", "NoneType"]
+    assert parameter_shape({"email": "bruno@fagundes.com"}) == {"email": "str"}
+    assert parameter_shape([("a", date(2026, 2, 6)), ("b", date(2026, 2, 6))], executemany=True) == {
+        "rows": 2,
+        "row": ["str", "date"],
+    }
+    assert parameter_shape([], executemany=True) == {"rows": 0, "row": None}
+    assert parameter_shape(None) == "NoneType"
+
+
+def test_calling_repository_method_is_none_outside_repositories():
+    # Arrange / Act / Assert
+    assert calling_repository_method() is None
@@ -8,6 +8,7 @@ class FakeAsyncSession:
         self.transaction_active = transaction_active
         self.commits = 0
         self.rollbacks = 0
+        self.info = {}
 
     def in_transaction(self) -> bool:
         return self.transaction_active
@@ -81,3 +82,30 @@ async def test_transaction_reraises_without_rollback_when_no_transaction_is_acti
     # Assert
     assert session.commits == 0
     assert session.rollbacks == 0
+
+
+@pytest.mark.anyio
+async def test_release_rolls_back_implicit_read_transaction():
+    # Arrange
+    session = FakeAsyncSession(transaction_active=True)
+    uow = SqlAlchemyUnitOfWork(session)
+
+    # Act
+    await uow.release()
+
+    # Assert
+    assert session.rollbacks == 1
+    assert session.transaction_active is False
+
+
+@pytest.mark.anyio
+async def test_release_is_a_no_op_without_transaction():
+    # Arrange
+    session = FakeAsyncSession(transaction_active=False)
+    uow = SqlAlchemyUnitOfWork(session)
+
+    # Act
+    await uow.release()
+
+    # Assert
+    assert session.rollbacks == 0
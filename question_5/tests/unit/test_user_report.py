@@ -0,0 +1,77 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from src.application.schemas import UserReportQuery
+from src.application.use_cases import GetUserReportUseCase, IngestUserEventsUseCase
+from src.domain.entities import OutboxMessage, UserDailyCountEntity
+
+PUBLISHED_AT = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeReportRepository:
+    def __init__(self, rows: list[UserDailyCountEntity] | None = None) -> None:
+        self.rows = rows or []
+        self.counted: list[tuple[int, date, int]] = []
+        self.batches = 0
+        self.queries: list[dict] = []
+
+    async def count_created_users(self, events):
+        self.batches += 1
+        self.counted.extend(events)
+        return len(events)
+
+    async def daily_counts(self, **kwargs):
+        self.queries.append(kwargs)
+        return self.rows
+
+
+def _message(message_id: int, topic: str = "user.created") -> OutboxMessage:
+    payload = {"id": message_id, "role_id": 2, "created_at": "2026-02-05"}
+    return OutboxMessage(message_id, topic, str(message_id), payload, PUBLISHED_AT)
+
+
+@pytest.mark.anyio
+async def test_ingest_counts_user_created_events_in_one_call():
+    # Arrange
+    repository = FakeReportRepository()
+    use_case = IngestUserEventsUseCase(repository)
+    # Act
+    counted = await use_case.ingest([_message(1), _message(2, topic="user.deleted"), _message(3)])
+    # Assert
+    assert counted == 2
+    assert repository.counted == [(1, date(2026, 2, 5), 2), (3, date(2026, 2, 5), 2)]
+    assert repository.batches == 1
+
+
+@pytest.mark.anyio
+async def test_ingest_skips_the_repository_without_relevant_events():
+    # Arrange
+    repository = FakeReportRepository()
+    use_case = IngestUserEventsUseCase(repository)
+    # Act
+    counted = await use_case.ingest([_message(1, topic="user.deleted")])
+    # Assert
+    assert (counted, repository.batches) == (0, 0)
+
+
+@pytest.mark.anyio
+async def test_report_returns_rollup_rows_and_their_total():
+    # Arrange
+    repository = FakeReportRepository(
+        [UserDailyCountEntity(date(2026, 2, 5), 1, 3, 10), UserDailyCountEntity(date(2026, 2, 6), 1, 2, 12)]
+    )
+    use_case = GetUserReportUseCase(repository)
+    # Act
+    report = await use_case.get_report(UserReportQuery(created_from=date(2026, 2, 5), role_id=1))
+    # Assert
+    assert report.total_users == 5
+    assert [item.cumulative_users for item in report.items] == [10, 12]
+    assert repository.queries == [{"created_from": date(2026, 2, 5), "created_to": None, "role_id": 1}]
+
+
+def test_report_query_rejects_inverted_range():
+    # Arrange / Act / Assert
+    with pytest.raises(ValidationError):
+        UserReportQuery(created_from=date(2026, 2, 6), created_to=date(2026, 2, 5))
@@ -2,13 +2,46 @@ from datetime import date
 
 import pytest
 
+from src.application.exceptions import EmailAlreadyExistsError, RoleNotFoundError, StaleCursorError
+from src.domain.entities import UserEntity
+from src.infrastructure.persistence.email_bloom_filter import EmailBloomFilter
 from src.infrastructure.persistence.models import User
 from src.infrastructure.persistence.repositories.sql_user_repository import SqlUserRepository
 
 
+class FakeRow:
+    def __init__(self, role_exists: bool, **values):
+        self.role_exists = role_exists
+        for column in User.__table__.c:
+            setattr(self, column.name, values.get(column.name))
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+    def __iter__(self):
+        return iter(self.row or [])
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return list(self)
+
+
+class FakeMappingRow:
+    def __init__(self, **values):
+        self._mapping = values
+
+
 class FakeAsyncSession:
-    def __init__(self, scalar_result=None):
+    def __init__(self, scalar_result=None, execute_row=None):
         self.scalar_result = scalar_result
+        self.execute_row = execute_row
         self.last_query = None
         self.added = []
         self.flush_called = False
@@ -22,6 +55,23 @@ class FakeAsyncSession:
         self.last_query = query
         return self.scalar_result
 
+    async def scalars(self, query):
+        self.last_query = query
+        return iter(self.scalar_result)
+
+    async def stream_scalars(self, query):
+        self.last_query = query
+
+        async def _rows():
+            for value in self.scalar_result:
+                yield value
+
+        return _rows()
+
+    async def execute(self, query):
+        self.last_query = query
+        return FakeResult(self.execute_row)
+
     def add(self, obj):
         self.added.append(obj)
 
@@ -98,3 +148,254 @@ async def test_create_persists_user_inside_transaction(monkeypatch):
     assert user.updated_at is None
     assert session.added[0] is user
     assert session.flush_called is True
+
+
+@pytest.mark.anyio
+async def test_create_unique_returns_user_built_from_returned_row():
+    # Arrange
+    row = FakeRow(
+        True,
+        id=7,
+        name="Bruno",
+        email="bruno@fagundes.com",
+        password="hashed",
+        role_id=1,
+        created_at=date(2026, 2, 6),
+    )
+    session = FakeAsyncSession(execute_row=row)
+    repo = SqlUserRepository(session)
+    # Act
+    user = await repo.create_unique(name="Bruno", email="bruno@fagundes.com", password="hashed", role_id=1)
+    # Assert
+    assert isinstance(user, User)
+    assert user.id == 7
+    assert user.created_at == date(2026, 2, 6)
+    assert "ON CONFLICT (email) DO NOTHING" in str(session.last_query)
+
+
+@pytest.mark.anyio
+async def test_create_unique_raises_role_not_found_when_role_is_missing():
+    # Arrange
+    session = FakeAsyncSession(execute_row=FakeRow(False))
+    repo = SqlUserRepository(session)
+    # Act & Assert
+    with pytest.raises(RoleNotFoundError):
+        await repo.create_unique(name="Bruno", email="bruno@fagundes.com", password="hashed", role_id=99)
+
+
+@pytest.mark.anyio
+async def test_create_unique_raises_email_conflict_when_nothing_is_inserted():
+    # Arrange
+    session = FakeAsyncSession(execute_row=FakeRow(True))
+    repo = SqlUserRepository(session)
+    # Act & Assert
+    with pytest.raises(EmailAlreadyExistsError):
+        await repo.create_unique(name="Bruno", email="bruno@fagundes.com", password="hashed", role_id=1)
+
+
+@pytest.mark.anyio
+async def test_get_existing_emails_returns_found_emails():
+    # Arrange
+    session = FakeAsyncSession(scalar_result=["a@fagundes.com"])
+    repo = SqlUserRepository(session)
+    # Act
+    emails = await repo.get_existing_emails({"a@fagundes.com", "b@fagundes.com"})
+    # Assert
+    assert emails == {"a@fagundes.com"}
+    assert "WHERE users.email IN (" in str(session.last_query)
+
+
+@pytest.mark.anyio
+async def test_get_existing_emails_skips_query_for_empty_input():
+    # Arrange
+    session = FakeAsyncSession()
+    repo = SqlUserRepository(session)
+    # Act & Assert
+    assert await repo.get_existing_emails(set()) == set()
+    assert session.last_query is None
+
+
+@pytest.mark.anyio
+async def test_create_many_issues_one_multi_row_insert():
+    # Arrange
+    returned = FakeMappingRow(
+        id=1,
+        name="A",
+        email="a@fagundes.com",
+        password="hashed",
+        role_id=1,
+        created_at=date(2026, 2, 6),
+        updated_at=None,
+    )
+    session = FakeAsyncSession(execute_row=[returned])
+    repo = SqlUserRepository(session)
+    entities = [
+        UserEntity(None, name, f"{name}@fagundes.com", "hashed", 1, date(2026, 2, 6), None) for name in ("a", "b")
+    ]
+    # Act
+    created = await repo.create_many(entities)
+    # Assert
+    assert [user.id for user in created] == [1]
+    sql = str(session.last_query)
+    assert "ON CONFLICT (email) DO NOTHING" in sql
+    assert "RETURNING" in sql
+
+
+@pytest.mark.anyio
+async def test_create_many_skips_statement_for_empty_input():
+    # Arrange
+    session = FakeAsyncSession()
+    repo = SqlUserRepository(session)
+    # Act & Assert
+    assert await repo.create_many([]) == []
+    assert session.last_query is None
+
+
+async def _ready_filter(*emails: str) -> EmailBloomFilter:
+    async def _stream():
+        for email in emails:
+            yield email
+
+    bloom = EmailBloomFilter(capacity=1_000)
+    await bloom.rebuild(_stream())
+    return bloom
+
+
+@pytest.mark.anyio
+async def test_exists_by_email_skips_query_when_filter_rules_email_out():
+    # Arrange
+    session = FakeAsyncSession(scalar_result=True)
+    repo = SqlUserRepository(session, await _ready_filter("known@fagundes.com"))
+    # Act
+    result = await repo.exists_by_email("unknown@fagundes.com")
+    # Assert
+    assert result is False
+    assert session.last_query is None
+
+
+@pytest.mark.anyio
+async def test_exists_by_email_queries_and_records_false_positive_on_possible_match():
+    # Arrange
+    session = FakeAsyncSession(scalar_result=False)
+    bloom = await _ready_filter("known@fagundes.com")
+    repo = SqlUserRepository(session, bloom)
+    # Act
+    result = await repo.exists_by_email("known@fagundes.com")
+    # Assert
+    assert result is False
+    assert session.last_query is not None
+    assert bloom.false_positives == 1
+
+
+@pytest.mark.anyio
+async def test_get_existing_emails_only_queries_possible_matches():
+    # Arrange
+    session = FakeAsyncSession(scalar_result=[])
+    bloom = await _ready_filter("known@fagundes.com")
+    repo = SqlUserRepository(session, bloom)
+    # Act
+    missing = await repo.get_existing_emails({"new@fagundes.com"})
+    found = await repo.get_existing_emails({"known@fagundes.com", "new@fagundes.com"})
+    # Assert
+    assert missing == set()
+    assert found == set()
+    assert "IN (__[POSTCOMPILE_email_1])" in str(session.last_query)
+    assert bloom.false_positives == 1
+
+
+@pytest.mark.anyio
+async def test_successful_creates_are_added_to_email_filter():
+    # Arrange
+    row = FakeRow(True, id=1, name="A", email="a@fagundes.com", password="h", role_id=1, created_at=date(2026, 2, 6))
+    many = [
+        FakeMappingRow(
+            id=2,
+            name="B",
+            email="b@fagundes.com",
+            password="h",
+            role_id=1,
+            created_at=date(2026, 2, 6),
+            updated_at=None,
+        )
+    ]
+    bloom = await _ready_filter()
+    # Act
+    await SqlUserRepository(FakeAsyncSession(execute_row=row), bloom).create_unique(
+        name="A", email="a@fagundes.com", password="h", role_id=1
+    )
+    await SqlUserRepository(FakeAsyncSession(execute_row=many), bloom).create_many(
+        [UserEntity(None, "B", "b@fagundes.com", "h", 1, date(2026, 2, 6), None)]
+    )
+    await SqlUserRepository(FakeAsyncSession(), bloom).create(
+        name="C", email="c@fagundes.com", password="h", role_id=1
+    )
+    # Assert
+    assert bloom.items == 3
+    assert all(bloom.might_contain(f"{name}@fagundes.com") for name in "abc")
+
+
+@pytest.mark.anyio
+async def test_stream_emails_yields_emails_in_batches():
+    # Arrange
+    session = FakeAsyncSession(scalar_result=["a@fagundes.com", "b@fagundes.com"])
+    repo = SqlUserRepository(session)
+    # Act
+    emails = [email async for email in repo.stream_emails(batch_size=500)]
+    # Assert
+    assert emails == ["a@fagundes.com", "b@fagundes.com"]
+    assert session.last_query.get_execution_options()["yield_per"] == 500
+
+
+@pytest.mark.anyio
+async def test_list_page_uses_keyset_predicate_and_skips_password():
+    # Arrange
+    session = FakeAsyncSession(execute_row=[{"id": 11}])
+    repo = SqlUserRepository(session)
+    # Act
+    await repo.list_page(after_id=10, limit=51, role_id=2, created_from=date(2026, 1, 1), created_to=date(2026, 2, 1))
+    # Assert
+    sql = str(session.last_query)
+    assert "users.password" not in sql
+    assert "(users.created_at, users.id) > ((SELECT users.created_at" in sql
+    assert "users.role_id = :role_id_1" in sql
+    assert "users.created_at >= :created_at_1" in sql
+    assert "users.created_at <= :created_at_2" in sql
+    assert "ORDER BY users.created_at, users.id" in sql
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.anyio
+async def test_empty_date_filtered_page_with_a_live_cursor_is_the_end():
+    # Arrange
+    session = FakeAsyncSession(execute_row=[], scalar_result=True)
+    repo = SqlUserRepository(session)
+    # Act
+    rows = await repo.list_page(after_id=10, limit=51, created_from=date(2026, 1, 1))
+    # Assert
+    assert rows == []
+    assert "EXISTS (SELECT * \nFROM users \nWHERE users.id = :id_1)" in str(session.last_query)
+
+
+@pytest.mark.anyio
+async def test_date_filtered_page_after_a_deleted_user_is_rejected():
+    # Arrange
+    session = FakeAsyncSession(execute_row=[], scalar_result=False)
+    repo = SqlUserRepository(session)
+    # Act / Assert
+    with pytest.raises(StaleCursorError) as raised:
+        await repo.list_page(after_id=10, limit=51, created_from=date(2026, 1, 1))
+    assert (raised.value.status_code, raised.value.extra) == (400, {"cursor": 10})
+
+
+@pytest.mark.anyio
+async def test_list_page_without_date_filter_pages_by_id():
+    # Arrange
+    session = FakeAsyncSession(execute_row=[])
+    repo = SqlUserRepository(session)
+    # Act
+    await repo.list_page(after_id=10, limit=51, role_id=2)
+    # Assert
+    sql = str(session.last_query)
+    assert "users.id > :id_1" in sql
+    assert "users.created_at" not in sql.split("FROM")[1]
+    assert "ORDER BY users.id" in sql
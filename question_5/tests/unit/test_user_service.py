@@ -14,7 +14,7 @@ from src.infrastructure.persistence.models import User
 
 @dataclass
 class FakeRoleRepository:
-    roles: dict[int, Any] = field(default_factory=dict)
+    roles: dict[int, Any] = field(default_factory=lambda: {1: RoleEntity(id=1, description="Admin")})
 
     async def get_by_id(self, role_id: int) -> Any | None:
         return self.roles.get(role_id)
@@ -22,15 +22,19 @@ class FakeRoleRepository:
 
 @dataclass
 class FakeUserRepository:
+    role_ids: set[int] = field(default_factory=lambda: {1})
     existing_emails: set[str] = field(default_factory=set)
     created_users: list[Any] = field(default_factory=list)
     last_password: str | None = None
-    refreshed: list[Any] = field(default_factory=list)
 
     async def exists_by_email(self, email: str) -> bool:
         return email in self.existing_emails
 
-    async def create(self, *, name: str, email: str, password: str, role_id: int) -> Any:
+    async def create_unique(self, *, name: str, email: str, password: str, role_id: int) -> Any:
+        if role_id not in self.role_ids:
+            raise RoleNotFoundError(role_id)
+        if email in self.existing_emails:
+            raise EmailAlreadyExistsError(email)
         user = User(
             id=len(self.created_users) + 1,
             name=name,
@@ -45,14 +49,15 @@ class FakeUserRepository:
         self.last_password = password
         return user
 
-    async def refresh(self, instance: Any) -> None:
-        self.refreshed.append(instance)
-
 
 @dataclass
 class FakeUnitOfWork:
     transaction_committed: bool = False
     transaction_rolled_back: bool = False
+    released: bool = False
+
+    async def release(self) -> None:
+        self.released = True
 
     @asynccontextmanager
     async def transaction(self):
@@ -68,9 +73,8 @@ class FakeUnitOfWork:
 async def test_create_user_hashes_provided_password_and_persists_user():
     # Arrange
     user_repo = FakeUserRepository()
-    role_repo = FakeRoleRepository({1: RoleEntity(id=1, description="Admin")})
     unit_of_work = FakeUnitOfWork()
-    service = CreateUserUseCase(user_repo, role_repo, unit_of_work)
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="Bruno", email="bruno@fagundes.com", role_id=1, password="Plain123!")
     # Act
     result: UserOutput = await service.create_user(payload)
@@ -86,9 +90,8 @@ async def test_create_user_generates_password_when_not_supplied(monkeypatch):
     generated_password = "TempPass1!"
     monkeypatch.setattr("src.application.use_cases.create_user.generate_password", lambda length=8: generated_password)
     user_repo = FakeUserRepository()
-    role_repo = FakeRoleRepository({1: RoleEntity(id=1, description="Admin")})
     unit_of_work = FakeUnitOfWork()
-    service = CreateUserUseCase(user_repo, role_repo, unit_of_work)
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="Ana", email="ana@fagundes.com", role_id=1, password=None)
     # Act
     result = await service.create_user(payload)
@@ -99,61 +102,138 @@ async def test_create_user_generates_password_when_not_supplied(monkeypatch):
 
 
 @pytest.mark.anyio
-async def test_create_user_raises_role_not_found_when_role_missing():
+async def test_create_user_raises_role_not_found_before_hashing_when_role_missing(monkeypatch):
     # Arrange
+    async def fail_hash(password: str) -> str:
+        raise AssertionError("password must not be hashed for an unknown role")
+
+    monkeypatch.setattr("src.application.use_cases.create_user.hash_password_async", fail_hash)
     user_repo = FakeUserRepository()
-    role_repo = FakeRoleRepository()
-    service = CreateUserUseCase(user_repo, role_repo, FakeUnitOfWork())
+    unit_of_work = FakeUnitOfWork()
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="NoRole", email="norole@fagundes.com", role_id=999, password="Plain123!")
     # Act & Assert
     with pytest.raises(RoleNotFoundError):
         await service.create_user(payload)
+    assert unit_of_work.transaction_committed is False
+    assert user_repo.created_users == []
 
 
 @pytest.mark.anyio
-async def test_create_user_raises_email_conflict_when_email_exists():
+async def test_create_user_raises_role_not_found_when_role_disappears_before_insert():
     # Arrange
+    user_repo = FakeUserRepository(role_ids=set())
+    unit_of_work = FakeUnitOfWork()
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
+    payload = UserCreateInput(name="Stale", email="stale@fagundes.com", role_id=1, password="Plain123!")
+    # Act & Assert
+    with pytest.raises(RoleNotFoundError):
+        await service.create_user(payload)
+    assert unit_of_work.transaction_rolled_back is True
+
+
+@pytest.mark.anyio
+async def test_create_user_raises_email_conflict_before_hashing_when_email_exists(monkeypatch):
+    # Arrange
+    async def fail_hash(password: str) -> str:
+        raise AssertionError("password must not be hashed for a registered email")
+
+    monkeypatch.setattr("src.application.use_cases.create_user.hash_password_async", fail_hash)
     user_repo = FakeUserRepository(existing_emails={"taken@fagundes.com"})
-    role_repo = FakeRoleRepository({1: RoleEntity(id=1, description="Admin")})
-    service = CreateUserUseCase(user_repo, role_repo, FakeUnitOfWork())
+    unit_of_work = FakeUnitOfWork()
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="Taken", email="taken@fagundes.com", role_id=1, password="Plain123!")
     # Act & Assert
     with pytest.raises(EmailAlreadyExistsError):
         await service.create_user(payload)
+    assert unit_of_work.transaction_committed is False
+
+
+@pytest.mark.anyio
+async def test_create_user_raises_email_conflict_when_insert_hits_unique_index():
+    # Arrange
+    user_repo = FakeUserRepository()
+    unit_of_work = FakeUnitOfWork()
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
+    payload = UserCreateInput(name="Late", email="late@fagundes.com", role_id=1, password="Plain123!")
+
+    async def exists_by_email(email: str) -> bool:
+        user_repo.existing_emails.add(email)
+        return False
+
+    user_repo.exists_by_email = exists_by_email
+    # Act & Assert
+    with pytest.raises(EmailAlreadyExistsError):
+        await service.create_user(payload)
+    assert unit_of_work.released is True
+    assert unit_of_work.transaction_rolled_back is True
 
 
 @pytest.mark.anyio
-async def test_create_user_commits_and_refreshes_when_creation_succeeds():
+async def test_create_user_commits_when_creation_succeeds():
     # Arrange
     user_repo = FakeUserRepository()
-    role_repo = FakeRoleRepository({1: RoleEntity(id=1, description="Admin")})
     unit_of_work = FakeUnitOfWork()
-    service = CreateUserUseCase(user_repo, role_repo, unit_of_work)
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="Commit", email="commit@fagundes.com", role_id=1, password="Plain123!")
     # Act
     result = await service.create_user(payload)
     # Assert
     assert unit_of_work.transaction_committed is True
     assert unit_of_work.transaction_rolled_back is False
-    assert user_repo.refreshed == [user_repo.created_users[0]]
-    assert result.email == payload.email
+    assert result.id == user_repo.created_users[0].id
 
 
 @pytest.mark.anyio
 async def test_create_user_rolls_back_when_repository_raises(monkeypatch):
     # Arrange
     user_repo = FakeUserRepository()
-    role_repo = FakeRoleRepository({1: RoleEntity(id=1, description="Admin")})
     unit_of_work = FakeUnitOfWork()
-    service = CreateUserUseCase(user_repo, role_repo, unit_of_work)
+    service = CreateUserUseCase(user_repo, FakeRoleRepository(), unit_of_work)
     payload = UserCreateInput(name="Rollback", email="rollback@fagundes.com", role_id=1, password="Plain123!")
 
-    async def failing_create(**kwargs):
+    async def failing_create_unique(**kwargs):
         raise RuntimeError("db error")
 
-    monkeypatch.setattr(user_repo, "create", failing_create)
+    monkeypatch.setattr(user_repo, "create_unique", failing_create_unique)
     # Act & Assert
     with pytest.raises(RuntimeError):
         await service.create_user(payload)
     assert unit_of_work.transaction_committed is False
     assert unit_of_work.transaction_rolled_back is True
+
+
+@pytest.mark.anyio
+async def test_create_user_reports_each_stage_duration():
+    # Arrange
+    stages: list[tuple[str, float]] = []
+    service = CreateUserUseCase(
+        FakeUserRepository(),
+        FakeRoleRepository(),
+        FakeUnitOfWork(),
+        observe_stage=lambda stage, seconds: stages.append((stage, seconds)),
+    )
+    payload = UserCreateInput(name="Timed", email="timed@fagundes.com", role_id=1, password="Plain123!")
+    # Act
+    await service.create_user(payload)
+    # Assert
+    assert [stage for stage, _ in stages] == ["role_lookup", "email_check", "hash", "insert", "commit"]
+    assert all(seconds >= 0 for _, seconds in stages)
+
+
+@pytest.mark.anyio
+async def test_create_user_runs_on_created_inside_the_transaction():
+    # Arrange
+    unit_of_work = FakeUnitOfWork()
+    service = CreateUserUseCase(FakeUserRepository(), FakeRoleRepository(), unit_of_work)
+    payload = UserCreateInput(name="Bruno", email="hook@fagundes.com", role_id=1, password="Plain123!")
+    seen: list[tuple[str, bool]] = []
+
+    async def on_created(output: UserOutput) -> None:
+        seen.append((output.email, unit_of_work.transaction_committed))
+
+    # Act
+    await service.create_user(payload, on_created=on_created)
+    # Assert
+    assert seen == [("hook@fagundes.com", False)]
+    assert unit_of_work.transaction_committed is True
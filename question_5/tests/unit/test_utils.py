@@ -41,3 +41,28 @@ def test_generate_password_uses_default_length():
     password = utils.generate_password()
     # Assert
     assert len(password) == 16
+
+
+@pytest.mark.anyio
+async def test_hash_password_async_uses_default_executor_when_pool_is_not_started():
+    # Arrange
+    utils.shutdown_hashing_executor()
+    # Act
+    hashed = await utils.hash_password_async("Plain123!")
+    # Assert
+    assert hashed.startswith("$argon2")
+
+
+@pytest.mark.anyio
+async def test_hash_password_async_runs_on_process_pool():
+    # Arrange
+    executor = utils.start_hashing_executor(max_workers=1)
+    try:
+        # Act
+        hashed = await utils.hash_password_async("Plain123!")
+        # Assert
+        assert hashed.startswith("$argon2")
+        assert utils.start_hashing_executor() is executor
+    finally:
+        utils.shutdown_hashing_executor()
+    assert utils._hashing_executor is None
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from src.application.exceptions import CepNotFoundError, CompanyNotFoundError, ProviderUnavailableError
+from src.application.schemas import AddressValidationInput
+from src.application.use_cases import ValidateCompanyAddressUseCase
+from src.domain.entities import AddressEntity
+
+CNPJ = "11222333000181"
+CEP = "01310100"
+
+PAULISTA = AddressEntity(cep=CEP, street="Avenida Paulista", district="Bela Vista", city="São Paulo", state="SP")
+
+
+class FakeCnpjProvider:
+    def __init__(self, result: AddressEntity | Exception | None, delay: float = 0.0) -> None:
+        self.result = result
+        self.delay = delay
+        self.calls: list[str] = []
+
+    async def get_company_address(self, cnpj: str) -> AddressEntity | None:
+        self.calls.append(cnpj)
+        await asyncio.sleep(self.delay)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class FakeCepProvider(FakeCnpjProvider):
+    async def get_address(self, cep: str) -> AddressEntity | None:
+        return await self.get_company_address(cep)
+
+
+def _company(**overrides) -> AddressEntity:
+    fields = {
+        "cep": CEP,
+        "street": "AVENIDA PAULISTA",
+        "district": "BELA VISTA",
+        "city": "SAO PAULO",
+        "state": "SP",
+        **overrides,
+    }
+    return AddressEntity(**fields)
+
+
+@pytest.mark.anyio
+async def test_validate_matches_addresses_that_differ_only_in_case_and_accents():
+    # Arrange
+    cnpj_provider = FakeCnpjProvider(_company())
+    cep_provider = FakeCepProvider(PAULISTA)
+    use_case = ValidateCompanyAddressUseCase(cnpj_provider, cep_provider)
+    # Act
+    result = await use_case.validate(AddressValidationInput(cnpj="11.222.333/0001-81", cep="01310-100"))
+    # Assert
+    assert result.matches is True
+    assert result.mismatched_fields == []
+    assert result.similarity == {"cep": 1.0, "state": 1.0, "city": 1.0, "district": 1.0, "street": 1.0}
+    assert (result.cnpj, result.cep) == (CNPJ, CEP)
+    assert result.cep_address.city == "São Paulo"
+    assert cnpj_provider.calls == [CNPJ]
+    assert cep_provider.calls == [CEP]
+
+
+@pytest.mark.anyio
+async def test_validate_reports_each_field_that_differs_and_ignores_empty_ones():
+    # Arrange
+    company = _company(cep="20040002", city="Rio de Janeiro", state="RJ", street="Avenida Rio Branco")
+    cep_address = AddressEntity(cep=CEP, street="", district="", city="São Paulo", state="SP")
+    use_case = ValidateCompanyAddressUseCase(FakeCnpjProvider(company), FakeCepProvider(cep_address))
+    # Act
+    result = await use_case.validate(AddressValidationInput(cnpj=CNPJ, cep=CEP))
+    # Assert
+    assert result.matches is False
+    assert result.mismatched_fields == ["cep", "state", "city"]
+    assert set(result.similarity) == {"cep", "state", "city"}
+
+
+@pytest.mark.anyio
+async def test_validate_accepts_abbreviated_and_slightly_misspelled_fields_above_the_threshold():
+    # Arrange
+    company = _company(street="AV PAULISTA", district="BELA VSTA")
+    use_case = ValidateCompanyAddressUseCase(FakeCnpjProvider(company), FakeCepProvider(PAULISTA), min_similarity=0.9)
+    # Act
+    result = await use_case.validate(AddressValidationInput(cnpj=CNPJ, cep=CEP))
+    # Assert
+    assert result.matches is True
+    assert result.similarity["street"] == 1.0
+    assert 0.9 < result.similarity["district"] < 1.0
+
+
+@pytest.mark.anyio
+async def test_validate_runs_both_lookups_concurrently():
+    # Arrange
+    use_case = ValidateCompanyAddressUseCase(
+        FakeCnpjProvider(_company(), delay=0.2), FakeCepProvider(PAULISTA, delay=0.2)
+    )
+    loop = asyncio.get_running_loop()
+    # Act
+    started = loop.time()
+    await use_case.validate(AddressValidationInput(cnpj=CNPJ, cep=CEP))
+    elapsed = loop.time() - started
+    # Assert
+    assert elapsed < 0.35
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("company", "cep_address", "error"),
+    [
+        (None, PAULISTA, CompanyNotFoundError),
+        (_company(), None, CepNotFoundError),
+        (ProviderUnavailableError("cnpj", "timeout"), None, ProviderUnavailableError),
+        (_company(), ProviderUnavailableError("cep", "circuit open"), ProviderUnavailableError),
+    ],
+)
+async def test_validate_raises_problem_when_a_lookup_finds_nothing_or_fails(company, cep_address, error):
+    # Arrange
+    cep_provider = FakeCepProvider(cep_address, delay=0.01)
+    use_case = ValidateCompanyAddressUseCase(FakeCnpjProvider(company), cep_provider)
+    # Act / Assert
+    with pytest.raises(error):
+        await use_case.validate(AddressValidationInput(cnpj=CNPJ, cep=CEP))
+    assert cep_provider.calls == [CEP]
+
+
+@pytest.mark.parametrize(
+    ("cnpj", "cep"),
+    [
+        ("11222333000182", CEP),
+        ("1122233300018", CEP),
+        ("00000000000000", CEP),
+        (CNPJ, "0131010"),
+    ],
+)
+def test_validation_input_rejects_bad_cnpj_or_cep(cnpj, cep):
+    # Act / Assert
+    with pytest.raises(ValidationError):
+        AddressValidationInput(cnpj=cnpj, cep=cep)